@@ -0,0 +1,107 @@
+"""
+Benchmark: careers pages parsed and analyzed per second by ParsePool,
+inline (0 workers) versus 1, 2, 4, ... worker processes.
+
+Pages come from a corpus directory of saved ATS pages (*.html, e.g.
+saved from Greenhouse, Lever or Workday boards with the browser), or
+are generated when no corpus is given. Every page is parsed with the
+configured HTML_EXTRACTOR and analyzed against SIGNAL_KEYWORDS, and all
+pages are submitted at once, as the pipeline does with fetches in
+flight. Pool startup is excluded; a warm-up pass spawns the workers.
+
+Usage:
+    python benchmarks/bench_parse_pool.py [--corpus pages/] [--pages 200] [--max-workers 8]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from signalsdr.config import HTML_EXTRACTOR  # noqa: E402
+from signalsdr.parsepool import ParsePool, parse_careers_page  # noqa: E402
+from signalsdr.scraper import RawPage  # noqa: E402
+
+
+def make_ats_page(n_jobs: int, rng: random.Random) -> str:
+    """Synthetic ATS job board: script-heavy chrome around a list of openings."""
+    titles = [
+        "Software Engineer, Backend", "Customer Success Manager", "Senior Technical Writer",
+        "Warehouse Associate", "Junior Data Analyst", "Field Service Technician",
+        "VP of Engineering", "Director, Service Information", "Head of AI Platform",
+    ]
+    places = ["Remote (US)", "Austin, TX", "Detroit, MI", "Dearborn, MI", "Chicago, IL"]
+    jobs = "\n".join(
+        f'<div class="opening"><a href="/jobs/{i}" data-id="{i}">{rng.choice(titles)}</a>'
+        f'<span class="location">{rng.choice(places)}</span>'
+        f'<span class="meta">Full-time · Posted {rng.randint(1, 30)} days ago</span></div>'
+        for i in range(n_jobs)
+    )
+    script = "var board = {" + ",".join(f'"k{i}": "{"x" * 40}"' for i in range(300)) + "};"
+    return (
+        f"<html><head><title>Careers</title><script>{script}</script>"
+        f"<style>.opening {{ margin: 0 }}</style></head><body>"
+        f"<nav>{'<a href=/>Home</a>' * 30}</nav><main><h1>Open positions</h1>{jobs}</main>"
+        f"<footer>{'<p>Privacy · Terms</p>' * 20}</footer></body></html>"
+    )
+
+
+def load_corpus(corpus: Path | None, pages: int) -> list[RawPage]:
+    if corpus is not None:
+        paths = sorted(corpus.glob("*.html"))
+        if not paths:
+            sys.exit(f"No *.html pages in {corpus}")
+        return [RawPage(p.as_uri(), p.read_bytes(), None) for p in paths]
+    rng = random.Random(7)
+    html = (make_ats_page(rng.randint(50, 400), rng) for _ in range(pages))
+    return [RawPage(f"https://example{i}.com/careers", h.encode(), "utf-8")
+            for i, h in enumerate(html)]
+
+
+async def run(pool: ParsePool, pages: list[RawPage]) -> list:
+    return await asyncio.gather(*(
+        pool.run(parse_careers_page, page, "Example", None) for page in pages
+    ))
+
+
+async def bench(workers: int, pages: list[RawPage], repeat: int) -> tuple[float, int]:
+    with ParsePool(workers) as pool:
+        results = await run(pool, pages)  # warm-up: spawns and imports in every worker
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await run(pool, pages)
+            best = min(best, time.perf_counter() - start)
+    return best, sum(len(analysis.signals) for _, analysis in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", type=Path, help="Directory of saved *.html careers pages")
+    parser.add_argument("--pages", type=int, default=200, help="Generated pages (without --corpus)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus, args.pages)
+    size = sum(len(p.body) for p in pages)
+    print(f"pages: {len(pages)} ({size / 1e6:.1f} MB)  extractor: {HTML_EXTRACTOR}  "
+          f"cores: {os.cpu_count()}")
+
+    counts = [0] + [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= args.max_workers]
+    baseline = None
+    for workers in counts:
+        elapsed, signals = asyncio.run(bench(workers, pages, args.repeat))
+        baseline = baseline or elapsed
+        label = "inline" if workers == 0 else f"{workers} worker{'s' if workers > 1 else ''}"
+        print(f"{label:>10}: {len(pages) / elapsed:8,.1f} pages/sec  ({baseline / elapsed:.2f}x)  "
+              f"signals: {signals}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: Brave calls and recall of combined OR-queries versus one
+query per category.
+
+Runs both query modes against the live Brave API for each company and
+reports the number of API calls, the signals found, and how many of the
+per-category (source URL, category) pairs the combined mode recovered.
+The search cache is disabled so every query really goes out.
+
+Requires BRAVE_API_KEY.
+
+Usage:
+    python benchmarks/bench_prospect_queries.py [--companies Ford,Deere,Caterpillar]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from signalsdr.prospector import plan_queries, prospect_company  # noqa: E402
+from signalsdr.searchcache import configure_search_cache  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--companies", default="Ford,Deere,Caterpillar",
+                        help="Comma-separated company names")
+    args = parser.parse_args()
+
+    api_key = os.environ.get("BRAVE_API_KEY")
+    if not api_key:
+        sys.exit("BRAVE_API_KEY not set")
+    configure_search_cache(None)
+
+    totals = {"per_category": [0, 0], "combined": [0, 0]}
+    recovered = baseline = 0
+    for company in [c.strip() for c in args.companies.split(",") if c.strip()]:
+        domain = f"{company.lower()}.com"
+        found = {}
+        for mode in totals:
+            result = prospect_company(company, domain, api_key=api_key, mode=mode)
+            found[mode] = {(s.source_url, s.category) for s in result.signals}
+            calls = len(plan_queries(company, mode=mode))
+            totals[mode][0] += calls
+            totals[mode][1] += len(result.signals)
+            print(f"{company:<14} {mode:<13} {calls} calls  {len(result.signals):>3} signals")
+
+        urls = {url for url, _ in found["combined"]}
+        same_url = {pair for pair in found["per_category"] if pair[0] in urls}
+        recovered += len(same_url & found["combined"])
+        baseline += len(found["per_category"])
+        print(f"{'':<14} recall: {len(same_url)}/{len(found['per_category'])} URLs, "
+              f"{len(same_url & found['combined'])} with the same category")
+
+    print()
+    for mode, (calls, signals) in totals.items():
+        print(f"{mode:<13} {calls:>4} calls  {signals:>4} signals")
+    if baseline:
+        print(f"Combined mode kept {recovered}/{baseline} "
+              f"({recovered / baseline:.0%}) per-category (URL, category) pairs")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,90 +4,206 @@ from __future__ import annotations
 SignalSDR Main Loop.
 
 The orchestration script that ties together the full pipeline:
-  1. Read targets from CSV
+  1. Stream targets from CSV or JSONL
   2. Check state (skip recently scanned companies)
-  3. Scrape careers pages (Feature A — hiring)
+  3. Scrape careers pages concurrently (Feature A — hiring)
   4. Analyze for hiring signals (Feature A)
   5. Prospect via Brave Search (Feature D — prospect intelligence)
   6. Generate email drafts via LLM (Feature B)
   7. Save to CSV + optional Slack (Feature C)
-  8. Update state in db.json
+  8. Update state (SQLite, or legacy db.json)
+
+Steps 3-5 are the hiring and prospect sources, which run concurrently
+and stream their companies into shared triage, drafting and output
+stages (signalsdr.pipeline).
 
 Usage:
     python main.py                          # Run hiring + prospect (if BRAVE_API_KEY set)
     python main.py --targets my_targets.csv # Custom target file
+    python main.py --targets leads.jsonl.gz # JSONL and gzip'd target lists work too
     python main.py --model anthropic/claude-sonnet-4-5  # Use Claude
     python main.py --dry-run                # Scan only, no LLM drafts
     python main.py --prospect-only          # Prospect pipeline only (skip hiring scan)
     python main.py --no-prospect            # Hiring pipeline only (skip prospect)
+    python main.py --no-triage              # Draft every signal (skip batched relevance check)
+    python main.py --resume                 # Finish an interrupted run without redoing its work
+    python main.py --parse-workers 4        # Parse/analyze fetched pages in 4 processes
+    python main.py --shard 2/4              # Run one of 4 slices of the targets (one per process/host)
+    python main.py --merge-shards 4         # Combine the 4 shards' drafts and state
+    python main.py --migrate-from data/db.json  # Import legacy db.json into --db and exit
 """
 
 import argparse
 import asyncio
-import csv
 import os
-import time
+from collections.abc import Awaitable, Iterable
+from dataclasses import asdict
+from functools import partial
 from pathlib import Path
 
+import httpx
 from dotenv import load_dotenv
 
-from signalsdr.analyzer import analyze_text
-from signalsdr.config import MAX_PROSPECT_SIGNALS_PER_COMPANY, SCRAPE_DELAY_SECONDS
-from signalsdr.drafter import PROSPECT_SYSTEM_PROMPT, generate_draft
-from signalsdr.output import append_to_csv, append_to_markdown, send_email_report, send_slack_notification
-from signalsdr.prospector import prospect_company, scrape_news_page
-from signalsdr.scraper import fetch_page
-from signalsdr.state import record_scan, should_scan
-
-
-def load_targets(csv_path: str | Path) -> list[dict]:
-    """Load target companies from CSV file."""
-    targets = []
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            target = {
-                "company": row["company"].strip(),
-                "domain": row["domain"].strip(),
-                "careers_url": (row.get("careers_url") or "").strip(),
-            }
-            # Optional news/blog URL for direct scraping
-            news_url = (row.get("news_url") or "").strip()
-            if news_url:
-                target["news_url"] = news_url
-            targets.append(target)
-    return targets
+from signalsdr import ratelimit
+from signalsdr.analyzer import AnalysisResult
+from signalsdr.config import JOURNAL_DIR, MAX_PROSPECT_SIGNALS_PER_COMPANY, PARSE_WORKERS
+from signalsdr.dedup import dedup_signals
+from signalsdr.draftcache import DraftCache
+from signalsdr.drafter import DraftPool, DraftRequest, TriageItem
+from signalsdr.httpcache import CacheEntry, HttpCache
+from signalsdr.journal import RunJournal
+from signalsdr.output import OutputSink, merge_draft_files, send_email_report
+from signalsdr.parsepool import ParsePool
+from signalsdr.pipeline import Candidate, prefetch, replay, run_stages
+from signalsdr.prospector import (
+    ProspectSignal,
+    brave_client,
+    prospect_company_async,
+)
+from signalsdr.scraper import AsyncFetcher, ScraperResult
+from signalsdr.searchcache import get_search_cache
+from signalsdr.shard import Shard
+from signalsdr.state import (
+    DEFAULT_DB_PATH,
+    LEGACY_DB_PATH,
+    ScanStream,
+    get_line_fingerprints,
+    merge_state,
+    migrate_json_to_sqlite,
+    normalize_state_domains,
+    record_scan,
+    save_line_fingerprints,
+)
+from signalsdr.targets import TargetSource
+
+
+def load_targets(path: str | Path) -> list[dict]:
+    """Load all target companies from a CSV or JSONL file (run_pipeline streams them instead)."""
+    return list(TargetSource(path))
 
 
 async def run_hiring_pipeline(
-    targets: list[dict],
+    targets: Iterable[dict],
+    db: Path,
+    output_path: str,
+    model: str,
+    dry_run: bool,
+    pool: DraftPool | None = None,
+    triage: bool = True,
+    sink: OutputSink | None = None,
+) -> dict:
+    """Run the hiring signal pipeline (scrape careers pages + analyze) on its own."""
+    hiring, _ = await run_sources(
+        targets, db, output_path, model, dry_run, pool, triage, sink, hiring=True, prospect=False
+    )
+    return hiring
+
+
+async def run_prospect_pipeline(
+    targets: Iterable[dict],
     db: Path,
     output_path: str,
     model: str,
     dry_run: bool,
+    pool: DraftPool | None = None,
+    triage: bool = True,
+    sink: OutputSink | None = None,
 ) -> dict:
-    """Run the hiring signal pipeline (scrape careers pages + analyze)."""
-    stats = {"scanned": 0, "skipped": 0, "signals": 0, "drafts": 0, "filtered": 0, "errors": 0}
+    """Run the prospect intelligence pipeline (Brave Search + news page scraping) on its own."""
+    _, prospect = await run_sources(
+        targets, db, output_path, model, dry_run, pool, triage, sink, hiring=False, prospect=True
+    )
+    return prospect
 
-    print(f"\n=== Hiring Pipeline: {len(targets)} targets ===\n")
 
-    for i, target in enumerate(targets):
+async def run_sources(
+    targets: Iterable[dict],
+    db: Path,
+    output_path: str,
+    model: str,
+    dry_run: bool,
+    pool: DraftPool | None = None,
+    triage: bool = True,
+    sink: OutputSink | None = None,
+    hiring: bool = True,
+    prospect: bool = True,
+    journal: RunJournal | None = None,
+    parse_workers: int | None = PARSE_WORKERS,
+) -> tuple[dict | None, dict | None]:
+    """
+    Run the hiring and/or prospect sources concurrently into shared
+    triage, drafting and output stages (see signalsdr.pipeline),
+    recording progress in journal if given. Fetched pages are parsed
+    and analyzed by parse_workers processes (see signalsdr.parsepool).
+
+    Returns:
+        (hiring stats, prospect stats); None for a source that didn't run.
+    """
+    if sink is None:
+        async with OutputSink(output_path) as sink:
+            return await run_sources(
+                targets, db, output_path, model, dry_run, pool, triage, sink, hiring, prospect, journal,
+                parse_workers,
+            )
+
+    # Dry runs must not mark pages as seen, or the next real run would skip them
+    cache = None if dry_run else HttpCache()
+    pool = pool or DraftPool()
+
+    # One fetcher for both sources, so a careers page and a newsroom on
+    # the same host still share its politeness delay
+    with ParsePool(parse_workers) as parser:
+        async with AsyncFetcher(cache=cache) as fetcher, brave_client() as brave:
+            sources = []
+            if hiring:
+                sources.append(partial(hiring_source, targets, db, dry_run, fetcher, parser, cache, journal))
+            if prospect:
+                sources.append(partial(
+                    prospect_source, targets, db, dry_run, fetcher, parser, cache, brave, journal
+                ))
+            stats = iter(await run_stages(sources, pool, sink, model, triage, journal=journal))
+
+    return (next(stats) if hiring else None), (next(stats) if prospect else None)
+
+
+async def hiring_source(
+    targets: Iterable[dict],
+    db: Path,
+    dry_run: bool,
+    fetcher: AsyncFetcher,
+    parser: ParsePool,
+    cache: HttpCache | None,
+    journal: RunJournal | None,
+    outbox: asyncio.Queue,
+) -> dict:
+    """Plan, fetch and analyze careers pages; put each company with new signals on outbox."""
+    stats = {"scanned": 0, "skipped": 0, "unchanged": 0, "signals": 0, "drafts": 0,
+             "filtered": 0, "errors": 0}
+    build = partial(hiring_candidate, stats=stats, db=db, cache=cache)
+
+    print("\n=== Hiring Pipeline ===")
+    # Companies an interrupted run already analyzed pick up where they stopped
+    resumed = await replay(journal, "hiring", build, outbox)
+
+    # Targets are planned as they are read, so the first fetch starts at once
+    plan = ScanStream(targets, scan_type="hiring", db_path=db, exclude=resumed)
+
+    def scan(target: dict) -> Awaitable[tuple[ScraperResult, AnalysisResult | None]]:
+        # Only job lines that appeared since the last scan become signals
+        seen_lines = get_line_fingerprints(target["domain"], db)
+        return parser.careers(fetcher, target["careers_url"], target["company"], seen_lines)
+
+    # Fetches and analysis run ahead of this loop; AsyncFetcher bounds
+    # concurrency and spaces requests per host, the parser keeps parsing
+    # off the event loop, and results arrive in target order.
+    i = 0
+    async for target, (result, analysis) in prefetch(plan, scan):
+        i += 1
         company = target["company"]
         domain = target["domain"]
         url = target["careers_url"]
 
-        if not url:
-            print(f"[{i+1}/{len(targets)}] SKIP {company} (no careers_url)")
-            stats["skipped"] += 1
-            continue
-
-        if not should_scan(domain, db, scan_type="hiring"):
-            print(f"[{i+1}/{len(targets)}] SKIP {company} (scanned within 24h)")
-            stats["skipped"] += 1
-            continue
-
-        print(f"[{i+1}/{len(targets)}] SCAN {company} ({url})")
-        result = fetch_page(url)
+        print(f"[{i}] SCAN {company} ({url})")
 
         if not result.success:
             print(f"  ERROR: {result.error}")
@@ -97,218 +213,322 @@ async def run_hiring_pipeline(
             continue
 
         stats["scanned"] += 1
+
+        # Same text as last run: its signals were already analyzed and drafted
+        if result.unchanged:
+            how = "304 Not Modified" if result.not_modified else "same content hash"
+            print(f"  Unchanged since last scan ({how}), skipping analysis")
+            stats["unchanged"] += 1
+            record_scan(domain, company, [], db, scan_type="hiring")
+            cache.put(result.cache_entry)
+            continue
+
         print(f"  Fetched {len(result.text)} chars from '{result.title}'")
 
-        analysis = analyze_text(result.text, url, company)
+        if analysis.repeated:
+            print(f"  {analysis.repeated} signal line(s) unchanged since last scan")
 
         if not analysis.has_signals:
-            print("  No signals found")
+            print("  No new signals found" if analysis.repeated else "  No signals found")
             if not dry_run:
                 record_scan(domain, company, [], db, scan_type="hiring")
-        else:
-            print(f"  {len(analysis.signals)} signal(s) detected:")
-            seen_keywords = set()
-            unique_signals = []
-            for s in analysis.signals:
-                if s.keyword not in seen_keywords:
-                    seen_keywords.add(s.keyword)
-                    unique_signals.append(s)
-                    print(f"    [{s.keyword}] {s.matched_text[:80]}")
+                save_line_fingerprints(domain, analysis.fingerprints, db)
+                cache.put(result.cache_entry)
+            continue
 
-            stats["signals"] += len(unique_signals)
+        print(f"  {len(analysis.signals)} signal(s) detected:")
+        seen_keywords = set()
+        unique_signals = []
+        for s in analysis.signals:
+            if s.keyword not in seen_keywords:
+                seen_keywords.add(s.keyword)
+                unique_signals.append(s)
+                print(f"    [{s.keyword}] {s.matched_text[:80]}")
 
-            if not dry_run:
-                for signal in unique_signals:
-                    draft = await generate_draft(
-                        company=company,
-                        role=signal.matched_text[:100],
-                        model=model,
-                    )
-
-                    if draft.is_valid:
-                        print(f"    Draft: \"{draft.subject_line}\"")
-                        stats["drafts"] += 1
-                        append_to_csv(draft, url, output_path)
-                        append_to_markdown(draft, url)
-                        send_slack_notification(draft)
-                    elif draft.success and not draft.is_valid:
-                        print(f"    Filtered by LLM (not a real job listing): {signal.keyword}")
-                        stats["filtered"] += 1
-                    else:
-                        print(f"    Draft failed: {draft.error}")
-                        stats["errors"] += 1
+        stats["signals"] += len(unique_signals)
 
-            if not dry_run:
-                signal_dicts = [
-                    {"keyword": s.keyword, "matched_text": s.matched_text}
-                    for s in unique_signals
-                ]
-                record_scan(domain, company, signal_dicts, db, scan_type="hiring")
-
-        if i < len(targets) - 1:
-            time.sleep(SCRAPE_DELAY_SECONDS)
+        if dry_run:
+            continue
 
+        await outbox.put(build({
+            "company": company,
+            "domain": domain,
+            "url": url,
+            "signals": [
+                {"keyword": s.keyword, "matched_text": s.matched_text}
+                for s in unique_signals
+            ],
+            "fingerprints": sorted(analysis.fingerprints),
+            "cache_entry": asdict(result.cache_entry) if result.cache_entry else None,
+        }))
+
+    stats["skipped"] = sum(plan.skipped.values())
+    print(f"  Hiring plan: {plan.summary()}")
     return stats
 
 
-async def run_prospect_pipeline(
-    targets: list[dict],
+def hiring_candidate(payload: dict, stats: dict, db: Path, cache: HttpCache | None) -> Candidate:
+    """A careers page's new signals, from the JSON its analysis is journaled as."""
+    company, domain, url = payload["company"], payload["domain"], payload["url"]
+    signals = payload["signals"]
+    candidate = Candidate(
+        kind="hiring",
+        company=company,
+        domain=domain,
+        items=[TriageItem(company, s["matched_text"]) for s in signals],
+        requests=[DraftRequest(role=s["matched_text"][:100]) for s in signals],
+        urls=[url] * len(signals),
+        labels=[s["keyword"] for s in signals],
+        rejected="not a real job listing",
+        stats=stats,
+        payload=payload,
+    )
+    candidate.commit(record_scan, domain, company, signals, db, scan_type="hiring")
+    # Lines only count as seen once they are drafted (or filtered), so a
+    # failed draft brings its signals back on the next scan
+    candidate.commit_if_drafted(save_line_fingerprints, domain, set(payload["fingerprints"]), db)
+    # A failed draft leaves the old entry, so the next run analyzes the page again
+    if payload["cache_entry"]:
+        candidate.commit_if_drafted(cache.put, CacheEntry(**payload["cache_entry"]))
+    return candidate
+
+
+async def prospect_source(
+    targets: Iterable[dict],
     db: Path,
-    output_path: str,
-    model: str,
     dry_run: bool,
+    fetcher: AsyncFetcher,
+    parser: ParsePool,
+    cache: HttpCache | None,
+    brave: httpx.AsyncClient,
+    journal: RunJournal | None,
+    outbox: asyncio.Queue,
 ) -> dict:
-    """Run the prospect intelligence pipeline (Brave Search + news page scraping)."""
-    stats = {"scanned": 0, "skipped": 0, "signals": 0, "drafts": 0, "filtered": 0, "errors": 0}
+    """Plan, search/fetch and analyze prospect sources; put each company with signals on outbox."""
+    stats = {"scanned": 0, "skipped": 0, "signals": 0, "duplicates": 0, "drafts": 0,
+             "filtered": 0, "errors": 0}
     has_brave = bool(os.environ.get("BRAVE_API_KEY"))
-
-    print(f"\n=== Prospect Pipeline: {len(targets)} targets ===")
-    print(f"  Sources: {'Brave Search + ' if has_brave else ''}News page scraping\n")
-
-    for i, target in enumerate(targets):
+    build = partial(prospect_candidate, stats=stats, db=db, cache=cache)
+
+    print("\n=== Prospect Pipeline ===")
+    print(f"  Sources: {'Brave Search + ' if has_brave else ''}News page scraping")
+    resumed = await replay(journal, "prospect", build, outbox)
+
+    # Without Brave only targets with a news_url can be prospected; the
+    # rest are skipped unrecorded, to be scanned by a run that has the key
+    if not has_brave:
+        print("  No BRAVE_API_KEY: targets without a news_url are skipped")
+    plan = ScanStream(targets, scan_type="prospect", db_path=db, exclude=resumed,
+                      required=None if has_brave else "news_url")
+
+    async def search(target: dict) -> tuple:
+        # Brave queries and the news fetch run side by side; the Brave rate
+        # limit and AsyncFetcher pace them. A missing source yields None.
+        company, domain = target["company"], target["domain"]
+        news_url = target.get("news_url")
+        return tuple(await asyncio.gather(
+            prospect_company_async(company, domain, client=brave) if has_brave else asyncio.sleep(0),
+            parser.news(fetcher, company, domain, news_url) if news_url else asyncio.sleep(0),
+        ))
+
+    i = 0
+    async for target, (brave_result, news_result) in prefetch(plan, search):
+        i += 1
         company = target["company"]
         domain = target["domain"]
         news_url = target.get("news_url")
 
-        if not should_scan(domain, db, scan_type="prospect"):
-            print(f"[{i+1}/{len(targets)}] SKIP {company} (prospect-scanned within 24h)")
-            stats["skipped"] += 1
-            continue
-
-        print(f"[{i+1}/{len(targets)}] PROSPECT {company} ({domain})")
+        print(f"[{i}] PROSPECT {company} ({domain})")
 
         # Collect signals from all sources
         all_signals = []
+        news_entry = None
 
         # Source 1: Brave Search (if API key available)
         if has_brave:
-            brave_result = prospect_company(company, domain)
             if brave_result.success:
                 all_signals.extend(brave_result.signals)
-                print(f"  Brave Search: {len(brave_result.signals)} result(s)")
+                slowest = max(brave_result.timings.values(), default=0.0)
+                print(f"  Brave Search: {len(brave_result.signals)} result(s) from "
+                      f"{len(brave_result.timings)} queries (slowest {slowest:.1f}s)")
             else:
                 print(f"  Brave Search error: {brave_result.error}")
 
         # Source 2: News page scraping (if news_url configured)
         if news_url:
-            news_result = scrape_news_page(company, domain, news_url)
-            if news_result.success:
+            news_entry = news_result.cache_entry
+            if news_result.unchanged:
+                print(f"  News page: unchanged since last scan ({news_url})")
+            elif news_result.success:
                 all_signals.extend(news_result.signals)
                 print(f"  News page: {len(news_result.signals)} signal(s) from {news_url}")
             else:
                 print(f"  News page error: {news_result.error}")
 
-        if not has_brave and not news_url:
-            print("  No sources available (no BRAVE_API_KEY and no news_url)")
-            stats["errors"] += 1
-            if not dry_run:
-                record_scan(domain, company, [], db, scan_type="prospect")
-            continue
-
         stats["scanned"] += 1
 
         if not all_signals:
             print("  No prospect signals found")
             if not dry_run:
                 record_scan(domain, company, [], db, scan_type="prospect")
-        else:
-            # Deduplicate by headline
-            seen = set()
-            deduped = []
-            for s in all_signals:
-                if s.headline not in seen:
-                    seen.add(s.headline)
-                    deduped.append(s)
-
-            # Cap signals per company with category diversity:
-            # take first signal from each category, then fill remaining slots
-            if len(deduped) > MAX_PROSPECT_SIGNALS_PER_COMPANY:
-                seen_cats: set[str] = set()
-                diverse: list = []
-                remaining: list = []
-                for s in deduped:
-                    if s.category not in seen_cats:
-                        seen_cats.add(s.category)
-                        diverse.append(s)
-                    else:
-                        remaining.append(s)
-                unique = (diverse + remaining)[:MAX_PROSPECT_SIGNALS_PER_COMPANY]
-                print(f"  {len(deduped)} signals found, capped to {len(unique)} (category-diverse):")
-            else:
-                unique = deduped
-                print(f"  {len(unique)} unique prospect signal(s):")
+                cache.put(news_entry)
+            continue
 
-            for s in unique:
-                print(f"    [{s.category}] {s.headline[:80]}")
+        # Collapse near-duplicates (one story syndicated across sites,
+        # or found by both Brave and the news page) to the best source
+        deduped = dedup_signals(all_signals, domain)
+        if len(deduped) < len(all_signals):
+            print(f"  {len(all_signals) - len(deduped)} near-duplicate signal(s) merged")
+            stats["duplicates"] += len(all_signals) - len(deduped)
+
+        # Cap signals per company with category diversity:
+        # take first signal from each category, then fill remaining slots
+        if len(deduped) > MAX_PROSPECT_SIGNALS_PER_COMPANY:
+            seen_cats: set[str] = set()
+            diverse: list = []
+            remaining: list = []
+            for s in deduped:
+                if s.category not in seen_cats:
+                    seen_cats.add(s.category)
+                    diverse.append(s)
+                else:
+                    remaining.append(s)
+            unique = (diverse + remaining)[:MAX_PROSPECT_SIGNALS_PER_COMPANY]
+            print(f"  {len(deduped)} signals found, capped to {len(unique)} (category-diverse):")
+        else:
+            unique = deduped
+            print(f"  {len(unique)} unique prospect signal(s):")
 
-            stats["signals"] += len(unique)
+        for s in unique:
+            print(f"    [{s.category}] {s.headline[:80]}")
 
-            if not dry_run:
-                for signal in unique:
-                    prompt = PROSPECT_SYSTEM_PROMPT.format(
-                        category=signal.category,
-                        role=f"{signal.headline}: {signal.snippet[:150]}",
-                        company=company,
-                    )
-
-                    draft = await generate_draft(
-                        company=company,
-                        role=signal.headline[:100],
-                        model=model,
-                        system_prompt=prompt,
-                        signal_type=f"prospect_{signal.category}",
-                    )
-
-                    if draft.is_valid:
-                        print(f"    Draft: \"{draft.subject_line}\"")
-                        stats["drafts"] += 1
-                        append_to_csv(draft, signal.source_url, output_path)
-                        append_to_markdown(draft, signal.source_url)
-                        send_slack_notification(draft)
-                    elif draft.success and not draft.is_valid:
-                        print(f"    Filtered by LLM (irrelevant): {signal.headline[:60]}")
-                        stats["filtered"] += 1
-                    else:
-                        print(f"    Draft failed: {draft.error}")
-                        stats["errors"] += 1
+        stats["signals"] += len(unique)
 
-            if not dry_run:
-                signal_dicts = [
-                    {"category": s.category, "headline": s.headline, "snippet": s.snippet}
-                    for s in unique
-                ]
-                record_scan(domain, company, signal_dicts, db, scan_type="prospect")
+        if dry_run:
+            continue
 
-        if i < len(targets) - 1:
-            time.sleep(SCRAPE_DELAY_SECONDS)
+        await outbox.put(build({
+            "company": company,
+            "domain": domain,
+            "signals": [asdict(s) for s in unique],
+            "cache_entry": asdict(news_entry) if news_entry else None,
+        }))
 
+    stats["skipped"] = sum(plan.skipped.values())
+    print(f"  Prospect plan: {plan.summary()}")
     return stats
 
 
+def prospect_candidate(payload: dict, stats: dict, db: Path, cache: HttpCache | None) -> Candidate:
+    """A company's prospect signals, from the JSON their analysis is journaled as."""
+    company, domain = payload["company"], payload["domain"]
+    signals = [ProspectSignal(**s) for s in payload["signals"]]
+    candidate = Candidate(
+        kind="prospect",
+        company=company,
+        domain=domain,
+        items=[
+            TriageItem(company, f"{s.headline}: {s.snippet[:150]}", s.category)
+            for s in signals
+        ],
+        requests=[
+            DraftRequest(
+                role=s.headline[:100],
+                trigger=f"{s.headline}: {s.snippet[:150]}",
+                category=s.category,
+                signal_type=f"prospect_{s.category}",
+            )
+            for s in signals
+        ],
+        urls=[s.source_url for s in signals],
+        labels=[s.headline[:60] for s in signals],
+        rejected="irrelevant",
+        stats=stats,
+        payload=payload,
+    )
+    signal_dicts = [
+        {"category": s.category, "headline": s.headline, "snippet": s.snippet}
+        for s in signals
+    ]
+    candidate.commit(record_scan, domain, company, signal_dicts, db, scan_type="prospect")
+    # A failed draft leaves the old entry, so the next run analyzes the page again
+    if payload["cache_entry"]:
+        candidate.commit_if_drafted(cache.put, CacheEntry(**payload["cache_entry"]))
+    return candidate
+
+
 async def run_pipeline(
     targets_path: str = "targets.csv",
     output_path: str = "drafts_output.csv",
-    db_path: str = "data/db.json",
+    db_path: str = str(DEFAULT_DB_PATH),
     model: str = "openai/gpt-4o",
     dry_run: bool = False,
     send_email: bool = True,
     run_hiring: bool = True,
     run_prospect: bool = True,
+    triage: bool = True,
+    resume: bool = False,
+    shard: Shard | None = None,
+    parse_workers: int | None = PARSE_WORKERS,
 ) -> dict:
     """
     Run the full SignalSDR pipeline (hiring + prospect).
 
+    With resume, the newest interrupted run's journal is picked up:
+    companies it had already fetched, drafted or written are not done
+    again (see signalsdr.journal).
+
+    With shard, only that slice of the targets is run, against the
+    shard's own output, state and journal files (see signalsdr.shard);
+    merge_shards() combines them afterwards.
+
+    parse_workers processes parse and analyze the fetched pages (0: in
+    the event loop, None: one per core).
+
     Returns a combined summary dict.
     """
-    targets = load_targets(targets_path)
+    # Streamed (once per source), never loaded whole; see signalsdr.targets
+    targets = TargetSource(targets_path, keep=shard.contains if shard else None)
     db = Path(db_path)
+    md_path = Path("drafts_output.md")
+    journal_dir = Path(JOURNAL_DIR)
+
+    # First run on the SQLite store: carry over history from the old db.json
+    if db == DEFAULT_DB_PATH and not db.exists() and LEGACY_DB_PATH.exists():
+        n = migrate_json_to_sqlite(LEGACY_DB_PATH, db)
+        print(f"Migrated {n} companies from {LEGACY_DB_PATH} to {db}")
+    # State written before targets were normalized is keyed "www.Acme.com"
+    if db.exists() and (n := normalize_state_domains(db)):
+        print(f"Re-keyed {n} companies in {db} to normalized domains")
+
+    if shard is not None:
+        print(f"Shard {shard}: targets whose domain hashes to slice {shard.index} of {shard.count}")
+        # Bring over what the main state knows (e.g. cooldowns from before sharding)
+        merge_state([db], shard.path(db), keep=shard.contains)
+        db, md_path = shard.path(db), shard.path(md_path)
+        normalize_state_domains(db)
+        output_path = str(shard.path(output_path))
+        journal_dir = journal_dir / shard.suffix
+        # The shards share the API keys and the scraped hosts
+        for name, (rate, burst) in shard.api_limits().items():
+            ratelimit.configure(f"api:{name}", rate, burst)
+        ratelimit.configure_hosts(*shard.host_limit())
+
+    # Every stage a company completes is journaled; dry runs complete nothing
+    journal = None
+    if not dry_run:
+        journal = RunJournal.latest_unfinished(journal_dir) if resume else None
+        if resume:
+            print(f"Resuming interrupted run: {journal.path}" if journal
+                  else "No interrupted run to resume, starting a new one")
+        journal = journal or RunJournal.start(journal_dir, targets=str(targets_path), model=model)
 
     # Reset markdown output so each run's email only contains fresh drafts
-    md_path = Path("drafts_output.md")
-    if md_path.exists():
+    # (a resumed run keeps the drafts written before it was interrupted)
+    if md_path.exists() and not (journal and journal.entries):
         md_path.unlink()
 
-    print(f"SignalSDR: Processing {len(targets)} targets")
+    print(f"SignalSDR: Processing targets from {targets_path}")
     print(f"  Model: {model}")
     print(f"  Output: {output_path}")
     print(f"  Dry run: {dry_run}")
@@ -316,54 +536,82 @@ async def run_pipeline(
     print(f"  Prospect: {'yes' if run_prospect else 'skip'}")
 
     combined = {
-        "scanned": 0, "skipped": 0, "signals": 0, "drafts": 0,
+        "scanned": 0, "skipped": 0, "unchanged": 0, "signals": 0, "drafts": 0,
         "filtered": 0, "errors": 0,
         "prospect_scanned": 0, "prospect_skipped": 0,
-        "prospect_signals": 0, "prospect_drafts": 0,
+        "prospect_signals": 0, "prospect_duplicates": 0, "prospect_drafts": 0,
         "prospect_filtered": 0, "prospect_errors": 0,
+        "draft_cache_hits": 0, "draft_cache_misses": 0, "draft_retries": 0,
+        "prompt_tokens": 0, "cached_prompt_tokens": 0,
     }
 
-    # --- Hiring pipeline ---
-    if run_hiring:
-        h = await run_hiring_pipeline(targets, db, output_path, model, dry_run)
-        combined["scanned"] = h["scanned"]
-        combined["skipped"] = h["skipped"]
-        combined["signals"] = h["signals"]
-        combined["drafts"] = h["drafts"]
-        combined["filtered"] = h["filtered"]
-        combined["errors"] = h["errors"]
-
-    # --- Prospect pipeline ---
-    if run_prospect:
-        # Runs with Brave Search, news page scraping, or both
-        has_brave = bool(os.environ.get("BRAVE_API_KEY"))
-        has_news_urls = any(t.get("news_url") for t in targets)
-        if not has_brave and not has_news_urls:
-            print("\n  Prospect pipeline skipped (no BRAVE_API_KEY and no news_url in targets)")
-        else:
-            p = await run_prospect_pipeline(targets, db, output_path, model, dry_run)
-            combined["prospect_scanned"] = p["scanned"]
-            combined["prospect_skipped"] = p["skipped"]
-            combined["prospect_signals"] = p["signals"]
-            combined["prospect_drafts"] = p["drafts"]
-            combined["prospect_filtered"] = p["filtered"]
-            combined["prospect_errors"] = p["errors"]
+    # One pool for both sources so per-provider limits cover all drafts;
+    # identical prompts from earlier runs are answered by the draft cache
+    draft_cache = None if dry_run else DraftCache()
+    pool = DraftPool(limits=shard.draft_limits() if shard else None, cache=draft_cache)
+
+    # Hiring and prospect run concurrently (they hit different services)
+    # and feed one drafting stage and one sink: drafts are buffered and
+    # written in batches; leaving the block (even on an error) flushes
+    # them and runs the state updates deferred until they were on disk
+    try:
+        async with OutputSink(output_path, md_path) as sink:
+            h, p = await run_sources(
+                targets, db, output_path, model, dry_run, pool, triage, sink,
+                hiring=run_hiring, prospect=run_prospect, journal=journal,
+                parse_workers=parse_workers,
+            )
+        if journal is not None:
+            journal.finish()
+    finally:
+        if journal is not None:
+            journal.close()
+    if h is not None:
+        for key in ("scanned", "skipped", "unchanged", "signals", "drafts", "filtered", "errors"):
+            combined[key] = h[key]
+    if p is not None:
+        for key in ("scanned", "skipped", "signals", "duplicates", "drafts", "filtered", "errors"):
+            combined[f"prospect_{key}"] = p[key]
+
+    combined["draft_retries"] = pool.retries
+    combined["prompt_tokens"] = pool.usage.prompt_tokens
+    combined["cached_prompt_tokens"] = pool.usage.cached_tokens
+    if draft_cache is not None:
+        combined["draft_cache_hits"] = draft_cache.hits
+        combined["draft_cache_misses"] = draft_cache.misses
+        draft_cache.close()
 
     # --- Summary ---
     print()
     print("--- SignalSDR Run Complete ---")
+    print(f"  [Targets]  {targets.summary()}")
     if run_hiring:
         print(f"  [Hiring]   Scanned: {combined['scanned']}  Skipped: {combined['skipped']}  "
-              f"Signals: {combined['signals']}  Drafts: {combined['drafts']}  "
+              f"Unchanged: {combined['unchanged']}  Signals: {combined['signals']}  Drafts: {combined['drafts']}  "
               f"Filtered: {combined['filtered']}  Errors: {combined['errors']}")
     if run_prospect and combined["prospect_scanned"] > 0:
         print(f"  [Prospect] Scanned: {combined['prospect_scanned']}  Skipped: {combined['prospect_skipped']}  "
-              f"Signals: {combined['prospect_signals']}  Drafts: {combined['prospect_drafts']}  "
+              f"Signals: {combined['prospect_signals']}  Duplicates: {combined['prospect_duplicates']}  "
+              f"Drafts: {combined['prospect_drafts']}  "
               f"Filtered: {combined['prospect_filtered']}  Errors: {combined['prospect_errors']}")
 
+    if combined["draft_cache_hits"] or combined["draft_cache_misses"] or combined["draft_retries"]:
+        print(f"  [Drafts]   Cache hits: {combined['draft_cache_hits']}  "
+              f"Misses: {combined['draft_cache_misses']}  "
+              f"Rate-limit retries: {combined['draft_retries']}")
+    search_cache = get_search_cache()
+    if search_cache is not None and (search_cache.hits or search_cache.misses):
+        print(f"  [Search]   Brave cache hits: {search_cache.hits}  Misses: {search_cache.misses}  "
+              f"Coalesced: {search_cache.coalesced}")
+    if combined["prompt_tokens"]:
+        print(f"  [LLM]      Prompt tokens: {combined['prompt_tokens']}  "
+              f"Served from provider cache: {combined['cached_prompt_tokens']}")
+
     # --- Email report ---
-    if send_email and not dry_run:
-        if send_email_report(combined):
+    if shard is not None:
+        print("  Email report skipped (sharded run; --merge-shards sends it)")
+    elif send_email and not dry_run:
+        if send_email_report(combined, md_path):
             print("  Email report sent")
         else:
             if not os.environ.get("GMAIL_ADDRESS") or not os.environ.get("GMAIL_APP_PASSWORD"):
@@ -374,20 +622,85 @@ async def run_pipeline(
     return combined
 
 
+def merge_shards(
+    count: int,
+    output_path: str = "drafts_output.csv",
+    db_path: str = str(DEFAULT_DB_PATH),
+    send_email: bool = True,
+) -> dict:
+    """
+    Combine the outputs of a --shard i/N run into the main files.
+
+    Shard drafts are appended to the main CSV, and their markdown
+    becomes the run's markdown report. Those shard files are then
+    removed so a repeated merge adds nothing. Shard state is folded
+    into the main database, newest scan winning, and is kept so each
+    shard's next run starts from it.
+
+    Returns a summary dict in run_pipeline's form (drafts per type).
+    """
+    shards = [Shard(i, count) for i in range(1, count + 1)]
+    md_path = Path("drafts_output.md")
+    csv_parts = [s.path(output_path) for s in shards]
+    md_parts = [s.path(md_path) for s in shards]
+
+    md_path.unlink(missing_ok=True)
+    counts = merge_draft_files(csv_parts, md_parts, output_path, md_path)
+    for part in csv_parts + md_parts:
+        part.unlink(missing_ok=True)
+    n = merge_state([s.path(db_path) for s in shards], Path(db_path))
+
+    summary = {
+        "drafts": counts.get("hiring", 0),
+        "prospect_drafts": sum(v for k, v in counts.items() if k != "hiring"),
+    }
+    print(f"Merged {count} shards: {summary['drafts']} hiring + {summary['prospect_drafts']} "
+          f"prospect draft(s) into {output_path}, {n} companies into {db_path}")
+
+    if send_email and (summary["drafts"] or summary["prospect_drafts"]):
+        print("  Email report sent" if send_email_report(summary, md_path)
+              else "  Email report skipped (GMAIL_ADDRESS / GMAIL_APP_PASSWORD not set)")
+    return summary
+
+
 def main():
     load_dotenv()
 
     parser = argparse.ArgumentParser(description="SignalSDR: Hiring & Prospect Signal Detection Agent")
-    parser.add_argument("--targets", default="targets.csv", help="Path to targets CSV")
+    parser.add_argument("--targets", default="targets.csv",
+                        help="Path to targets CSV or JSONL (optionally .gz)")
     parser.add_argument("--output", default="drafts_output.csv", help="Path to output CSV")
-    parser.add_argument("--db", default="data/db.json", help="Path to state database")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH),
+                        help="Path to state database (.sqlite3, or legacy .json)")
     parser.add_argument("--model", default="openai/gpt-4o", help="LLM model (litellm format)")
     parser.add_argument("--dry-run", action="store_true", help="Scan only, skip LLM drafting")
     parser.add_argument("--no-email", action="store_true", help="Skip email report after run")
     parser.add_argument("--prospect-only", action="store_true", help="Run prospect pipeline only (skip hiring)")
     parser.add_argument("--no-prospect", action="store_true", help="Skip prospect pipeline")
+    parser.add_argument("--no-triage", action="store_true",
+                        help="Draft every signal without the batched LLM relevance check")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue the last interrupted run from its journal instead of redoing its work")
+    parser.add_argument("--parse-workers", metavar="N", type=int, default=PARSE_WORKERS,
+                        help="Processes that parse and analyze fetched pages "
+                             f"(0: in the main process, default {PARSE_WORKERS})")
+    parser.add_argument("--shard", metavar="I/N", type=Shard.parse,
+                        help="Run only the I-th of N slices of the targets, into shard-specific files")
+    parser.add_argument("--merge-shards", metavar="N", type=int,
+                        help="Merge the files of a --shard I/N run into --output and --db, then exit")
+    parser.add_argument("--migrate-from", metavar="DB_JSON",
+                        help="Import a legacy db.json into --db, then exit")
     args = parser.parse_args()
 
+    if args.migrate_from:
+        n = migrate_json_to_sqlite(Path(args.migrate_from), Path(args.db))
+        print(f"Migrated {n} companies from {args.migrate_from} to {args.db}")
+        return
+
+    if args.merge_shards:
+        merge_shards(args.merge_shards, args.output, args.db, send_email=not args.no_email)
+        return
+
     run_hiring = not args.prospect_only
     run_prospect = not args.no_prospect
 
@@ -400,6 +713,10 @@ def main():
         send_email=not args.no_email,
         run_hiring=run_hiring,
         run_prospect=run_prospect,
+        triage=not args.no_triage,
+        resume=args.resume,
+        shard=args.shard,
+        parse_workers=args.parse_workers,
     ))
 
 
@@ -32,9 +32,9 @@ class CareerScannerTool(Tool):
 
     async def execute(self, url: str, company: str, **kwargs: Any) -> str:
         from signalsdr.analyzer import analyze_text
-        from signalsdr.scraper import fetch_page
+        from signalsdr.scraper import fetch_page_async
 
-        result = fetch_page(url)
+        result = await fetch_page_async(url)
         if not result.success:
             return json.dumps({"error": result.error, "url": url, "company": company})
 
@@ -45,9 +45,9 @@ class ProspectScannerTool(Tool):
         categories: list[str] | None = None,
         **kwargs: Any,
     ) -> str:
-        from signalsdr.prospector import prospect_company
+        from signalsdr.prospector import prospect_company_async
 
-        result = prospect_company(company, domain, categories=categories)
+        result = await prospect_company_async(company, domain, categories=categories)
 
         if not result.success:
             return json.dumps({"error": result.error, "company": company})
@@ -10,6 +10,7 @@ from urllib.parse import urlparse
 import httpx
 
 from nanobot.agent.tools.base import Tool
+from signalsdr.ratelimit import host_limiter
 
 # Shared constants
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_7_2) AppleWebKit/537.36"
@@ -65,18 +66,12 @@ class WebSearchTool(Tool):
         if not self.api_key:
             return "Error: BRAVE_API_KEY not configured"
         
+        from signalsdr.prospector import search_brave_async
+
         try:
             n = min(max(count or self.max_results, 1), 10)
-            async with httpx.AsyncClient() as client:
-                r = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": n},
-                    headers={"Accept": "application/json", "X-Subscription-Token": self.api_key},
-                    timeout=10.0
-                )
-                r.raise_for_status()
-            
-            results = r.json().get("web", {}).get("results", [])
+            # Shares the prospector's rate limit and search cache
+            results = await search_brave_async(query, self.api_key, freshness=None, count=n)
             if not results:
                 return f"No results for: {query}"
             
@@ -119,6 +114,7 @@ class WebFetchTool(Tool):
             return json.dumps({"error": f"URL validation failed: {error_msg}", "url": url})
 
         try:
+            await host_limiter(url).acquire_async()
             async with httpx.AsyncClient(
                 follow_redirects=True,
                 max_redirects=MAX_REDIRECTS,
@@ -15,4 +15,5 @@ sleep 5
 source "$HOME/.signalsdr-venv/bin/activate"
 
 echo "=== SignalSDR run: $(date) ===" >> data/signalsdr.log
-python main.py >> data/signalsdr.log 2>&1
+# --resume picks up a run that was killed (sleep, OneDrive lock) where it stopped
+python main.py --resume >> data/signalsdr.log 2>&1
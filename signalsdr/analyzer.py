@@ -6,12 +6,22 @@ SignalSDR Analyzer Module (Feature A - keyword detection from spec).
 Takes raw text from the scraper and detects "hiring signals" by
 matching against configurable keyword lists. Filters out noise
 (intern/junior roles) to surface only high-value signals.
+
+Each signal line also gets a fingerprint (hash of its normalized
+text). Passing the previous scan's fingerprints suppresses lines that
+were already there, so only newly-appeared job rows become signals.
 """
 
-import re
+import hashlib
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from itertools import islice
 
 from signalsdr.config import EXCLUDE_KEYWORDS, SIGNAL_KEYWORDS
+from signalsdr.matcher import KeywordMatcher, get_matcher
+
+# Lines per block when analyzing a streamed (non-list) line source
+ANALYZE_BATCH_LINES = 512
 
 
 @dataclass
@@ -21,6 +31,7 @@ class Signal:
     keyword: str
     matched_text: str
     line_number: int
+    fingerprint: str = ""
 
 
 @dataclass
@@ -30,16 +41,98 @@ class AnalysisResult:
     url: str
     company: str
     signals: list[Signal] = field(default_factory=list)
+    fingerprints: set[str] = field(default_factory=set)  # every signal line on the page
+    repeated: int = 0  # signal lines suppressed because they were seen last scan
 
     @property
     def has_signals(self) -> bool:
         return len(self.signals) > 0
 
 
+def line_fingerprint(line: str) -> str:
+    """Short stable hash of a line, ignoring case and whitespace differences."""
+    normalized = " ".join(line.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
 def _is_excluded(line: str) -> bool:
     """Check if a line matches any exclusion keyword."""
-    line_lower = line.lower()
-    return any(kw.lower() in line_lower for kw in EXCLUDE_KEYWORDS)
+    return get_matcher(tuple(EXCLUDE_KEYWORDS), word_boundary=False).search(line)
+
+
+def _scan_lines(
+    lines: list[str],
+    first_line_number: int,
+    matcher: KeywordMatcher,
+    excluded: KeywordMatcher,
+    result: AnalysisResult,
+    seen_fingerprints: set[str] | None,
+) -> None:
+    """Append signals found in lines (numbered from first_line_number) to result."""
+    # One scan of the whole block finds the few lines that mention a keyword
+    for idx in matcher.hit_lines(lines):
+        line = lines[idx]
+
+        # Skip lines that match exclusion patterns
+        if excluded.search(line):
+            continue
+
+        fingerprint = line_fingerprint(line)
+        result.fingerprints.add(fingerprint)
+        if seen_fingerprints and fingerprint in seen_fingerprints:
+            result.repeated += 1
+            continue
+
+        for keyword in matcher.matches(line):
+            result.signals.append(
+                Signal(
+                    keyword=keyword,
+                    matched_text=line.strip()[:200],  # cap at 200 chars
+                    line_number=first_line_number + idx,
+                    fingerprint=fingerprint,
+                )
+            )
+
+
+def analyze_lines(
+    lines: Iterable[str],
+    url: str,
+    company: str,
+    keywords: list[str] | None = None,
+    seen_fingerprints: set[str] | None = None,
+) -> AnalysisResult:
+    """
+    Scan an iterable of text lines for hiring signal keywords.
+
+    Accepts a lazy source such as signalsdr.extract.iter_text_lines, and
+    analyzes it in blocks of ANALYZE_BATCH_LINES as lines arrive, so the
+    full page text never has to be assembled first.
+
+    Args:
+        lines: Text lines (without newlines).
+        url: Source URL (for tracking).
+        company: Company name (for tracking).
+        keywords: Override keyword list (defaults to SIGNAL_KEYWORDS).
+        seen_fingerprints: Fingerprints from the previous scan; matching
+            lines are counted in ``repeated`` instead of producing signals.
+
+    Returns:
+        AnalysisResult containing any detected signals.
+    """
+    matcher = get_matcher(tuple(keywords or SIGNAL_KEYWORDS))
+    excluded = get_matcher(tuple(EXCLUDE_KEYWORDS), word_boundary=False)
+    result = AnalysisResult(url=url, company=company)
+
+    if isinstance(lines, list):
+        _scan_lines(lines, 1, matcher, excluded, result, seen_fingerprints)
+        return result
+
+    line_number = 1
+    it = iter(lines)
+    while batch := list(islice(it, ANALYZE_BATCH_LINES)):
+        _scan_lines(batch, line_number, matcher, excluded, result, seen_fingerprints)
+        line_number += len(batch)
+    return result
 
 
 def analyze_text(
@@ -47,43 +140,23 @@ def analyze_text(
     url: str,
     company: str,
     keywords: list[str] | None = None,
+    seen_fingerprints: set[str] | None = None,
 ) -> AnalysisResult:
     """
     Scan text for hiring signal keywords.
 
     For each line of text, checks if any keyword from the signal list
     appears (case-insensitive). Lines matching exclusion keywords are
-    skipped.
+    skipped. Keyword sets are compiled once and cached (signalsdr.matcher).
 
     Args:
         text: The scraped page text to analyze.
         url: Source URL (for tracking).
         company: Company name (for tracking).
         keywords: Override keyword list (defaults to SIGNAL_KEYWORDS).
+        seen_fingerprints: Fingerprints from the previous scan to suppress.
 
     Returns:
         AnalysisResult containing any detected signals.
     """
-    keywords = keywords or SIGNAL_KEYWORDS
-    result = AnalysisResult(url=url, company=company)
-
-    for line_num, line in enumerate(text.splitlines(), start=1):
-        if not line.strip():
-            continue
-
-        # Skip lines that match exclusion patterns
-        if _is_excluded(line):
-            continue
-
-        for keyword in keywords:
-            pattern = re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE)
-            if pattern.search(line):
-                result.signals.append(
-                    Signal(
-                        keyword=keyword,
-                        matched_text=line.strip()[:200],  # cap at 200 chars
-                        line_number=line_num,
-                    )
-                )
-
-    return result
+    return analyze_lines(text.splitlines(), url, company, keywords, seen_fingerprints)
@@ -51,6 +51,15 @@ PROSPECT_CATEGORIES = {
     "ai_adoption": '"{company}" artificial intelligence OR AI deployment OR machine learning OR generative AI OR AI features OR software-defined',
 }
 
+# Brave query planning: "per_category" sends one query per category above;
+# "combined" ORs the categories of each PROSPECT_QUERY_GROUPS group into one
+# broader query and re-classifies the results locally (fewer API calls)
+PROSPECT_QUERY_MODE = "per_category"
+PROSPECT_QUERY_GROUPS = [
+    ["new_model", "ev_transition", "ai_adoption"],
+    ["service_challenge", "regulatory"],
+]
+
 # Keywords for scanning company news/blog pages directly (maps keyword → category)
 NEWS_PAGE_KEYWORDS = {
     # new_model
@@ -100,6 +109,17 @@ NEWS_PAGE_KEYWORDS = {
 # Brave Search freshness filter: "pd" = past day, "pw" = past week, "pm" = past month
 PROSPECT_FRESHNESS = "pw"
 
+# Brave result cache (see signalsdr.searchcache): seconds a result set stays
+# valid per freshness filter; "" covers searches without one
+SEARCH_CACHE_PATH = "data/search_cache.sqlite3"
+SEARCH_CACHE_TTLS = {
+    "pd": 1 * 3600,
+    "pw": 6 * 3600,
+    "pm": 24 * 3600,
+    "py": 72 * 3600,
+    "": 1 * 3600,
+}
+
 # Max search results per category per company
 PROSPECT_MAX_RESULTS = 5
 
@@ -107,9 +127,102 @@ PROSPECT_MAX_RESULTS = 5
 # Prioritizes category diversity: takes 1 from each category first, then fills remaining
 MAX_PROSPECT_SIGNALS_PER_COMPANY = 5
 
-# Rate limiting: seconds to wait between scrapes
+# Near-duplicate prospect signals (same story syndicated across sites) are
+# clustered before the cap above: max differing bits between the 64-bit
+# SimHashes of two signals' headline + snippet
+SIGNAL_SIMHASH_MAX_DISTANCE = 12
+
+# Which copy of a clustered story to keep: higher wins. The company's own
+# domain outranks everything; unlisted hosts score 1.
+SOURCE_AUTHORITY = {
+    "reuters.com": 5,
+    "apnews.com": 5,
+    "bloomberg.com": 5,
+    "wsj.com": 4,
+    "ft.com": 4,
+    "cnbc.com": 4,
+    "autonews.com": 4,
+    "businesswire.com": 3,
+    "prnewswire.com": 3,
+    "globenewswire.com": 3,
+    "yahoo.com": 0,
+    "msn.com": 0,
+}
+
+# Query parameters that never change what a URL points at
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ocid", "cmpid", "ref", "taid")
+
+# Rate limiting: seconds to wait between scrapes of the same host
 SCRAPE_DELAY_SECONDS = 2
 
+# Max careers/news pages fetched in parallel (across all hosts)
+MAX_CONCURRENT_FETCHES = 10
+
+# Token-bucket limits as (requests per second, burst), see signalsdr.ratelimit
+HOST_RATE_LIMIT = (1 / SCRAPE_DELAY_SECONDS, 1)
+API_RATE_LIMITS = {
+    "brave": (1.0, 1),  # Brave Search free tier: 1 query/sec
+}
+
+# Max LLM draft requests in flight per provider (litellm model prefix).
+# The pool halves a provider's limit on HTTP 429 and creeps back up on success.
+MAX_CONCURRENT_DRAFTS = {
+    "default": 4,
+    "openai": 8,
+    "anthropic": 4,
+}
+
+# Providers that only use their prompt cache when the request marks the
+# prefix with cache_control (OpenAI and others cache long prefixes on their own)
+PROMPT_CACHE_PROVIDERS = {"anthropic", "bedrock"}
+
+# Shortest prefix (tokens) a provider will cache; shorter prompts are sent
+# unmarked, since cache_control on them is ignored. Estimated at ~4 chars/token
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# Max signals of one company drafted in a single LLM request (1 = no batching)
+DRAFT_BATCH_SIZE = 5
+
+# Retries for a rate-limited draft request, with exponential backoff (seconds)
+DRAFT_MAX_RETRIES = 4
+DRAFT_RETRY_BACKOFF_SECONDS = 2.0
+
+# Max candidate signals per pre-drafting triage request (see drafter.triage_signals)
+TRIAGE_BATCH_SIZE = 25
+
+# How long the triage stage waits for more companies to fill a batch
+# before screening what it has (see signalsdr.pipeline)
+TRIAGE_LINGER_SECONDS = 0.5
+
+# Max companies buffered between pipeline stages; also how far fetching
+# runs ahead of analysis, which bounds the page text held in memory
+PIPELINE_QUEUE_SIZE = 32
+
+# Local cache of LLM drafts keyed by prompt fingerprint (see signalsdr.draftcache)
+DRAFT_CACHE_PATH = "data/draft_cache.sqlite3"
+DRAFT_CACHE_TTL_SECONDS = 30 * 24 * 3600
+DRAFT_CACHE_MAX_ENTRIES = 5000
+
+# OutputSink: drafts buffered per file flush, and max drafts per Slack message
+OUTPUT_FLUSH_EVERY = 25
+SLACK_BATCH_SIZE = 10
+
+# HTML-to-text backend for fetched pages: "lxml" (streaming, no tree) or "bs4"
+HTML_EXTRACTOR = "lxml"
+
+# Worker processes that parse and analyze fetched pages off the event loop
+# (signalsdr.parsepool); 0 parses in the event loop, None uses every core.
+# Worth it for many targets or the bs4 backend; each worker costs a startup.
+PARSE_WORKERS = 0
+
+# On-disk cache of fetched pages (ETag/Last-Modified + extracted-text hash)
+HTTP_CACHE_DIR = "data/http_cache"
+
+# Per-run journals (see signalsdr.journal); all but the newest
+# JOURNAL_KEEP are deleted when a new run starts
+JOURNAL_DIR = "data/runs"
+JOURNAL_KEEP = 14
+
 # HTTP request settings
 REQUEST_TIMEOUT_SECONDS = 15
 USER_AGENT = (
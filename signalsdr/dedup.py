@@ -0,0 +1,155 @@
+"""
+SignalSDR Signal Dedup.
+
+One press release syndicated across ten news sites comes back from
+Brave as ten results with slightly different headlines ("... - Reuters",
+"... | Yahoo Finance") and identical snippets. Exact-headline dedup
+misses these, and each would be drafted separately.
+
+Signals are fingerprinted with a 64-bit SimHash over word shingles of
+their normalized headline + snippet. Two signals whose fingerprints
+differ in at most SIGNAL_SIMHASH_MAX_DISTANCE bits are one story,
+whatever their URLs: a shared URL says nothing, since every line of a
+newsroom page carries that page's URL. Each cluster keeps its most
+authoritative source (SOURCE_AUTHORITY; the company's own site ranks
+highest).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from signalsdr.config import SIGNAL_SIMHASH_MAX_DISTANCE, SOURCE_AUTHORITY, TRACKING_PARAMS
+
+if TYPE_CHECKING:
+    from signalsdr.prospector import ProspectSignal
+
+# Authority of the company's own site (newsroom, investor relations)
+_OWN_DOMAIN_AUTHORITY = 10
+
+# " - Reuters", " | Yahoo Finance": the syndicating site's name after the title
+_SITE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+_WORD = re.compile(r"\w+")
+_HOST_PREFIXES = ("www.", "m.", "amp.", "mobile.")
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL so variants of one article compare equal.
+
+    Lowercases the scheme and host, drops "www."/"m."/"amp." host
+    prefixes, the fragment, tracking parameters, a trailing "/amp" and
+    trailing slashes, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    path = re.sub(r"/amp/?$", "", parts.path).rstrip("/")
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PARAMS)
+    )
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme,
+                       host, path, urlencode(query), ""))
+
+
+def _host(url: str) -> str:
+    return urlsplit(canonical_url(url)).netloc
+
+
+def source_authority(url: str, domain: str = "") -> int:
+    """Rank of a source URL: the company's own domain, then SOURCE_AUTHORITY, else 1."""
+    host = _host(url)
+    if domain and (host == domain or host.endswith("." + domain)):
+        return _OWN_DOMAIN_AUTHORITY
+    labels = host.split(".")
+    # Match the registered domain (news.yahoo.com -> yahoo.com)
+    for i in range(len(labels) - 1):
+        score = SOURCE_AUTHORITY.get(".".join(labels[i:]))
+        if score is not None:
+            return score
+    return 1
+
+
+def _shingles(text: str, size: int = 2) -> list[str]:
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of text's word bigrams."""
+    weights = [0] * 64
+    for shingle in _shingles(text):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def signal_text(signal: ProspectSignal) -> str:
+    """Headline (without a trailing site name) + snippet, as fingerprinted."""
+    return f"{_SITE_SUFFIX.sub('', signal.headline)} {signal.snippet}"
+
+
+@dataclass
+class _Entry:
+    index: int
+    signal: ProspectSignal
+    fingerprint: int
+    authority: int
+
+
+def dedup_signals(
+    signals: Sequence[ProspectSignal],
+    domain: str = "",
+    max_distance: int = SIGNAL_SIMHASH_MAX_DISTANCE,
+) -> list[ProspectSignal]:
+    """
+    Collapse near-duplicate signals, keeping the best source of each story.
+
+    Args:
+        signals: Signals from all sources for one company, in priority order.
+        domain: The company's domain (its own site is the top authority).
+        max_distance: SimHash bit distance at or below which two signals
+            are the same story.
+
+    Returns:
+        One signal per cluster, ordered by each cluster's first member
+        so category order is preserved for the diversity cap.
+    """
+    clusters: list[list[_Entry]] = []
+    for index, signal in enumerate(signals):
+        entry = _Entry(
+            index=index,
+            signal=signal,
+            fingerprint=simhash(signal_text(signal)),
+            authority=source_authority(signal.source_url, domain),
+        )
+        for cluster in clusters:
+            if any(_same_story(entry, other, max_distance) for other in cluster):
+                cluster.append(entry)
+                break
+        else:
+            clusters.append([entry])
+
+    # Highest authority wins; among equals, the earliest signal
+    best = [max(cluster, key=lambda e: (e.authority, -e.index)) for cluster in clusters]
+    return [e.signal for e in best]
+
+
+def _same_story(a: _Entry, b: _Entry, max_distance: int) -> bool:
+    return hamming(a.fingerprint, b.fingerprint) <= max_distance
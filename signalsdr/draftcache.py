@@ -0,0 +1,112 @@
+"""
+SignalSDR Draft Cache.
+
+Content-addressed cache of LLM email drafts. The key is a hash of
+everything that determines the completion (model, system prompt, user
+message, temperature), so re-drafting the same signal with the same
+prompt — after a crash, or when a cooldown expires on an unchanged
+listing — is answered locally instead of by the provider.
+
+Entries expire after a TTL and the table is trimmed to a maximum size,
+least recently used first. Only successful completions are stored,
+including "null" drafts (signals the LLM rejected), since those cost
+just as much to rediscover.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from signalsdr.config import (
+    DRAFT_CACHE_MAX_ENTRIES,
+    DRAFT_CACHE_PATH,
+    DRAFT_CACHE_TTL_SECONDS,
+)
+
+
+def draft_key(model: str, system_msg: str, user_msg: str, temperature: float) -> str:
+    """Fingerprint of a draft request."""
+    payload = json.dumps([model, system_msg, user_msg, temperature], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DraftCache:
+    """SQLite-backed draft cache with TTL expiry and LRU eviction."""
+
+    def __init__(
+        self,
+        path: str | Path = DRAFT_CACHE_PATH,
+        ttl_seconds: float = DRAFT_CACHE_TTL_SECONDS,
+        max_entries: int = DRAFT_CACHE_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS drafts (
+                key          TEXT PRIMARY KEY,
+                subject_line TEXT,
+                body         TEXT,
+                created_at   REAL NOT NULL,
+                used_at      REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS drafts_used_at ON drafts (used_at);
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> dict | None:
+        """Return {"subject_line", "body"} for key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT subject_line, body, created_at FROM drafts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[2] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM drafts WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE drafts SET used_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return {"subject_line": row[0], "body": row[1]}
+
+    def put(self, key: str, subject_line: str | None, body: str | None) -> None:
+        """Store a completed draft, evicting the least recently used past max_entries."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO drafts VALUES (?, ?, ?, ?, ?)",
+                (key, subject_line, body, now, now),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM drafts").fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM drafts WHERE key IN "
+                    "(SELECT key FROM drafts ORDER BY used_at LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM drafts").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -8,12 +8,28 @@ email draft via LLM (litellm for multi-provider support).
 This is the "brain" of the agent.
 """
 
+import asyncio
+import contextlib
 import json
 import os
+import random
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
-from litellm import acompletion
+from litellm import RateLimitError, acompletion
+
+from signalsdr.config import (
+    DRAFT_MAX_RETRIES,
+    DRAFT_RETRY_BACKOFF_SECONDS,
+    DRAFT_BATCH_SIZE,
+    MAX_CONCURRENT_DRAFTS,
+    PROMPT_CACHE_MIN_TOKENS,
+    PROMPT_CACHE_PROVIDERS,
+    TRIAGE_BATCH_SIZE,
+)
+from signalsdr.draftcache import DraftCache, draft_key
 
 
 # ---------------------------------------------------------------------------
@@ -51,7 +67,13 @@ _PRODUCTS = "\n".join(f"- {p}" for p in COMPANY["products"])
 _INDUSTRIES = COMPANY["industries"]
 
 
-SYSTEM_PROMPT = f"""\
+# Prompts are assembled from shared sections so the single-draft and
+# batch variants stay word-for-word in sync. System prompts hold no
+# per-signal values (company, role and category go in the user message),
+# so every request in a run starts with the same prefix and providers
+# can serve it from their prompt cache once it is long enough to qualify
+# (see _system_message).
+_PREAMBLE = f"""\
 You are an expert SDR (Sales Development Representative) for {_CO} \
 ({_URL}), a leader in product information and technical documentation.
 
@@ -60,7 +82,9 @@ You are an expert SDR (Sales Development Representative) for {_CO} \
 
 Industries: {_INDUSTRIES}.
 
-Trigger: {{company}} is hiring for {{role}}.
+"""
+
+_HIRING_TASK = f"""\
 Task: Write a short 3-sentence cold email that:
 1. Opens by connecting this specific hire to an organizational shift happening at {{company}}
 2. Frames {_CO} as the partner that lets that capability scale across their whole org — not just support one team
@@ -76,23 +100,9 @@ or any other non-hiring content — you MUST return: {{{{"subject_line": null, "
 Do not hallucinate a job opening. Do not invent a role.
 Only draft an email when the signal clearly indicates an open position being hired for.
 
-You MUST respond with valid JSON only, no markdown, no explanation:
-{{{{"subject_line": "...", "body": "..."}}}}
 """
 
-PROSPECT_SYSTEM_PROMPT = f"""\
-You are an expert SDR (Sales Development Representative) for {_CO} \
-({_URL}), a leader in product information and technical documentation.
-
-{_CO} helps OEMs and manufacturers build and deploy:
-{_PRODUCTS}
-
-Industries: {_INDUSTRIES}.
-
-Signal type: {{category}}
-Trigger: {{role}}
-Company: {{company}}
-
+_PROSPECT_TASK = f"""\
 Task: Write a compelling 3-sentence outreach email that:
 1. Opens by naming the specific signal and what it signals about {{company}}'s direction
 2. Frames {_CO} as what multiplies that capability across their whole org — not a one-off engagement
@@ -113,10 +123,128 @@ If the headline/snippet is clearly irrelevant (unrelated company, spam, \
 generic news aggregation) — return: {{{{"subject_line": null, "body": null}}}}
 Only draft when the signal is genuinely about {{company}}.
 
+"""
+
+_JSON_REPLY = """\
 You MUST respond with valid JSON only, no markdown, no explanation:
-{{{{"subject_line": "...", "body": "..."}}}}
+{{"subject_line": "...", "body": "..."}}
 """
 
+_BATCH_JSON_REPLY = """\
+The user message names the company and lists its signals as a JSON array, each with an "id".
+Write one email per signal and apply the rule above to each signal on its own.
+You MUST respond with valid JSON only, no markdown, no explanation — \
+an array with one object per signal, in the same order:
+[{{"id": 0, "subject_line": "...", "body": "..."}}]
+"""
+
+_SIGNAL_COMPANY = {"company": "the company"}
+
+SYSTEM_PROMPT = (
+    _PREAMBLE
+    + "Trigger: the company named by the user is hiring for the role given.\n"
+    + _HIRING_TASK
+    + _JSON_REPLY
+).format(**_SIGNAL_COMPANY)
+
+PROSPECT_SYSTEM_PROMPT = (
+    _PREAMBLE
+    + "Trigger: the signal and signal type given by the user for the company named.\n\n"
+    + _PROSPECT_TASK
+    + _JSON_REPLY
+).format(**_SIGNAL_COMPANY)
+
+# Batch variants for generate_drafts_batch: one request, many signals
+BATCH_SYSTEM_PROMPT = (
+    _PREAMBLE
+    + "Trigger: the company named by the user is hiring for each role listed.\n"
+    + _HIRING_TASK
+    + _BATCH_JSON_REPLY
+).format(**_SIGNAL_COMPANY)
+
+PROSPECT_BATCH_SYSTEM_PROMPT = (
+    _PREAMBLE
+    + "Triggers: the signals listed by the user for the company named, each with its signal type.\n\n"
+    + _PROSPECT_TASK
+    + _BATCH_JSON_REPLY
+).format(**_SIGNAL_COMPANY)
+
+
+# Cheap pre-drafting relevance check: one call classifies a whole batch of
+# candidate signals so only real ones pay for a full draft request.
+TRIAGE_PROMPTS = {
+    "hiring": """\
+You screen lines scraped from company careers pages.
+For each candidate decide whether it is a real open job listing \
+(a specific role the company is hiring for).
+Drop diversity statements, footer text, navigation, generic marketing copy, \
+"Board of Directors" or leadership bios, fraud warnings and any other non-hiring content.
+
+Input: a JSON array of {"id", "company", "signal"}.
+You MUST respond with valid JSON only, no markdown, no explanation:
+{"keep": [ids of real job listings]}
+""",
+    "prospect": """\
+You screen news headlines found for B2B sales prospecting.
+For each candidate decide whether it is genuinely about the named company \
+and describes a real development (product launch, service operations, \
+electrification, regulation, AI adoption).
+Drop results about an unrelated company, spam, and generic news aggregation.
+
+Input: a JSON array of {"id", "company", "category", "signal"}.
+You MUST respond with valid JSON only, no markdown, no explanation:
+{"keep": [ids of relevant signals]}
+""",
+}
+
+
+@dataclass
+class TriageItem:
+    """One candidate signal for triage_signals."""
+
+    company: str
+    text: str
+    category: str = ""
+
+
+@dataclass
+class DraftRequest:
+    """
+    One signal to draft in generate_drafts_batch.
+
+    role is the short label stored on the draft; trigger is the full
+    signal text shown to the LLM (defaults to role). Prospect signals
+    set category and use the prospect prompts.
+    """
+
+    role: str
+    trigger: str = ""
+    category: str = ""
+    signal_type: str = "hiring"
+
+
+@dataclass
+class TokenUsage:
+    """Running token totals over LLM responses, including prompt-cache reads."""
+
+    requests: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+
+    def add(self, response) -> None:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        self.requests += 1
+        self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+        self.completion_tokens += getattr(usage, "completion_tokens", 0) or 0
+        # litellm normalizes cache hits into prompt_tokens_details; older
+        # versions only expose Anthropic's cache_read_input_tokens
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", 0) if details is not None else 0
+        self.cached_tokens += cached or getattr(usage, "cache_read_input_tokens", 0) or 0
+
 
 @dataclass
 class EmailDraft:
@@ -130,6 +258,8 @@ class EmailDraft:
     success: bool
     error: str = ""
     signal_type: str = "hiring"
+    rate_limited: bool = False
+    cached: bool = False
 
     @property
     def is_valid(self) -> bool:
@@ -144,6 +274,10 @@ async def generate_draft(
     api_key: str | None = None,
     system_prompt: str | None = None,
     signal_type: str = "hiring",
+    cache: DraftCache | None = None,
+    category: str = "",
+    trigger: str = "",
+    usage: TokenUsage | None = None,
 ) -> EmailDraft:
     """
     Generate a cold email draft for a detected signal.
@@ -158,27 +292,24 @@ async def generate_draft(
         model: litellm model string (e.g. "openai/gpt-4o", "anthropic/claude-sonnet-4-5").
         temperature: LLM sampling temperature.
         api_key: Optional API key override (otherwise uses env vars).
-        system_prompt: Custom system prompt (uses SYSTEM_PROMPT if None).
+        system_prompt: Custom system prompt (uses SYSTEM_PROMPT, or
+            PROSPECT_SYSTEM_PROMPT when category is set, if None).
         signal_type: "hiring" or "prospect" — stored on the draft.
+        cache: Optional DraftCache; an identical earlier request is
+            answered from it instead of calling the LLM.
+        category: Prospect signal category; selects the prospect prompt.
+        trigger: Full prospect signal text for the LLM (defaults to role).
+        usage: Optional TokenUsage to add this request's tokens to.
 
     Returns:
         EmailDraft with the generated subject line and body.
     """
-    if system_prompt:
-        system_msg = system_prompt
-    else:
-        system_msg = SYSTEM_PROMPT.format(company=company, role=role)
-
-    user_msg = (
-        f"Company: {company}\n"
-        f"Detected Role: {role}\n\n"
-        f"Write the cold email draft as JSON."
-    )
+    system_msg, user_msg = _draft_messages(company, role, system_prompt, category, trigger)
 
     kwargs = {
         "model": model,
         "messages": [
-            {"role": "system", "content": system_msg},
+            _system_message(system_msg, model),
             {"role": "user", "content": user_msg},
         ],
         "max_tokens": 512,
@@ -187,24 +318,48 @@ async def generate_draft(
     if api_key:
         kwargs["api_key"] = api_key
 
+    key = draft_key(model, system_msg, user_msg, temperature)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return EmailDraft(
+                company=company,
+                role=role,
+                subject_line=hit["subject_line"],
+                body=hit["body"],
+                model=model,
+                success=True,
+                signal_type=signal_type,
+                cached=True,
+            )
+
     try:
         response = await acompletion(**kwargs)
-        raw = response.choices[0].message.content.strip()
-
-        # Strip markdown fences if the LLM wraps its JSON
-        if raw.startswith("```"):
-            raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-            if raw.endswith("```"):
-                raw = raw[:-3]
-            raw = raw.strip()
-
-        draft_data = json.loads(raw)
+        if usage is not None:
+            usage.add(response)
+        raw = _strip_fences(response.choices[0].message.content)
+        fields = _reply_fields(json.loads(raw))
+        if fields is None:
+            # Not cached: a partial reply would be replayed as a rejection
+            return EmailDraft(
+                company=company,
+                role=role,
+                subject_line=None,
+                body=None,
+                model=model,
+                success=False,
+                error="LLM reply lacks a subject_line and body",
+                signal_type=signal_type,
+            )
+        subject_line, body = fields
+        if cache is not None:
+            cache.put(key, subject_line, body)
 
         return EmailDraft(
             company=company,
             role=role,
-            subject_line=draft_data.get("subject_line"),
-            body=draft_data.get("body"),
+            subject_line=subject_line,
+            body=body,
             model=model,
             success=True,
             signal_type=signal_type,
@@ -231,4 +386,478 @@ async def generate_draft(
             success=False,
             error=str(e),
             signal_type=signal_type,
+            rate_limited=_is_rate_limit(e),
+        )
+
+
+def _reply_fields(reply: object) -> tuple[str | None, str | None] | None:
+    """
+    (subject_line, body) from a draft reply, or None if it is malformed.
+
+    A usable reply has both as non-empty strings, or both explicitly
+    null (the prompts' way of rejecting a signal).
+    """
+    if not isinstance(reply, dict) or "subject_line" not in reply or "body" not in reply:
+        return None
+    subject_line, body = reply["subject_line"], reply["body"]
+    if subject_line is None and body is None:
+        return None, None
+    if isinstance(subject_line, str) and isinstance(body, str) and subject_line and body:
+        return subject_line, body
+    return None
+
+
+def _draft_messages(
+    company: str,
+    role: str,
+    system_prompt: str | None = None,
+    category: str = "",
+    trigger: str = "",
+) -> tuple[str, str]:
+    """System and user messages for a single draft request."""
+    if category:
+        system_msg = PROSPECT_SYSTEM_PROMPT
+        user_msg = (
+            f"Company: {company}\n"
+            f"Signal type: {category}\n"
+            f"Trigger: {trigger or role}\n\n"
+            f"Write the outreach email draft as JSON."
+        )
+    else:
+        system_msg = SYSTEM_PROMPT
+        user_msg = (
+            f"Company: {company}\n"
+            f"Trigger: {company} is hiring for {role}.\n\n"
+            f"Write the cold email draft as JSON."
         )
+    return system_prompt or system_msg, user_msg
+
+
+def _system_message(content: str, model: str) -> dict:
+    """
+    System message for model, marked as a cacheable prefix where needed.
+
+    Providers in PROMPT_CACHE_PROVIDERS only cache content carrying an
+    explicit cache_control block; others (e.g. OpenAI) cache long shared
+    prefixes automatically and get a plain string. Prompts shorter than
+    PROMPT_CACHE_MIN_TOKENS are below every provider's cache minimum and
+    are sent unmarked too; the built-in prompts all are.
+    """
+    if (_provider(model) in PROMPT_CACHE_PROVIDERS
+            and len(content) / 4 >= PROMPT_CACHE_MIN_TOKENS):
+        return {
+            "role": "system",
+            "content": [{"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}],
+        }
+    return {"role": "system", "content": content}
+
+
+async def generate_drafts_batch(
+    company: str,
+    requests: list[DraftRequest],
+    model: str = "openai/gpt-4o",
+    temperature: float = 0.7,
+    api_key: str | None = None,
+    cache: DraftCache | None = None,
+    usage: TokenUsage | None = None,
+    slot: contextlib.AbstractAsyncContextManager | None = None,
+    fallback: Callable[..., Awaitable[EmailDraft]] | None = None,
+) -> list[EmailDraft]:
+    """
+    Generate drafts for several signals of one company in a single request.
+
+    The company context and rules are sent once, the signals as a JSON
+    array, and the reply is a JSON array of drafts matched back by id.
+    Items the reply omits or mangles are redrafted with single
+    generate_draft requests, as is the whole batch if the reply is not
+    a JSON array. The draft cache is consulted and filled per signal,
+    with the same keys generate_draft uses, so batch and single mode
+    share entries.
+
+    Args:
+        company: The company name.
+        requests: Signals to draft; all hiring or all prospect.
+        model: litellm model string.
+        temperature: LLM sampling temperature.
+        api_key: Optional API key override (otherwise uses env vars).
+        cache: Optional DraftCache.
+        usage: Optional TokenUsage to add request tokens to.
+        slot: Optional async context held around the batch request only
+            (e.g. a DraftPool provider slot).
+        fallback: Coroutine function for the single redrafts, called with
+            generate_draft's arguments; defaults to generate_draft. Each
+            call is expected to take its own slot if it needs one.
+
+    Returns:
+        One EmailDraft per request, in request order.
+    """
+    slot = slot if slot is not None else contextlib.nullcontext()
+    fallback = fallback or generate_draft
+    drafts: list[EmailDraft | None] = [None] * len(requests)
+    keys = []
+    for i, req in enumerate(requests):
+        system_msg, user_msg = _draft_messages(company, req.role, None, req.category, req.trigger)
+        keys.append(draft_key(model, system_msg, user_msg, temperature))
+        hit = cache.get(keys[-1]) if cache is not None else None
+        if hit is not None:
+            drafts[i] = EmailDraft(
+                company=company,
+                role=req.role,
+                subject_line=hit["subject_line"],
+                body=hit["body"],
+                model=model,
+                success=True,
+                signal_type=req.signal_type,
+                cached=True,
+            )
+
+    pending = [i for i, draft in enumerate(drafts) if draft is None]
+    rate_limited = False
+    if len(pending) > 1:
+        prospect = bool(requests[pending[0]].category)
+        system_msg = PROSPECT_BATCH_SYSTEM_PROMPT if prospect else BATCH_SYSTEM_PROMPT
+        items = []
+        for i in pending:
+            item = {"id": i, "signal": requests[i].trigger or requests[i].role}
+            if prospect:
+                item["signal_type"] = requests[i].category
+            items.append(item)
+
+        kwargs = {
+            "model": model,
+            "messages": [
+                _system_message(system_msg, model),
+                {
+                    "role": "user",
+                    "content": f"Company: {company}\n{json.dumps(items, ensure_ascii=False)}",
+                },
+            ],
+            "max_tokens": 384 * len(pending),
+            "temperature": temperature,
+        }
+        if api_key:
+            kwargs["api_key"] = api_key
+
+        try:
+            async with slot:
+                response = await acompletion(**kwargs)
+            if usage is not None:
+                usage.add(response)
+            replies = json.loads(_strip_fences(response.choices[0].message.content))
+            if not isinstance(replies, list):
+                replies = []
+        except Exception as e:
+            rate_limited = _is_rate_limit(e)
+            replies = []
+
+        for reply in replies:
+            i = reply.get("id") if isinstance(reply, dict) else None
+            if i not in pending or drafts[i] is not None:
+                continue
+            fields = _reply_fields(reply)
+            if fields is None:
+                continue
+            subject_line, body = fields
+            if cache is not None:
+                cache.put(keys[i], subject_line, body)
+            drafts[i] = EmailDraft(
+                company=company,
+                role=requests[i].role,
+                subject_line=subject_line,
+                body=body,
+                model=model,
+                success=True,
+                signal_type=requests[i].signal_type,
+            )
+
+    # A 429 on the batch is left to the caller (DraftPool) to retry, rather
+    # than multiplying it into one single request per signal
+    missing = [i for i in pending if drafts[i] is None]
+    if rate_limited:
+        for i in missing:
+            drafts[i] = EmailDraft(
+                company=company,
+                role=requests[i].role,
+                subject_line=None,
+                body=None,
+                model=model,
+                success=False,
+                error="Rate limited",
+                signal_type=requests[i].signal_type,
+                rate_limited=True,
+            )
+        missing = []
+
+    singles = await asyncio.gather(*(
+        fallback(
+            company=company,
+            role=requests[i].role,
+            model=model,
+            temperature=temperature,
+            api_key=api_key,
+            signal_type=requests[i].signal_type,
+            category=requests[i].category,
+            trigger=requests[i].trigger,
+            cache=cache,
+            usage=usage,
+        )
+        for i in missing
+    ))
+    for i, draft in zip(missing, singles):
+        drafts[i] = draft
+
+    return drafts
+
+
+def _strip_fences(raw: str) -> str:
+    """Strip markdown fences if the LLM wraps its JSON."""
+    raw = raw.strip()
+    if raw.startswith("```"):
+        raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
+        if raw.endswith("```"):
+            raw = raw[:-3]
+        raw = raw.strip()
+    return raw
+
+
+async def triage_signals(
+    items: list[TriageItem],
+    model: str = "openai/gpt-4o",
+    kind: str = "hiring",
+    api_key: str | None = None,
+    batch_size: int = TRIAGE_BATCH_SIZE,
+    usage: TokenUsage | None = None,
+) -> list[bool]:
+    """
+    Decide keep/drop for candidate signals before drafting.
+
+    Candidates (from one company or many) are sent in batches of
+    batch_size, one short classification request per batch, run
+    concurrently. Triage fails open: a batch whose request or reply is
+    unusable keeps all its items, since generate_draft still rejects
+    non-signals on its own.
+
+    Args:
+        items: Candidate signals, in output order.
+        model: litellm model string.
+        kind: "hiring" or "prospect" — selects the screening prompt.
+        api_key: Optional API key override (otherwise uses env vars).
+        batch_size: Max candidates per request.
+        usage: Optional TokenUsage to add request tokens to.
+
+    Returns:
+        One bool per item, True to keep it.
+    """
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    results = await asyncio.gather(
+        *(_triage_batch(batch, model, TRIAGE_PROMPTS[kind], api_key, usage) for batch in batches)
+    )
+    return [keep for batch in results for keep in batch]
+
+
+async def _triage_batch(
+    items: list[TriageItem],
+    model: str,
+    system_msg: str,
+    api_key: str | None,
+    usage: TokenUsage | None,
+) -> list[bool]:
+    candidates = []
+    for i, item in enumerate(items):
+        candidate = {"id": i, "company": item.company, "signal": item.text[:200]}
+        if item.category:
+            candidate["category"] = item.category
+        candidates.append(candidate)
+
+    kwargs = {
+        "model": model,
+        "messages": [
+            _system_message(system_msg, model),
+            {"role": "user", "content": json.dumps(candidates, ensure_ascii=False)},
+        ],
+        "max_tokens": 32 + 6 * len(items),
+        "temperature": 0,
+    }
+    if api_key:
+        kwargs["api_key"] = api_key
+
+    try:
+        response = await acompletion(**kwargs)
+        if usage is not None:
+            usage.add(response)
+        data = json.loads(_strip_fences(response.choices[0].message.content))
+        keep = {int(i) for i in data["keep"]}
+    except Exception:
+        return [True] * len(items)
+    return [i in keep for i in range(len(items))]
+
+
+def _is_rate_limit(exc: Exception) -> bool:
+    """True if exc is a provider 429 (litellm maps most of them to RateLimitError)."""
+    return isinstance(exc, RateLimitError) or getattr(exc, "status_code", None) == 429
+
+
+def _provider(model: str) -> str:
+    """litellm provider prefix of a model string ("openai/gpt-4o" -> "openai")."""
+    return model.split("/", 1)[0] if "/" in model else "default"
+
+
+class _AdaptiveLimit:
+    """
+    Semaphore whose size adapts to a provider's rate limit (AIMD).
+
+    Every 429 halves the limit; each run of ``limit`` consecutive
+    successes raises it by one, up to the configured ceiling.
+    """
+
+    def __init__(self, ceiling: int):
+        self.ceiling = max(1, ceiling)
+        self.limit = self.ceiling
+        self.in_flight = 0
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def __aexit__(self, *exc) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    async def succeeded(self) -> None:
+        async with self._cond:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.ceiling:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    async def throttled(self) -> None:
+        async with self._cond:
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+
+
+class DraftPool:
+    """
+    Runs generate_draft calls concurrently with per-provider limits.
+
+    Callers submit every draft up front and await the returned tasks in
+    whatever order they want the output in; the pool decides how many
+    requests are actually in flight. A draft that comes back rate-limited
+    shrinks its provider's limit and is retried after a backoff.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, int] | None = None,
+        max_retries: int = DRAFT_MAX_RETRIES,
+        backoff: float = DRAFT_RETRY_BACKOFF_SECONDS,
+        cache: DraftCache | None = None,
+    ):
+        self.cache = cache
+        self.limits = dict(MAX_CONCURRENT_DRAFTS if limits is None else limits)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.retries = 0
+        self.usage = TokenUsage()
+        self._providers: dict[str, _AdaptiveLimit] = {}
+
+    def _limit_for(self, model: str) -> _AdaptiveLimit:
+        provider = _provider(model)
+        limit = self._providers.get(provider)
+        if limit is None:
+            ceiling = self.limits.get(provider, self.limits.get("default", 1))
+            limit = _AdaptiveLimit(ceiling)
+            self._providers[provider] = limit
+        return limit
+
+    async def draft(self, **kwargs) -> EmailDraft:
+        """Generate one draft (same arguments as generate_draft), retrying on 429."""
+        limit = self._limit_for(kwargs.get("model", "openai/gpt-4o"))
+        kwargs.setdefault("cache", self.cache)
+        kwargs.setdefault("usage", self.usage)
+        attempt = 0
+        while True:
+            draft = await self._draft_once(limit, **kwargs)
+            if not draft.rate_limited:
+                await limit.succeeded()
+                return draft
+            await limit.throttled()
+            if attempt >= self.max_retries:
+                return draft
+            attempt += 1
+            self.retries += 1
+            delay = self.backoff * 2 ** (attempt - 1)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+    async def _draft_once(self, limit: _AdaptiveLimit, **kwargs) -> EmailDraft:
+        """One generate_draft call in a slot of limit, without retries."""
+        async with limit:
+            return await generate_draft(**kwargs)
+
+    async def draft_batch(
+        self,
+        company: str,
+        requests: list[DraftRequest],
+        model: str = "openai/gpt-4o",
+        **kwargs,
+    ) -> list[EmailDraft]:
+        """
+        generate_drafts_batch under the pool's limits; rate-limited items are retried.
+
+        This loop is the only retry layer: single-draft fallbacks get a
+        slot each but one attempt, and any that come back rate-limited
+        are retried here with the rest of the batch's throttled items.
+        """
+        limit = self._limit_for(model)
+        kwargs.setdefault("cache", self.cache)
+        kwargs.setdefault("usage", self.usage)
+        drafts: list[EmailDraft | None] = [None] * len(requests)
+        todo = list(range(len(requests)))
+        attempt = 0
+        while True:
+            # The slot covers the batch request only; each fallback redraft
+            # takes a slot of its own
+            results = await generate_drafts_batch(
+                company, [requests[i] for i in todo], model=model,
+                slot=limit, fallback=partial(self._draft_once, limit), **kwargs
+            )
+            for i, draft in zip(todo, results):
+                drafts[i] = draft
+            throttled = [i for i, draft in zip(todo, results) if draft.rate_limited]
+            if not throttled:
+                await limit.succeeded()
+                return drafts
+            await limit.throttled()
+            if attempt >= self.max_retries:
+                return drafts
+            attempt += 1
+            self.retries += 1
+            todo = throttled
+            delay = self.backoff * 2 ** (attempt - 1)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+    def submit(self, **kwargs) -> asyncio.Task[EmailDraft]:
+        """Schedule a draft and return its task; must be called inside a running loop."""
+        return asyncio.create_task(self.draft(**kwargs))
+
+    def submit_batch(
+        self,
+        company: str,
+        requests: list[DraftRequest],
+        batch_size: int = DRAFT_BATCH_SIZE,
+        **kwargs,
+    ) -> asyncio.Task[list[EmailDraft]]:
+        """Schedule one company's drafts in batches of batch_size; the task yields them in order."""
+        async def run() -> list[EmailDraft]:
+            chunks = [requests[i:i + batch_size] for i in range(0, len(requests), batch_size)]
+            results = await asyncio.gather(
+                *(self.draft_batch(company, chunk, **kwargs) for chunk in chunks)
+            )
+            return [draft for chunk in results for draft in chunk]
+
+        return asyncio.create_task(run())
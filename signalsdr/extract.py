@@ -0,0 +1,161 @@
+"""
+SignalSDR HTML Text Extraction.
+
+Turns raw HTML into the page title plus one stripped, non-empty line
+per row of visible text. Two backends, selected by HTML_EXTRACTOR in
+signalsdr.config:
+
+  - "bs4":  BeautifulSoup(html.parser) tree, noise tags decomposed,
+            get_text() — the original implementation
+  - "lxml": lxml parser-target callbacks; no tree is built, noise
+            subtrees (script/style/nav/...) are dropped as they stream
+            past, and lines are emitted while the page is still arriving
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from bs4 import BeautifulSoup
+
+from signalsdr.config import HTML_EXTRACTOR
+
+# Elements that never contain job listings or news items
+NOISE_TAGS = frozenset({"script", "style", "nav", "footer", "header", "noscript", "iframe"})
+
+
+def _split_lines(text: str) -> list[str]:
+    return [line for line in (raw.strip() for raw in text.splitlines()) if line]
+
+
+def _extract_bs4(html: str) -> tuple[str, str]:
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Extract page title
+    title = soup.title.string.strip() if soup.title and soup.title.string else ""
+
+    # Remove noise elements that don't contain job listings
+    for tag in soup(list(NOISE_TAGS)):
+        tag.decompose()
+
+    # Get visible text, collapse whitespace
+    return title, "\n".join(_split_lines(soup.get_text(separator="\n")))
+
+
+class _TextTarget:
+    """lxml parser target that collects visible text lines outside noise tags."""
+
+    def __init__(self):
+        self.lines: list[str] = []
+        self.title = ""
+        self._buffer: list[str] = []
+        self._skip_depth = 0
+        self._title_parts: list[str] | None = None
+        self._title_seen = False
+
+    def _flush(self) -> None:
+        # Text between two tags is one string, as in BeautifulSoup's get_text
+        if self._buffer:
+            self.lines.extend(_split_lines("".join(self._buffer)))
+            self._buffer.clear()
+
+    def start(self, tag: str, attrib: dict) -> None:
+        self._flush()
+        if tag in NOISE_TAGS:
+            self._skip_depth += 1
+        elif tag == "title" and not self._title_seen:
+            self._title_seen = True
+            self._title_parts = []
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        if tag in NOISE_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts).strip()
+            self._title_parts = None
+
+    def data(self, data: str) -> None:
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        if not self._skip_depth:
+            self._buffer.append(data)
+
+    def comment(self, text: str) -> None:
+        self._flush()
+
+    def close(self) -> None:
+        self._flush()
+
+    def drain(self) -> list[str]:
+        lines, self.lines = self.lines, []
+        return lines
+
+
+class StreamingTextExtractor:
+    """
+    Incremental HTML-to-lines extractor (lxml backend).
+
+    Feed chunks of HTML as they arrive; each call returns the text
+    lines completed so far. Call close() once at the end for the rest.
+
+    Usage:
+        extractor = StreamingTextExtractor()
+        for chunk in chunks:
+            lines.extend(extractor.feed(chunk))
+        lines.extend(extractor.close())
+        title = extractor.title
+    """
+
+    def __init__(self):
+        from lxml import etree
+
+        self._target = _TextTarget()
+        self._parser = etree.HTMLParser(target=self._target)
+
+    @property
+    def title(self) -> str:
+        return self._target.title
+
+    def feed(self, chunk: str | bytes) -> list[str]:
+        if chunk:
+            self._parser.feed(chunk)
+        return self._target.drain()
+
+    def close(self) -> list[str]:
+        try:
+            self._parser.close()
+        except Exception:
+            # Empty or truncated documents: keep whatever was collected
+            self._target.close()
+        return self._target.drain()
+
+
+def iter_text_lines(chunks: Iterable[str | bytes]) -> Iterator[str]:
+    """Yield visible text lines from an iterable of HTML chunks (lxml backend)."""
+    extractor = StreamingTextExtractor()
+    for chunk in chunks:
+        yield from extractor.feed(chunk)
+    yield from extractor.close()
+
+
+def extract_text(html: str, backend: str | None = None) -> tuple[str, str]:
+    """
+    Reduce an HTML document to its title and visible text lines.
+
+    Args:
+        html: The raw HTML.
+        backend: "bs4" or "lxml" (defaults to HTML_EXTRACTOR).
+
+    Returns:
+        (title, text) where text has one non-empty stripped line per row.
+    """
+    backend = backend or HTML_EXTRACTOR
+    if backend == "bs4":
+        return _extract_bs4(html)
+    if backend != "lxml":
+        raise ValueError(f"Unknown HTML extractor: {backend!r}")
+
+    extractor = StreamingTextExtractor()
+    lines = extractor.feed(html) + extractor.close()
+    return extractor.title, "\n".join(lines)
@@ -0,0 +1,107 @@
+"""
+SignalSDR HTTP Cache.
+
+On-disk cache of fetched careers/news pages, one small JSON file per
+URL. Each entry keeps the validators the server sent (ETag,
+Last-Modified) so the next fetch can be a conditional GET, plus the
+extracted title/text and a hash of that text so the pipeline can tell
+when a page's content is unchanged and skip analysis and drafting.
+
+Entries are not written by the fetchers themselves: a fetch returns the
+entry it would store (ScraperResult.cache_entry) and the pipeline calls
+put() once the target has been fully processed. A run that dies midway
+therefore never marks an unprocessed page as "already seen".
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from signalsdr.config import HTTP_CACHE_DIR
+
+
+def text_hash(text: str) -> str:
+    """Stable content hash of extracted page text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """Validators and extracted content for one URL."""
+
+    url: str
+    etag: str | None
+    last_modified: str | None
+    text_hash: str
+    title: str
+    text: str
+    fetched_at: str
+
+    @classmethod
+    def from_page(
+        cls,
+        url: str,
+        title: str,
+        text: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CacheEntry:
+        return cls(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            text_hash=text_hash(text),
+            title=title,
+            text=text,
+            fetched_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    def conditional_headers(self) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """URL-keyed page cache stored under cache_dir."""
+
+    def __init__(self, cache_dir: str | Path = HTTP_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the cached entry for url, or None if absent/unreadable."""
+        path = self._path(url)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry if entry.url == url else None
+
+    def put(self, entry: CacheEntry | None) -> None:
+        """Store entry atomically (no-op for None)."""
+        if entry is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(entry), f, ensure_ascii=False)
+            os.replace(tmp, self._path(entry.url))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,131 @@
+"""
+SignalSDR Run Journal.
+
+A company is only marked scanned once all its drafts are written, so a
+run killed halfway (laptop asleep, OneDrive lock) used to leave no
+trace of the pages it had fetched and the drafts it had paid for.
+
+Each run now appends to a journal (data/runs/<timestamp>.jsonl), one
+fsync'd JSON line per completed stage:
+
+    {"event": "analyzed", "kind": "hiring", "domain": ..., "payload": {...}}
+    {"event": "drafted",  "kind": "hiring", "domain": ..., "kept": [...], "drafts": [...]}
+    {"event": "written",  "kind": "hiring", "domain": ...}
+
+``main.py --resume`` reopens the newest journal without a "finish"
+record: companies that were analyzed are not fetched again, drafted
+ones go straight to output, and written ones are left alone. "written"
+is recorded after the company's state updates have run, since they are
+not idempotent (record_scan appends signal rows). A crash between the
+two, inside one flush, replays the company from "drafted", repeating
+its output rows and state updates. A torn last line from a crash
+mid-write is ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from signalsdr.config import JOURNAL_DIR, JOURNAL_KEEP
+
+
+@dataclass
+class JournalEntry:
+    """What an earlier attempt of this run completed for one company."""
+
+    payload: dict  # the source's analysis, enough to rebuild its Candidate
+    kept: list[bool] | None = None  # set once drafted
+    drafts: list[dict] | None = None  # EmailDraft fields, set once drafted
+    written: bool = False
+
+
+class RunJournal:
+    """Append-only, fsync'd record of one pipeline run."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.entries: dict[tuple[str, str], JournalEntry] = {}
+        self.finished = False
+        torn = False
+        if self.path.exists():
+            torn = self._replay()
+        self._file = open(self.path, "a", encoding="utf-8")
+        if torn:
+            # Terminate the partial line so the next record parses
+            self._file.write("\n")
+
+    @classmethod
+    def start(cls, directory: str | Path = JOURNAL_DIR, keep: int = JOURNAL_KEEP, **meta) -> RunJournal:
+        """Begin a new run's journal, pruning the oldest ones."""
+        directory = Path(directory)
+        _prune(directory, keep)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        journal = cls(directory / f"{stamp}.jsonl")
+        journal.record("start", **meta)
+        return journal
+
+    @classmethod
+    def latest_unfinished(cls, directory: str | Path = JOURNAL_DIR) -> RunJournal | None:
+        """Reopen the newest journal whose run never finished, if any."""
+        # Only the newest run is resumable
+        paths = sorted(Path(directory).glob("*.jsonl"))
+        if not paths:
+            return None
+        journal = cls(paths[-1])
+        if journal.finished:
+            journal.close()
+            return None
+        journal.record("resume")
+        return journal
+
+    def record(self, event: str, **fields) -> None:
+        """Append one event and fsync it before returning."""
+        line = json.dumps({"event": event, **fields}, ensure_ascii=False)
+        self._file.write(line + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def resumable(self, kind: str) -> dict[str, JournalEntry]:
+        """Entries from earlier attempts for one source kind, by domain."""
+        return {domain: e for (k, domain), e in self.entries.items() if k == kind}
+
+    def finish(self) -> None:
+        self.record("finish")
+        self.finished = True
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _replay(self) -> bool:
+        """Load earlier events; True if the file ends in a torn line."""
+        line = "\n"
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn write from a crash
+                event = record.get("event")
+                key = (record.get("kind"), record.get("domain"))
+                if event == "finish":
+                    self.finished = True
+                elif event == "analyzed":
+                    self.entries[key] = JournalEntry(payload=record["payload"])
+                elif event == "drafted" and key in self.entries:
+                    self.entries[key].kept = record["kept"]
+                    self.entries[key].drafts = record["drafts"]
+                elif event == "written" and key in self.entries:
+                    self.entries[key].written = True
+        return not line.endswith("\n")
+
+
+def _prune(directory: Path, keep: int) -> None:
+    """Delete all but the newest keep - 1 journals (a new one is about to start)."""
+    journals = sorted(directory.glob("*.jsonl"), reverse=True)
+    for path in journals[max(0, keep - 1):]:
+        path.unlink(missing_ok=True)
@@ -0,0 +1,154 @@
+"""
+SignalSDR Keyword Matcher.
+
+Precompiled multi-keyword matching shared by the hot loops in the
+analyzer (careers pages) and prospector (news pages).
+
+All keywords are folded into one regex shaped like a trie (shared
+prefixes factored out, as in an Aho-Corasick goto graph), matched
+case-sensitively against lower-cased text. The C regex engine runs it
+over a whole page in one linear scan to find candidate lines; only
+lines that hit are checked against the individual keyword patterns to
+report matches in keyword-list order (a single combined match would
+hide overlapping hits).
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import accumulate
+
+
+def _trie_pattern(words: list[str]) -> str:
+    """Regex source matching any of words, with common prefixes factored out."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-word marker
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        alt = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{alt})?" if "" in node else alt
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Case-insensitive matcher for a fixed list of keywords."""
+
+    def __init__(self, keywords: tuple[str, ...] | list[str], word_boundary: bool = True):
+        self.keywords = tuple(keywords)
+        self.word_boundary = word_boundary
+
+        edge = r"\b" if word_boundary else ""
+        self._patterns = [
+            re.compile(edge + re.escape(kw) + edge, re.IGNORECASE) for kw in self.keywords
+        ]
+        # Lower-cased keyword -> first position in the list, to rank combined hits
+        self._rank: dict[str, int] = {}
+        for i, kw in enumerate(self.keywords):
+            self._rank.setdefault(kw.lower(), i)
+
+        # Runs on lower-cased text: much faster than an IGNORECASE alternation
+        self._combined = re.compile(
+            f"{edge}(?:{_trie_pattern(list(self._rank))}){edge}" if self.keywords else r"(?!)"
+        )
+
+    def search(self, line: str) -> bool:
+        """True if any keyword occurs in line."""
+        return self._combined.search(line.lower()) is not None
+
+    def matches(self, line: str) -> list[str]:
+        """All keywords occurring in line, in keyword-list order."""
+        if not self.search(line):
+            return []
+        return [kw for kw, pattern in zip(self.keywords, self._patterns) if pattern.search(line)]
+
+    def first(self, line: str) -> str | None:
+        """The earliest keyword in list order that occurs in line, if any."""
+        ranks = [
+            self._rank.get(m.group(0), len(self.keywords))
+            for m in self._combined.finditer(line.lower())
+        ]
+        if not ranks:
+            return None
+        # A combined hit bounds the answer; only earlier keywords, which the
+        # alternation may have hidden behind an overlapping match, need checking.
+        best = min(ranks)
+        for kw, pattern in zip(self.keywords[:best], self._patterns[:best]):
+            if pattern.search(line):
+                return kw
+        return self.keywords[best] if best < len(self.keywords) else None
+
+    def hit_lines(self, lines: Sequence[str]) -> list[int]:
+        """
+        Indices of lines containing at least one keyword, in ascending order.
+
+        Runs the combined pattern once over the newline-joined page
+        instead of once per line. Lines must not contain newlines
+        (i.e. come from str.splitlines()).
+        """
+        if not lines:
+            return []
+        text = "\n".join(lines)
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Rare case-mappings change length; offsets no longer line up
+            return [i for i, line in enumerate(lines) if self.search(line)]
+
+        starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+        hits: list[int] = []
+        for m in self._combined.finditer(lowered):
+            idx = bisect_right(starts, m.start()) - 1
+            if not hits or hits[-1] != idx:
+                hits.append(idx)
+        return hits
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords)} keywords, word_boundary={self.word_boundary})"
+
+
+class KeywordClassifier:
+    """
+    Map lines to a category via an ordered {keyword: category} table.
+
+    A line's category is that of the first table keyword it contains,
+    matching the "first hit wins" order of the table.
+    """
+
+    def __init__(self, table: dict[str, str], word_boundary: bool = False):
+        self.table = dict(table)
+        self.matcher = KeywordMatcher(tuple(self.table), word_boundary=word_boundary)
+
+    def classify(self, line: str) -> str | None:
+        """Category of the first keyword found in line, or None."""
+        keyword = self.matcher.first(line)
+        return self.table[keyword] if keyword is not None else None
+
+    def classify_lines(self, lines: Sequence[str]) -> list[tuple[int, str]]:
+        """(line index, category) for every line that has a keyword, in order."""
+        return [(idx, self.classify(lines[idx])) for idx in self.matcher.hit_lines(lines)]
+
+
+@lru_cache(maxsize=32)
+def get_matcher(keywords: tuple[str, ...], word_boundary: bool = True) -> KeywordMatcher:
+    """Return a cached KeywordMatcher for this keyword set."""
+    return KeywordMatcher(keywords, word_boundary=word_boundary)
+
+
+@lru_cache(maxsize=8)
+def _get_classifier(items: tuple[tuple[str, str], ...], word_boundary: bool) -> KeywordClassifier:
+    return KeywordClassifier(dict(items), word_boundary=word_boundary)
+
+
+def get_classifier(table: dict[str, str], word_boundary: bool = False) -> KeywordClassifier:
+    """Return a cached KeywordClassifier for this keyword table."""
+    return _get_classifier(tuple(table.items()), word_boundary)
@@ -6,20 +6,31 @@ SignalSDR Output Module (Feature C from spec).
 Writes results to drafts_output.csv and optionally sends
 Slack notifications via webhook. The agent never sends emails
 directly - it only writes drafts for human review.
+
+The pipeline writes through OutputSink, which buffers drafts and
+flushes them to the CSV/markdown files in batches, and posts Slack
+notifications from a background queue. The per-draft append_* and
+send_slack_notification functions remain for one-off use.
 """
 
+import asyncio
 import csv
+import io
 import json
 import os
 import smtplib
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import partial
 from pathlib import Path
 
+import httpx
 import requests
 
+from signalsdr.config import OUTPUT_FLUSH_EVERY, SLACK_BATCH_SIZE
 from signalsdr.drafter import EmailDraft
 
 
@@ -60,17 +71,21 @@ def append_to_csv(
         if not file_exists:
             writer.writeheader()
 
-        writer.writerow({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "signal_type": draft.signal_type,
-            "company": draft.company,
-            "role_detected": draft.role,
-            "draft_subject": draft.subject_line or "",
-            "draft_body": draft.body or "",
-            "status": "PENDING_REVIEW" if draft.is_valid else "DRAFT_FAILED",
-            "model": draft.model,
-            "url": url,
-        })
+        writer.writerow(_csv_row(draft, url))
+
+
+def _csv_row(draft: EmailDraft, url: str) -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "signal_type": draft.signal_type,
+        "company": draft.company,
+        "role_detected": draft.role,
+        "draft_subject": draft.subject_line or "",
+        "draft_body": draft.body or "",
+        "status": "PENDING_REVIEW" if draft.is_valid else "DRAFT_FAILED",
+        "model": draft.model,
+        "url": url,
+    }
 
 
 def append_to_markdown(
@@ -80,19 +95,27 @@ def append_to_markdown(
 ) -> None:
     """Append a draft as a readable markdown section."""
     output_path = Path(output_path)
-    ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     is_new = not output_path.exists()
 
     with open(output_path, "a", encoding="utf-8") as f:
         if is_new:
-            f.write("# SignalSDR Drafts\n\n")
+            f.write(MARKDOWN_HEADER)
+        f.write(_markdown_section(draft, url))
 
-        badge = f" `[{draft.signal_type}]`" if draft.signal_type != "hiring" else ""
-        f.write(f"## {draft.company} — {draft.role}{badge}\n")
-        f.write(f"**Subject:** {draft.subject_line}\n\n")
-        f.write(f"{draft.body}\n\n")
-        f.write(f"*{ts} | {draft.model} | [source]({url})*\n\n")
-        f.write("---\n\n")
+
+MARKDOWN_HEADER = "# SignalSDR Drafts\n\n"
+
+
+def _markdown_section(draft: EmailDraft, url: str) -> str:
+    ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    badge = f" `[{draft.signal_type}]`" if draft.signal_type != "hiring" else ""
+    return (
+        f"## {draft.company} — {draft.role}{badge}\n"
+        f"**Subject:** {draft.subject_line}\n\n"
+        f"{draft.body}\n\n"
+        f"*{ts} | {draft.model} | [source]({url})*\n\n"
+        "---\n\n"
+    )
 
 
 def send_slack_notification(
@@ -113,11 +136,7 @@ def send_slack_notification(
     if not webhook_url:
         return False
 
-    text = (
-        f"Signal Detected: {draft.company} is hiring a {draft.role}.\n"
-        f"Subject: {draft.subject_line}\n"
-        f"Status: {'Draft Created' if draft.is_valid else 'Draft Failed'}"
-    )
+    text = _slack_text([draft])
 
     try:
         resp = requests.post(
@@ -130,6 +149,212 @@ def send_slack_notification(
         return False
 
 
+def _slack_text(drafts: list[EmailDraft]) -> str:
+    """Notification text for one draft, or a digest of several from one company."""
+    if len(drafts) == 1:
+        draft = drafts[0]
+        return (
+            f"Signal Detected: {draft.company} is hiring a {draft.role}.\n"
+            f"Subject: {draft.subject_line}\n"
+            f"Status: {'Draft Created' if draft.is_valid else 'Draft Failed'}"
+        )
+    lines = [f"Signals Detected: {drafts[0].company} — {len(drafts)} drafts created"]
+    lines += [f"• {d.role}\n   Subject: {d.subject_line}" for d in drafts]
+    return "\n".join(lines)
+
+
+def _append_block(path: Path, block: str, header: str = "") -> None:
+    """
+    Append block to path with a single write, then fsync it.
+
+    A file that doesn't exist yet is created with header + block through
+    a temporary file and a rename, so no reader sees it without its
+    header. After that a batch costs one write however large the file
+    has grown; a crash mid-write can leave a torn last row.
+    """
+    if path.exists():
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            f.write(block)
+            f.flush()
+            os.fsync(f.fileno())
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+            f.write(header)
+            f.write(block)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class OutputSink:
+    """
+    Buffered destination for pipeline drafts.
+
+    add() never blocks the event loop: rows and markdown sections are
+    kept in memory and every flush_every drafts are written, as one
+    append per file, by a worker thread. Valid drafts are
+    grouped per company (up to slack_batch_size per message) and posted
+    to Slack by a background task. defer() holds follow-up work, such as
+    marking a company scanned, until that company's drafts are on disk.
+
+    Use as an async context manager; leaving the block, normally or by
+    an exception, flushes the files and drains the Slack queue.
+    """
+
+    def __init__(
+        self,
+        csv_path: str | Path = "drafts_output.csv",
+        md_path: str | Path = "drafts_output.md",
+        webhook_url: str | None = None,
+        flush_every: int = OUTPUT_FLUSH_EVERY,
+        slack_batch_size: int = SLACK_BATCH_SIZE,
+    ):
+        self.csv_path = Path(csv_path)
+        self.md_path = Path(md_path)
+        self.webhook_url = webhook_url or os.environ.get("SLACK_WEBHOOK_URL")
+        self.flush_every = max(1, flush_every)
+        self.slack_batch_size = max(1, slack_batch_size)
+        self.written = 0
+        self.slack_sent = 0
+        self._rows: list[dict] = []
+        self._sections: list[str] = []
+        self._deferred: list[partial] = []
+        self._slack_pending: list[EmailDraft] = []
+        self._slack_queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._slack_worker: asyncio.Task | None = None
+        self._flush_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> OutputSink:
+        if self.webhook_url:
+            self._slack_worker = asyncio.create_task(self._post_slack())
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def add(self, draft: EmailDraft, url: str) -> None:
+        """Buffer one draft for the CSV/markdown files and Slack."""
+        self._rows.append(_csv_row(draft, url))
+        self._sections.append(_markdown_section(draft, url))
+        if len(self._rows) >= self.flush_every:
+            await self.flush_async()
+
+        if self.webhook_url and draft.is_valid:
+            if self._slack_pending and self._slack_pending[0].company != draft.company:
+                self._queue_slack()
+            self._slack_pending.append(draft)
+            if len(self._slack_pending) >= self.slack_batch_size:
+                self._queue_slack()
+
+    def defer(self, callback, *args, **kwargs) -> None:
+        """Call callback(*args, **kwargs) once every draft added so far is written."""
+        if self._rows or self._flush_lock.locked():
+            self._deferred.append(partial(callback, *args, **kwargs))
+        else:
+            callback(*args, **kwargs)
+
+    def flush(self) -> None:
+        """Write buffered rows and sections to disk, then run deferred callbacks."""
+        rows, sections, deferred = self._take()
+        if rows:
+            self._write(rows, sections)
+        for callback in deferred:
+            callback()
+
+    async def flush_async(self) -> None:
+        """flush() with the file writes done in a worker thread, off the event loop."""
+        async with self._flush_lock:
+            rows, sections, deferred = self._take()
+            if rows:
+                await asyncio.to_thread(self._write, rows, sections)
+            for callback in deferred:
+                callback()
+
+    def _take(self) -> tuple[list[dict], list[str], list[partial]]:
+        """Hand over the buffered rows, sections and deferred callbacks, emptying the buffers."""
+        taken = self._rows, self._sections, self._deferred
+        self._rows, self._sections, self._deferred = [], [], []
+        return taken
+
+    def _write(self, rows: list[dict], sections: list[str]) -> None:
+        header, block = io.StringIO(), io.StringIO()
+        csv.DictWriter(header, fieldnames=OUTPUT_CSV_HEADERS).writeheader()
+        csv.DictWriter(block, fieldnames=OUTPUT_CSV_HEADERS).writerows(rows)
+
+        _append_block(self.csv_path, block.getvalue(), header.getvalue())
+        _append_block(self.md_path, "".join(sections), MARKDOWN_HEADER)
+        self.written += len(rows)
+
+    def _queue_slack(self) -> None:
+        if self._slack_pending:
+            self._slack_queue.put_nowait(_slack_text(self._slack_pending))
+            self._slack_pending = []
+
+    async def _post_slack(self) -> None:
+        async with httpx.AsyncClient(timeout=10) as client:
+            while (text := await self._slack_queue.get()) is not None:
+                try:
+                    resp = await client.post(self.webhook_url, json={"text": text})
+                    if resp.status_code == 200:
+                        self.slack_sent += 1
+                except httpx.HTTPError:
+                    pass
+
+    async def close(self) -> None:
+        """Flush files and wait for queued Slack messages to go out."""
+        await self.flush_async()
+        if self._slack_worker is not None:
+            self._queue_slack()
+            self._slack_queue.put_nowait(None)
+            await self._slack_worker
+            self._slack_worker = None
+
+
+def merge_draft_files(
+    csv_parts: list[Path],
+    md_parts: list[Path],
+    csv_path: str | Path = "drafts_output.csv",
+    md_path: str | Path = "drafts_output.md",
+) -> dict[str, int]:
+    """
+    Append other runs' drafts CSV and markdown files (e.g. shards) to the main ones.
+
+    Missing parts are skipped. Each destination file gets all its parts
+    in a single append.
+
+    Returns:
+        Number of drafts merged per signal_type.
+    """
+    rows: list[dict] = []
+    for part in csv_parts:
+        if Path(part).exists():
+            with open(part, newline="", encoding="utf-8") as f:
+                rows.extend(csv.DictReader(f))
+    sections = [
+        Path(part).read_text(encoding="utf-8").removeprefix(MARKDOWN_HEADER)
+        for part in md_parts if Path(part).exists()
+    ]
+
+    if rows:
+        header, block = io.StringIO(), io.StringIO()
+        csv.DictWriter(header, fieldnames=OUTPUT_CSV_HEADERS).writeheader()
+        csv.DictWriter(block, fieldnames=OUTPUT_CSV_HEADERS, extrasaction="ignore").writerows(rows)
+        _append_block(Path(csv_path), block.getvalue(), header.getvalue())
+    if sections:
+        _append_block(Path(md_path), "".join(sections), MARKDOWN_HEADER)
+
+    counts: dict[str, int] = {}
+    for row in rows:
+        counts[row["signal_type"]] = counts.get(row["signal_type"], 0) + 1
+    return counts
+
+
 def send_email_report(
     stats: dict,
     md_path: str | Path = "drafts_output.md",
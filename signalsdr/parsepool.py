@@ -0,0 +1,129 @@
+"""
+SignalSDR Parse Pool.
+
+Text extraction (BeautifulSoup or lxml) and the keyword scans of
+analyze_text and the news-page classifier are CPU-bound and hold the
+GIL, so with many pages in flight the event loop spends its time
+parsing and fetches queue up behind it.
+
+A ParsePool with workers hands each fetched body (a RawPage from
+AsyncFetcher.fetch_raw) to a ProcessPoolExecutor, which returns the
+ScraperResult together with its AnalysisResult or ProspectResult.
+Only bytes go out and text and signals come back, so the cost per page
+is one pickle each way. With no workers, pages are parsed in the event
+loop as before (streamed, when HTML_EXTRACTOR is "lxml").
+
+Usage:
+    with ParsePool(workers=4) as parser:
+        result, analysis = await parser.careers(fetcher, url, company, seen)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from signalsdr.analyzer import AnalysisResult, analyze_text
+from signalsdr.config import PARSE_WORKERS
+from signalsdr.prospector import ProspectResult, classify_news_page, scrape_news_page_async
+from signalsdr.scraper import AsyncFetcher, RawPage, ScraperResult, parse_raw_page
+
+
+def parse_careers_page(
+    page: RawPage,
+    company: str,
+    seen_fingerprints: set[str] | None = None,
+) -> tuple[ScraperResult, AnalysisResult | None]:
+    """Extract and analyze a careers page (no analysis if its text is unchanged)."""
+    result = parse_raw_page(page)
+    if result.unchanged:
+        return result, None
+    return result, analyze_text(result.text, page.url, company, seen_fingerprints=seen_fingerprints)
+
+
+def parse_news_page(page: RawPage, company: str, domain: str) -> ProspectResult:
+    """Extract a news page and classify its lines into prospect signals."""
+    return classify_news_page(company, domain, page.url, parse_raw_page(page))
+
+
+class ParsePool:
+    """
+    Parses and analyzes fetched pages in worker processes.
+
+    Workers are started with "spawn" rather than fork: the parent has
+    threads (SQLite stores, litellm) whose locks a forked child could
+    inherit held.
+
+    Args:
+        workers: Worker processes; 0 parses in the calling event loop,
+            None uses os.cpu_count().
+    """
+
+    def __init__(self, workers: int | None = PARSE_WORKERS):
+        self.workers = workers
+        self._executor = None
+        if workers != 0:
+            context = multiprocessing.get_context("spawn")
+            self._executor = ProcessPoolExecutor(workers, mp_context=context)
+
+    def __enter__(self) -> ParsePool:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def careers(
+        self,
+        fetcher: AsyncFetcher,
+        url: str,
+        company: str,
+        seen_fingerprints: set[str] | None = None,
+    ) -> tuple[ScraperResult, AnalysisResult | None]:
+        """
+        Fetch, extract and analyze one careers page.
+
+        Args:
+            fetcher: Shared AsyncFetcher (its cache applies).
+            url: The careers page URL.
+            company: Company name (for tracking).
+            seen_fingerprints: Fingerprints from the previous scan to suppress.
+
+        Returns:
+            (ScraperResult, AnalysisResult); the analysis is None if the
+            fetch failed or the page is unchanged since the last scan.
+        """
+        if self._executor is None:
+            result = await fetcher.fetch(url)
+            if not result.success or result.unchanged:
+                return result, None
+            analysis = analyze_text(result.text, url, company, seen_fingerprints=seen_fingerprints)
+            return result, analysis
+
+        page = await fetcher.fetch_raw(url)
+        if isinstance(page, ScraperResult):
+            return page, None
+        return await self.run(parse_careers_page, page, company, seen_fingerprints)
+
+    async def news(
+        self, fetcher: AsyncFetcher, company: str, domain: str, news_url: str
+    ) -> ProspectResult:
+        """Fetch and classify a company's news page (see scrape_news_page_async)."""
+        if self._executor is None:
+            return await scrape_news_page_async(company, domain, news_url, fetcher=fetcher)
+
+        page = await fetcher.fetch_raw(news_url)
+        if isinstance(page, ScraperResult):
+            return classify_news_page(company, domain, news_url, page)
+        return await self.run(parse_news_page, page, company, domain)
+
+    async def run(self, fn, *args):
+        """Run fn(*args) on a worker (inline without workers); fn must be picklable."""
+        if self._executor is None:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
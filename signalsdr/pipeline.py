@@ -0,0 +1,337 @@
+"""
+SignalSDR Pipeline Stages.
+
+A run is a chain of stages connected by bounded queues:
+
+    plan -> fetch -> analyze  (one source per signal type, in main.py)
+         -> triage -> draft -> sink  (shared, here)
+
+Sources (hiring careers pages, prospect Brave/news) run concurrently
+and put one Candidate per company with signals onto the triage queue.
+The downstream stages don't care which source a candidate came from:
+triage screens whatever has arrived in batches per kind, drafting hands
+each company to the shared DraftPool, and the sink writes drafts in
+arrival order and defers each company's state updates until its drafts
+are on disk. Full queues push back on the stages before them, so a
+slow LLM provider throttles fetching instead of piling up pages.
+
+With a RunJournal, the stages record each company as it is analyzed,
+drafted and written, and replay() feeds an interrupted run's companies
+back in at the stage they had reached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from typing import TypeVar
+
+from signalsdr.config import PIPELINE_QUEUE_SIZE, TRIAGE_BATCH_SIZE, TRIAGE_LINGER_SECONDS
+from signalsdr.drafter import (
+    DraftPool,
+    DraftRequest,
+    EmailDraft,
+    TokenUsage,
+    TriageItem,
+    triage_signals,
+)
+from signalsdr.journal import RunJournal
+from signalsdr.output import OutputSink
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class Candidate:
+    """One company's signals on their way from a source to the sink."""
+
+    kind: str  # "hiring" or "prospect" — selects the triage prompt
+    company: str
+    domain: str
+    items: list[TriageItem]  # one per signal, for triage
+    requests: list[DraftRequest]  # parallel to items
+    urls: list[str]  # output URL per signal
+    labels: list[str]  # how each signal is named in the log
+    rejected: str  # why triage/LLM rejections were dropped, for the log
+    stats: dict[str, int]  # the source's counters (drafts, filtered, errors)
+    # JSON the source built this candidate from, for the run journal
+    payload: dict = field(default_factory=dict)
+    # (callback, args, kwargs) to run once the drafts are on disk
+    commits: list[tuple] = field(default_factory=list)
+    # Same, but only if every draft succeeded (see commit_if_drafted)
+    drafted_commits: list[tuple] = field(default_factory=list)
+    kept: list[bool] = field(default_factory=list)
+    task: asyncio.Task[list[EmailDraft]] | None = None
+    drafts: list[EmailDraft] | None = None  # already drafted (resumed run)
+    resumed: bool = False
+
+    def commit(self, callback: Callable, *args, **kwargs) -> None:
+        """Run callback after this company's drafts are flushed (see OutputSink.defer)."""
+        self.commits.append((callback, args, kwargs))
+
+    def commit_if_drafted(self, callback: Callable, *args, **kwargs) -> None:
+        """
+        Like commit(), but skipped if any of this company's drafts failed.
+
+        For updates that mark the signals as handled (HTTP cache entries,
+        line fingerprints): after a failed draft they are left as they
+        were, so the next scan finds the same signals again.
+        """
+        self.drafted_commits.append((callback, args, kwargs))
+
+
+# A source stage: fetches and analyzes its targets, puts Candidates on
+# the queue, and returns its stats
+Source = Callable[[asyncio.Queue], Awaitable[dict]]
+
+
+async def run_stages(
+    sources: list[Source],
+    pool: DraftPool,
+    sink: OutputSink,
+    model: str,
+    triage: bool = True,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+    journal: RunJournal | None = None,
+) -> list[dict]:
+    """
+    Run sources concurrently into the shared triage -> draft -> sink stages.
+
+    Args:
+        sources: Source stages, e.g. hiring and prospect.
+        pool: DraftPool shared by every source.
+        sink: Where drafts are written.
+        model: litellm model string for triage and drafting.
+        triage: Screen candidates with triage_signals before drafting.
+        queue_size: Max candidates buffered between two stages.
+        journal: Optional RunJournal to record each company's progress in.
+
+    Returns:
+        Each source's stats, in the order of sources.
+    """
+    to_triage: asyncio.Queue[Candidate | None] = asyncio.Queue(queue_size)
+    to_draft: asyncio.Queue[Candidate | None] = asyncio.Queue(queue_size)
+    to_sink: asyncio.Queue[Candidate | None] = asyncio.Queue(queue_size)
+
+    async def produce() -> list[dict]:
+        stats = await asyncio.gather(*(source(to_triage) for source in sources))
+        await to_triage.put(None)
+        return list(stats)
+
+    # A failing stage cancels the others; the sink's context manager
+    # still flushes whatever was already added
+    async with asyncio.TaskGroup() as group:
+        produced = group.create_task(produce())
+        group.create_task(triage_stage(to_triage, to_draft, model, pool.usage, triage, journal=journal))
+        group.create_task(draft_stage(to_draft, to_sink, pool, model))
+        group.create_task(sink_stage(to_sink, sink, journal))
+    return produced.result()
+
+
+async def triage_stage(
+    inbox: asyncio.Queue,
+    outbox: asyncio.Queue,
+    model: str,
+    usage: TokenUsage | None = None,
+    enabled: bool = True,
+    batch_size: int = TRIAGE_BATCH_SIZE,
+    linger: float = TRIAGE_LINGER_SECONDS,
+    journal: RunJournal | None = None,
+) -> None:
+    """Screen candidates in batches (one triage_signals call per kind) and pass them on in order."""
+    done = False
+    while not done:
+        if enabled:
+            batch, done = await _collect(inbox, batch_size, linger)
+        else:
+            candidate = await inbox.get()
+            done = candidate is None
+            batch = [] if done else [candidate]
+
+        if journal is not None:
+            for c in batch:
+                if not c.resumed:
+                    journal.record("analyzed", kind=c.kind, domain=c.domain, payload=c.payload)
+
+        # Candidates drafted before a resume keep their earlier verdicts
+        pending = [c for c in batch if c.drafts is None]
+        if enabled:
+            kinds = sorted({c.kind for c in pending})
+            verdicts = await asyncio.gather(*(
+                triage_signals(
+                    [item for c in pending if c.kind == kind for item in c.items],
+                    model, kind=kind, batch_size=batch_size, usage=usage,
+                )
+                for kind in kinds
+            ))
+            for kind, keep in zip(kinds, verdicts):
+                keep = iter(keep)
+                for c in pending:
+                    if c.kind == kind:
+                        c.kept = [next(keep) for _ in c.items]
+        else:
+            for c in pending:
+                c.kept = [True] * len(c.items)
+
+        for c in batch:
+            await outbox.put(c)
+    await outbox.put(None)
+
+
+async def _collect(
+    inbox: asyncio.Queue, max_items: int, linger: float
+) -> tuple[list[Candidate], bool]:
+    """
+    The next batch from inbox, and whether the end was reached.
+
+    Waits for one candidate, then up to linger seconds for more until
+    the batch holds max_items signals.
+    """
+    first = await inbox.get()
+    if first is None:
+        return [], True
+    batch, size = [first], len(first.items)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + linger
+    while size < max_items:
+        try:
+            remaining = deadline - loop.time()
+            if remaining > 0:
+                candidate = await asyncio.wait_for(inbox.get(), remaining)
+            else:
+                candidate = inbox.get_nowait()
+        except (TimeoutError, asyncio.QueueEmpty):
+            break
+        if candidate is None:
+            return batch, True
+        batch.append(candidate)
+        size += len(candidate.items)
+    return batch, False
+
+
+async def draft_stage(
+    inbox: asyncio.Queue,
+    outbox: asyncio.Queue,
+    pool: DraftPool,
+    model: str,
+) -> None:
+    """Submit each candidate's kept signals to the pool; drafting runs in the background."""
+    while (candidate := await inbox.get()) is not None:
+        requests = [r for r, k in zip(candidate.requests, candidate.kept) if k]
+        if requests and candidate.drafts is None:
+            candidate.task = pool.submit_batch(candidate.company, requests, model=model)
+        await outbox.put(candidate)
+    await outbox.put(None)
+
+
+async def sink_stage(inbox: asyncio.Queue, sink: OutputSink, journal: RunJournal | None = None) -> None:
+    """Write each candidate's drafts in arrival order and defer its state updates."""
+    while (candidate := await inbox.get()) is not None:
+        stats = candidate.stats
+        if candidate.drafts is None:
+            candidate.drafts = await candidate.task if candidate.task else []
+            # A failed draft is retried on resume, so only journal complete sets
+            if journal is not None and all(d.success for d in candidate.drafts):
+                journal.record(
+                    "drafted", kind=candidate.kind, domain=candidate.domain,
+                    kept=candidate.kept, drafts=[asdict(d) for d in candidate.drafts],
+                )
+        drafts = iter(candidate.drafts)
+        print(f"  Drafts for {candidate.company} ({candidate.kind}):")
+
+        for label, url, k in zip(candidate.labels, candidate.urls, candidate.kept):
+            if not k:
+                print(f"    Filtered by triage ({candidate.rejected}): {label}")
+                stats["filtered"] += 1
+                continue
+
+            draft = next(drafts)
+
+            if draft.is_valid:
+                print(f"    Draft: \"{draft.subject_line}\"")
+                stats["drafts"] += 1
+                await sink.add(draft, url)
+            elif draft.success and not draft.is_valid:
+                print(f"    Filtered by LLM ({candidate.rejected}): {label}")
+                stats["filtered"] += 1
+            else:
+                print(f"    Draft failed: {draft.error}")
+                stats["errors"] += 1
+
+        # Mark the company scanned only once its drafts are on disk, and
+        # journal it as written only once that is done: replay never
+        # reruns the state updates of a written company
+        commits = candidate.commits
+        if all(d.success for d in candidate.drafts):
+            commits = commits + candidate.drafted_commits
+        for callback, args, kwargs in commits:
+            sink.defer(callback, *args, **kwargs)
+        if journal is not None:
+            sink.defer(journal.record, "written", kind=candidate.kind, domain=candidate.domain)
+
+
+async def replay(
+    journal: RunJournal | None,
+    kind: str,
+    build: Callable[[dict], Candidate],
+    outbox: asyncio.Queue,
+) -> set[str]:
+    """
+    Feed an interrupted run's companies of one kind back into the stages.
+
+    Written companies are done (their state updates ran before the
+    record) and are only counted; drafted ones skip triage and drafting;
+    analyzed ones skip fetching. Each counts as scanned in the source's
+    stats.
+
+    Args:
+        journal: The resumed run's journal (None: nothing to replay).
+        kind: Source kind, e.g. "hiring".
+        build: Rebuilds a Candidate from its journaled payload.
+        outbox: The triage queue.
+
+    Returns:
+        Domains replayed, which the source must not scan again.
+    """
+    entries = journal.resumable(kind) if journal is not None else {}
+    for entry in entries.values():
+        candidate = build(entry.payload)
+        candidate.resumed = True
+        candidate.stats["scanned"] += 1
+        candidate.stats["signals"] += len(candidate.items)
+        if entry.written:
+            continue
+        if entry.drafts is not None:
+            candidate.kept = entry.kept
+            candidate.drafts = [EmailDraft(**d) for d in entry.drafts]
+        await outbox.put(candidate)
+    if entries:
+        print(f"  Resumed {len(entries)} {kind} compan{'y' if len(entries) == 1 else 'ies'} from {journal.path}")
+    return set(entries)
+
+
+async def prefetch(
+    items: Iterable[T],
+    start: Callable[[T], Awaitable[R]],
+    window: int = PIPELINE_QUEUE_SIZE,
+) -> AsyncIterator[tuple[T, R]]:
+    """
+    Yield (item, await start(item)) in input order, with up to window
+    items started ahead of the consumer so fetches overlap.
+    """
+    pending: list[tuple[T, asyncio.Task[R]]] = []
+    items = iter(items)
+    try:
+        for item in items:
+            pending.append((item, asyncio.ensure_future(start(item))))
+            if len(pending) >= window:
+                item, task = pending.pop(0)
+                yield item, await task
+        while pending:
+            item, task = pending.pop(0)
+            yield item, await task
+    finally:
+        for _, task in pending:
+            task.cancel()
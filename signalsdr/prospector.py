@@ -6,22 +6,52 @@ SignalSDR Prospector Module.
 Two signal sources:
   1. Brave Search API — searches the web for business signals
   2. News page scraping — fetches company blogs/newsrooms directly
+
+Each has an async-native API (``*_async``, httpx) for the pipeline and
+the nanobot tools, and the original blocking functions (requests) as
+sync wrappers sharing the same parsing.
 """
 
+import asyncio
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from signalsdr.config import (
     NEWS_PAGE_KEYWORDS,
     PROSPECT_CATEGORIES,
     PROSPECT_FRESHNESS,
     PROSPECT_MAX_RESULTS,
+    PROSPECT_QUERY_GROUPS,
+    PROSPECT_QUERY_MODE,
     REQUEST_TIMEOUT_SECONDS,
 )
+from signalsdr.httpcache import CacheEntry, HttpCache
+from signalsdr.matcher import get_classifier, get_matcher
+from signalsdr.ratelimit import api_limiter
+from signalsdr.scraper import AsyncFetcher, ScraperResult, fetch_page, fetch_page_async
+from signalsdr.searchcache import get_search_cache
+
+BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
+
+# Brave returns at most 20 results per query
+_BRAVE_MAX_COUNT = 20
+
+# WLTP / emissions disclaimers (e.g., "WLTP combined: Energy consumption...")
+_EMISSIONS_DISCLAIMER = re.compile(r"kWh/100\s?km|g/km|CO₂|WLTP|NEDC")
+
+# Generic site chrome / image captions
+_CHROME_PHRASES = (
+    "browse below", "download the right", "cookie", "privacy policy",
+    "terms of use", "all rights reserved", "subscribe to",
+)
 
 
 @dataclass
@@ -43,6 +73,11 @@ class ProspectResult:
     signals: list[ProspectSignal] = field(default_factory=list)
     success: bool = True
     error: str = ""
+    unchanged: bool = False  # news page text identical to the cached copy
+    cache_entry: CacheEntry | None = None  # store after processing (news pages)
+    # Seconds per Brave query (keyed by its categories joined with "+"),
+    # including its wait for the rate limit
+    timings: dict[str, float] = field(default_factory=dict)
 
     @property
     def has_signals(self) -> bool:
@@ -52,38 +87,123 @@ class ProspectResult:
 def search_brave(
     query: str,
     api_key: str,
-    freshness: str = PROSPECT_FRESHNESS,
+    freshness: str | None = PROSPECT_FRESHNESS,
     count: int = PROSPECT_MAX_RESULTS,
 ) -> list[dict]:
     """
     Query the Brave Search API and return raw result items.
 
+    Results are served from the shared search cache when a fresh copy
+    exists, and identical searches already in flight are awaited rather
+    than repeated (see signalsdr.searchcache).
+
     Args:
         query: The search query string.
         api_key: Brave Search API key.
-        freshness: Time filter (pd=past day, pw=past week, pm=past month).
+        freshness: Time filter (pd=past day, pw=past week, pm=past month),
+            or None for no filter.
         count: Maximum number of results.
 
     Returns:
         List of result dicts with 'title', 'description', 'url' keys.
     """
-    resp = requests.get(
-        "https://api.search.brave.com/res/v1/web/search",
-        headers={
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "X-Subscription-Token": api_key,
-        },
-        params={
-            "q": query,
-            "freshness": freshness,
-            "count": count,
-        },
-        timeout=REQUEST_TIMEOUT_SECONDS,
-    )
-    resp.raise_for_status()
-    data = resp.json()
+    def fetch() -> list[dict]:
+        api_limiter("brave").acquire()
+        resp = _brave_session().get(
+            BRAVE_SEARCH_URL,
+            headers=_brave_headers(api_key),
+            params=_brave_params(query, freshness, count),
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        resp.raise_for_status()
+        return _brave_results(resp.json())
+
+    cache = get_search_cache()
+    if cache is None:
+        return fetch()
+    return cache.get_or_fetch(query, freshness, count, fetch)
+
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _brave_session() -> requests.Session:
+    """Process-wide keep-alive session for search_brave (thread-safe for GETs)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(pool_maxsize=len(PROSPECT_CATEGORIES)))
+        return _session
+
+
+def brave_client() -> httpx.AsyncClient:
+    """Keep-alive client for search_brave_async; close it (or use async with) when done."""
+    return httpx.AsyncClient(timeout=REQUEST_TIMEOUT_SECONDS)
+
 
+async def search_brave_async(
+    query: str,
+    api_key: str,
+    freshness: str | None = PROSPECT_FRESHNESS,
+    count: int = PROSPECT_MAX_RESULTS,
+    client: httpx.AsyncClient | None = None,
+) -> list[dict]:
+    """
+    Async search_brave: waits on the shared Brave rate limit without blocking,
+    and shares its result cache.
+
+    Args:
+        query: The search query string.
+        api_key: Brave Search API key.
+        freshness: Time filter (pd=past day, pw=past week, pm=past month),
+            or None for no filter.
+        count: Maximum number of results.
+        client: Shared client from brave_client() (a one-off client if None).
+
+    Returns:
+        List of result dicts with 'title', 'description', 'url' keys.
+
+    Raises:
+        httpx.HTTPError: On transport errors or a non-2xx response.
+    """
+    if client is None:
+        async with brave_client() as own_client:
+            return await search_brave_async(query, api_key, freshness, count, own_client)
+
+    async def fetch() -> list[dict]:
+        await api_limiter("brave").acquire_async()
+        resp = await client.get(
+            BRAVE_SEARCH_URL,
+            headers=_brave_headers(api_key),
+            params=_brave_params(query, freshness, count),
+        )
+        resp.raise_for_status()
+        return _brave_results(resp.json())
+
+    cache = get_search_cache()
+    if cache is None:
+        return await fetch()
+    return await cache.get_or_fetch_async(query, freshness, count, fetch)
+
+
+def _brave_params(query: str, freshness: str | None, count: int) -> dict:
+    params = {"q": query, "count": count}
+    if freshness:
+        params["freshness"] = freshness
+    return params
+
+
+def _brave_headers(api_key: str) -> dict[str, str]:
+    return {
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip",
+        "X-Subscription-Token": api_key,
+    }
+
+
+def _brave_results(data: dict) -> list[dict]:
     results = []
     for item in data.get("web", {}).get("results", []):
         results.append({
@@ -94,11 +214,104 @@ def search_brave(
     return results
 
 
+@dataclass
+class PlannedQuery:
+    """One Brave query covering one or more prospect categories."""
+
+    categories: list[str]
+    query: str
+    count: int
+
+    @property
+    def label(self) -> str:
+        return "+".join(self.categories)
+
+
+def _category_terms(category: str) -> list[str]:
+    """The OR'd search terms of a PROSPECT_CATEGORIES template, without the company."""
+    template = PROSPECT_CATEGORIES[category].replace('"{company}"', "")
+    return [term.strip() for term in template.split(" OR ") if term.strip()]
+
+
+def plan_queries(
+    company: str,
+    categories: list[str] | None = None,
+    mode: str = PROSPECT_QUERY_MODE,
+) -> list[PlannedQuery]:
+    """
+    Brave queries for the requested categories (defaults to all).
+
+    "per_category" mode is one query per category. "combined" mode ORs
+    together the terms of each PROSPECT_QUERY_GROUPS group (restricted
+    to the requested categories) into one query, asking for as many
+    results as the separate queries would have returned in total.
+    """
+    cats = [c for c in (categories or list(PROSPECT_CATEGORIES)) if c in PROSPECT_CATEGORIES]
+    if mode == "per_category":
+        groups = [[cat] for cat in cats]
+    elif mode == "combined":
+        grouped = {cat for group in PROSPECT_QUERY_GROUPS for cat in group}
+        groups = [[c for c in group if c in cats] for group in PROSPECT_QUERY_GROUPS]
+        groups = [g for g in groups if g] + [[c] for c in cats if c not in grouped]
+    else:
+        raise ValueError(f"Unknown prospect query mode: {mode!r}")
+
+    plan = []
+    for group in groups:
+        if len(group) == 1:
+            query = PROSPECT_CATEGORIES[group[0]].replace("{company}", company)
+        else:
+            terms = [term for cat in group for term in _category_terms(cat)]
+            query = f'"{company}" ' + " OR ".join(terms)
+        count = min(PROSPECT_MAX_RESULTS * len(group), _BRAVE_MAX_COUNT)
+        plan.append(PlannedQuery(group, query, count))
+    return plan
+
+
+def _classify_result(item: dict, categories: list[str]) -> str:
+    """
+    Category of a combined-query result.
+
+    NEWS_PAGE_KEYWORDS decides first (its category must be one the
+    query covered), then the query's own terms; anything else falls
+    back to the group's first category.
+    """
+    text = f"{item['title']} {item['description']}"
+    category = get_classifier(NEWS_PAGE_KEYWORDS).classify(text)
+    if category in categories:
+        return category
+    terms = {term.strip('"'): cat for cat in categories for term in _category_terms(cat)}
+    category = get_classifier(terms, word_boundary=True).classify(text)
+    return category if category in categories else categories[0]
+
+
+def _result_signals(query: PlannedQuery, results: list[dict], domain: str) -> list[ProspectSignal]:
+    signals = []
+    for item in results:
+        # Skip results from the company's own domain (self-promotional)
+        if domain in item["url"]:
+            continue
+
+        if len(query.categories) == 1:
+            category = query.categories[0]
+        else:
+            category = _classify_result(item, query.categories)
+
+        signals.append(ProspectSignal(
+            category=category,
+            headline=item["title"],
+            snippet=item["description"][:300],
+            source_url=item["url"],
+        ))
+    return signals
+
+
 def prospect_company(
     company: str,
     domain: str,
     categories: list[str] | None = None,
     api_key: str | None = None,
+    mode: str = PROSPECT_QUERY_MODE,
 ) -> ProspectResult:
     """
     Search for prospect signals about a company via Brave Search.
@@ -108,6 +321,7 @@ def prospect_company(
         domain: Company domain (e.g. "ford.com").
         categories: List of category keys to search (defaults to all).
         api_key: Brave API key (falls back to BRAVE_API_KEY env var).
+        mode: "per_category" or "combined" (see plan_queries).
 
     Returns:
         ProspectResult with any signals found.
@@ -121,67 +335,154 @@ def prospect_company(
             error="BRAVE_API_KEY not set",
         )
 
-    cats = categories or list(PROSPECT_CATEGORIES.keys())
-    signals: list[ProspectSignal] = []
+    queries = plan_queries(company, categories, mode)
 
-    for idx, cat in enumerate(cats):
-        template = PROSPECT_CATEGORIES.get(cat)
-        if not template:
-            continue
+    def run(query: PlannedQuery) -> tuple[list[ProspectSignal], float]:
+        start = time.monotonic()
+        try:
+            results = search_brave(query.query, api_key, count=query.count)
+        except requests.RequestException as e:
+            print(f"  Brave Search error for {query.label}: {e}")
+            results = []
+        return _result_signals(query, results, domain), time.monotonic() - start
 
-        # Rate-limit Brave Search requests (free tier: ~1 req/sec)
-        if idx > 0:
-            time.sleep(1.1)
+    # Queries run concurrently; the shared Brave bucket decides how many
+    # actually go out per second
+    with ThreadPoolExecutor(max_workers=max(1, len(queries))) as pool:
+        outcomes = list(pool.map(run, queries))
 
-        query = template.replace("{company}", company)
+    return _merged_result(company, domain, queries, outcomes)
 
+
+async def prospect_company_async(
+    company: str,
+    domain: str,
+    categories: list[str] | None = None,
+    api_key: str | None = None,
+    client: httpx.AsyncClient | None = None,
+    mode: str = PROSPECT_QUERY_MODE,
+) -> ProspectResult:
+    """
+    Async prospect_company, for the pipeline and the nanobot tools.
+
+    Args:
+        company: Company name (e.g. "Ford").
+        domain: Company domain (e.g. "ford.com").
+        categories: List of category keys to search (defaults to all).
+        api_key: Brave API key (falls back to BRAVE_API_KEY env var).
+        client: Shared client from brave_client() (a one-off client if None).
+        mode: "per_category" or "combined" (see plan_queries).
+
+    Returns:
+        ProspectResult with any signals found.
+    """
+    api_key = api_key or os.environ.get("BRAVE_API_KEY")
+    if not api_key:
+        return ProspectResult(
+            company=company,
+            domain=domain,
+            success=False,
+            error="BRAVE_API_KEY not set",
+        )
+    if client is None:
+        async with brave_client() as own_client:
+            return await prospect_company_async(
+                company, domain, categories, api_key, own_client, mode
+            )
+
+    queries = plan_queries(company, categories, mode)
+
+    async def run(query: PlannedQuery) -> tuple[list[ProspectSignal], float]:
+        start = time.monotonic()
         try:
-            results = search_brave(query, api_key)
-        except requests.RequestException as e:
-            print(f"  Brave Search error for {cat}: {e}")
-            continue
+            results = await search_brave_async(
+                query.query, api_key, count=query.count, client=client
+            )
+        except httpx.HTTPError as e:
+            print(f"  Brave Search error for {query.label}: {e}")
+            results = []
+        return _result_signals(query, results, domain), time.monotonic() - start
 
-        for item in results:
-            # Skip results from the company's own domain (self-promotional)
-            if domain in item["url"]:
-                continue
+    outcomes = await asyncio.gather(*(run(query) for query in queries))
+    return _merged_result(company, domain, queries, outcomes)
 
-            signals.append(ProspectSignal(
-                category=cat,
-                headline=item["title"],
-                snippet=item["description"][:300],
-                source_url=item["url"],
-            ))
 
-    return ProspectResult(
-        company=company,
-        domain=domain,
-        signals=signals,
-    )
+def _merged_result(
+    company: str,
+    domain: str,
+    queries: list[PlannedQuery],
+    outcomes: list[tuple[list[ProspectSignal], float]],
+) -> ProspectResult:
+    """One ProspectResult from per-query outcomes, signals in query order."""
+    result = ProspectResult(company=company, domain=domain)
+    for query, (signals, elapsed) in zip(queries, outcomes):
+        result.signals.extend(signals)
+        result.timings[query.label] = round(elapsed, 3)
+    return result
 
 
 def scrape_news_page(
     company: str,
     domain: str,
     news_url: str,
+    cache: HttpCache | None = None,
 ) -> ProspectResult:
     """
     Fetch a company's blog/newsroom page and scan for prospect keywords.
 
-    Uses the existing scraper to fetch the page, then matches lines
-    against NEWS_PAGE_KEYWORDS to detect business signals.
+    Uses the existing scraper to fetch the page, then classifies lines
+    against NEWS_PAGE_KEYWORDS (first keyword in table order wins) to
+    detect business signals.
+
+    Args:
+        company: Company name.
+        domain: Company domain.
+        news_url: URL of the company's news/blog page.
+        cache: Optional HttpCache; an unchanged page yields no signals
+            and ``unchanged=True``. The caller stores ``cache_entry``.
+
+    Returns:
+        ProspectResult with signals found on the page.
+    """
+    result = fetch_page(news_url, cache=cache)
+    return classify_news_page(company, domain, news_url, result)
+
+
+async def scrape_news_page_async(
+    company: str,
+    domain: str,
+    news_url: str,
+    cache: HttpCache | None = None,
+    fetcher: AsyncFetcher | None = None,
+) -> ProspectResult:
+    """
+    Async scrape_news_page.
 
     Args:
         company: Company name.
         domain: Company domain.
         news_url: URL of the company's news/blog page.
+        cache: Optional HttpCache (ignored when fetcher is given; the
+            fetcher's own cache applies).
+        fetcher: Shared AsyncFetcher to fetch through (one-off if None).
 
     Returns:
         ProspectResult with signals found on the page.
     """
-    from signalsdr.scraper import fetch_page
+    if fetcher is not None:
+        result = await fetcher.fetch(news_url)
+    else:
+        result = await fetch_page_async(news_url, cache=cache)
+    return classify_news_page(company, domain, news_url, result)
+
 
-    result = fetch_page(news_url)
+def classify_news_page(
+    company: str,
+    domain: str,
+    news_url: str,
+    result: ScraperResult,
+) -> ProspectResult:
+    """Classify the lines of a fetched news page into prospect signals."""
     if not result.success:
         return ProspectResult(
             company=company,
@@ -189,13 +490,24 @@ def scrape_news_page(
             success=False,
             error=f"Failed to fetch news page: {result.error}",
         )
+    if result.unchanged:
+        return ProspectResult(
+            company=company,
+            domain=domain,
+            unchanged=True,
+            cache_entry=result.cache_entry,
+        )
 
     signals: list[ProspectSignal] = []
     seen: set[str] = set()
-
-    for line in result.text.splitlines():
-        line_stripped = line.strip()
-        if not line_stripped or len(line_stripped) < 25:
+    classifier = get_classifier(NEWS_PAGE_KEYWORDS)
+    chrome = get_matcher(_CHROME_PHRASES, word_boundary=False)
+    lines = result.text.splitlines()
+
+    # One scan of the page finds keyword lines; filters only run on those
+    for idx in classifier.matcher.hit_lines(lines):
+        line_stripped = lines[idx].strip()
+        if len(line_stripped) < 25:
             continue
 
         # Skip comma-separated tag lists (e.g., "Electrification,Sustainability,Podcast")
@@ -204,36 +516,27 @@ def scrape_news_page(
             if len(segments) >= 2 and all(len(s) <= 30 for s in segments):
                 continue
 
-        # Skip WLTP / emissions disclaimers (e.g., "WLTP combined: Energy consumption...")
-        if re.search(r"kWh/100\s?km|g/km|CO₂|WLTP|NEDC", line_stripped):
+        if _EMISSIONS_DISCLAIMER.search(line_stripped) or chrome.search(line_stripped):
             continue
 
-        # Skip generic site chrome / image captions
-        lower = line_stripped.lower()
-        if any(phrase in lower for phrase in (
-            "browse below", "download the right", "cookie", "privacy policy",
-            "terms of use", "all rights reserved", "subscribe to",
-        )):
+        category = classifier.classify(line_stripped)
+
+        # Use the matched line as the headline, deduplicate
+        headline = line_stripped[:150]
+        if headline in seen:
             continue
+        seen.add(headline)
 
-        for keyword, category in NEWS_PAGE_KEYWORDS.items():
-            if re.search(re.escape(keyword), line_stripped, re.IGNORECASE):
-                # Use the matched line as the headline, deduplicate
-                headline = line_stripped[:150]
-                if headline in seen:
-                    continue
-                seen.add(headline)
-
-                signals.append(ProspectSignal(
-                    category=category,
-                    headline=headline,
-                    snippet=line_stripped[:300],
-                    source_url=news_url,
-                ))
-                break  # One match per line is enough
+        signals.append(ProspectSignal(
+            category=category,
+            headline=headline,
+            snippet=line_stripped[:300],
+            source_url=news_url,
+        ))
 
     return ProspectResult(
         company=company,
         domain=domain,
         signals=signals,
+        cache_entry=result.cache_entry,
     )
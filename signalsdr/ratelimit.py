@@ -0,0 +1,118 @@
+"""
+SignalSDR Rate Limiting.
+
+Token buckets shared by everything that talks to the outside world:
+one bucket per scraped host and one per external API (e.g. Brave).
+Buckets are process-wide and thread-safe, and can be awaited from
+async code or blocked on from sync code, so the scraper, prospector
+and nanobot web tools all draw from the same budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from urllib.parse import urlparse
+
+from signalsdr.config import API_RATE_LIMITS, HOST_RATE_LIMIT
+
+
+class TokenBucket:
+    """
+    Classic token bucket: ``rate`` tokens per second, up to ``burst`` banked.
+
+    Each acquire reserves a token immediately (the balance may go
+    negative) and then waits out its share of the deficit, so waiters
+    are served in arrival order without holding a lock while sleeping.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the current thread until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a token is available."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, burst={self.burst})"
+
+
+_buckets: dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+# (rate, burst) for host buckets; see configure_hosts
+_host_limit: tuple[float, int] = HOST_RATE_LIMIT
+
+
+def get_bucket(key: str, rate: float, burst: int = 1) -> TokenBucket:
+    """Return the shared bucket for key, creating it with rate/burst if new."""
+    with _registry_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate, burst)
+            _buckets[key] = bucket
+        return bucket
+
+
+def configure(key: str, rate: float, burst: int = 1) -> TokenBucket:
+    """Replace the bucket for key (e.g. to match a paid Brave tier)."""
+    with _registry_lock:
+        bucket = TokenBucket(rate, burst)
+        _buckets[key] = bucket
+        return bucket
+
+
+def configure_hosts(rate: float, burst: int = 1) -> None:
+    """
+    Set the rate/burst of every host bucket (e.g. to a shard's share).
+
+    Host buckets are created on first use, so this replaces the default
+    for hosts not seen yet and drops the buckets of those already seen.
+    """
+    global _host_limit
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    with _registry_lock:
+        _host_limit = (rate, burst)
+        for key in [k for k in _buckets if k.startswith("host:")]:
+            del _buckets[key]
+
+
+def host_limiter(url: str) -> TokenBucket:
+    """Bucket for the host of url (or a bare hostname), per HOST_RATE_LIMIT."""
+    host = (urlparse(url).netloc if "//" in url else url).lower()
+    rate, burst = _host_limit
+    return get_bucket(f"host:{host}", rate, burst)
+
+
+def api_limiter(name: str) -> TokenBucket:
+    """Bucket for an external API listed in API_RATE_LIMITS."""
+    rate, burst = API_RATE_LIMITS[name]
+    return get_bucket(f"api:{name}", rate, burst)
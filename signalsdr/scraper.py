@@ -4,54 +4,167 @@ from __future__ import annotations
 SignalSDR Scraper Module (Feature A from spec).
 
 Fetches HTML content from career pages and extracts readable text
-using requests + BeautifulSoup. This is the "eyes" of the agent.
+(see signalsdr.extract for the bs4 / streaming lxml backends).
+This is the "eyes" of the agent.
+
+``AsyncFetcher`` is the concurrent variant used by the pipeline: one
+shared httpx client, a global cap on in-flight requests, and the
+politeness delay applied per host instead of between every request.
+Its ``fetch_raw`` skips text extraction and returns the body as a
+``RawPage``, for parsing in another process (see signalsdr.parsepool).
 """
 
-import time
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
 
 from signalsdr.config import (
+    HTML_EXTRACTOR,
+    MAX_CONCURRENT_FETCHES,
     REQUEST_TIMEOUT_SECONDS,
-    SCRAPE_DELAY_SECONDS,
     USER_AGENT,
 )
+from signalsdr.extract import StreamingTextExtractor, extract_text
+from signalsdr.httpcache import CacheEntry, HttpCache
+from signalsdr.ratelimit import host_limiter
 
 
 class ScraperResult:
-    """Container for a scrape result."""
+    """
+    Container for a scrape result.
+
+    When fetched through an HttpCache, ``not_modified`` means the server
+    answered 304 (text comes from the cache), ``unchanged`` means the
+    extracted text hashes the same as last time, and ``cache_entry`` is
+    the entry to store once the page has been processed.
+    """
 
-    def __init__(self, url: str, text: str, title: str, success: bool, error: str = ""):
+    def __init__(
+        self,
+        url: str,
+        text: str,
+        title: str,
+        success: bool,
+        error: str = "",
+        not_modified: bool = False,
+        unchanged: bool = False,
+        cache_entry: CacheEntry | None = None,
+    ):
         self.url = url
         self.text = text
         self.title = title
         self.success = success
         self.error = error
+        self.not_modified = not_modified
+        self.unchanged = unchanged
+        self.cache_entry = cache_entry
 
     def __repr__(self) -> str:
         status = "OK" if self.success else f"FAIL: {self.error}"
+        if self.unchanged:
+            status += ", unchanged"
         return f"ScraperResult(url={self.url!r}, status={status}, chars={len(self.text)})"
 
 
-def fetch_page(url: str) -> ScraperResult:
+@dataclass
+class RawPage:
+    """A fetched page body not yet reduced to text (see AsyncFetcher.fetch_raw)."""
+
+    url: str
+    body: bytes
+    encoding: str | None  # charset from the headers or content sniffing
+    etag: str | None = None
+    last_modified: str | None = None
+    use_cache: bool = False
+    cached_hash: str | None = None  # text hash of the cached copy, if any
+
+
+def _page_result(
+    url: str,
+    title: str,
+    text: str,
+    cached_hash: str | None,
+    use_cache: bool,
+    headers: Mapping[str, str],
+) -> ScraperResult:
+    """Build a successful result, comparing against the cached text hash."""
+    if not use_cache:
+        return ScraperResult(url=url, text=text, title=title, success=True)
+    entry = CacheEntry.from_page(
+        url, title, text, etag=headers.get("ETag"), last_modified=headers.get("Last-Modified")
+    )
+    return ScraperResult(
+        url=url,
+        text=text,
+        title=title,
+        success=True,
+        unchanged=cached_hash is not None and cached_hash == entry.text_hash,
+        cache_entry=entry,
+    )
+
+
+def parse_raw_page(page: RawPage, backend: str | None = None) -> ScraperResult:
+    """
+    Extract the text of a RawPage, as AsyncFetcher.fetch would have.
+
+    Args:
+        page: Body and cache metadata from AsyncFetcher.fetch_raw.
+        backend: "bs4" or "lxml" (defaults to HTML_EXTRACTOR).
+
+    Returns:
+        ScraperResult with extracted text.
+    """
+    html = page.body.decode(page.encoding or "utf-8", errors="replace")
+    title, text = extract_text(html, backend)
+    headers = {"ETag": page.etag, "Last-Modified": page.last_modified}
+    return _page_result(page.url, title, text, page.cached_hash, page.use_cache, headers)
+
+
+def _not_modified_result(url: str, cached: CacheEntry) -> ScraperResult:
+    """Result for a 304 response: replay the cached text."""
+    entry = CacheEntry.from_page(
+        url, cached.title, cached.text, etag=cached.etag, last_modified=cached.last_modified
+    )
+    return ScraperResult(
+        url=url,
+        text=cached.text,
+        title=cached.title,
+        success=True,
+        not_modified=True,
+        unchanged=True,
+        cache_entry=entry,
+    )
+
+
+def fetch_page(url: str, cache: HttpCache | None = None) -> ScraperResult:
     """
     Fetch a single URL and return its visible text content.
 
-    Uses requests for HTTP and BeautifulSoup to strip HTML down to
-    readable text. Removes script/style/nav/footer noise so the
-    analyzer only sees meaningful content.
+    Uses requests for HTTP and the configured HTML_EXTRACTOR to strip
+    HTML down to readable text. Removes script/style/nav/footer noise
+    so the analyzer only sees meaningful content.
 
     Args:
         url: The careers page URL to fetch.
+        cache: Optional HttpCache for conditional GETs and change detection.
+            The caller stores ``result.cache_entry`` after processing.
 
     Returns:
         ScraperResult with extracted text or error details.
     """
     headers = {"User-Agent": USER_AGENT}
+    cached = cache.get(url) if cache else None
+    if cached:
+        headers.update(cached.conditional_headers())
+    host_limiter(url).acquire()
 
     try:
         response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
+        if cached and response.status_code == 304:
+            return _not_modified_result(url, cached)
         response.raise_for_status()
     except requests.exceptions.Timeout:
         return ScraperResult(url=url, text="", title="", success=False, error="Request timed out")
@@ -64,42 +177,181 @@ def fetch_page(url: str) -> ScraperResult:
     except requests.exceptions.RequestException as e:
         return ScraperResult(url=url, text="", title="", success=False, error=str(e))
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    title, text = extract_text(response.text)
+    cached_hash = cached.text_hash if cached else None
+    return _page_result(url, title, text, cached_hash, cache is not None, response.headers)
 
-    # Extract page title
-    title = soup.title.string.strip() if soup.title and soup.title.string else ""
 
-    # Remove noise elements that don't contain job listings
-    for tag in soup(["script", "style", "nav", "footer", "header", "noscript", "iframe"]):
-        tag.decompose()
+def fetch_pages(urls: list[str]) -> list[ScraperResult]:
+    """
+    Fetch multiple URLs sequentially.
 
-    # Get visible text, collapse whitespace
-    text = soup.get_text(separator="\n")
-    lines = [line.strip() for line in text.splitlines()]
-    text = "\n".join(line for line in lines if line)
+    Each request waits on its host's token bucket (HOST_RATE_LIMIT),
+    so repeated hits on one site are spaced out to avoid IP bans while
+    different sites are not delayed by each other.
 
-    return ScraperResult(url=url, text=text, title=title, success=True)
+    Args:
+        urls: List of career page URLs to scrape.
 
+    Returns:
+        List of ScraperResult objects (one per URL).
+    """
+    return [fetch_page(url) for url in urls]
 
-def fetch_pages(urls: list[str]) -> list[ScraperResult]:
+
+class AsyncFetcher:
+    """
+    Concurrent page fetcher sharing one httpx.AsyncClient.
+
+    At most ``max_concurrency`` requests are in flight at once, and
+    requests to the same host are paced by that host's token bucket.
+    The token is taken once a slot is held, so requests that queued for
+    a slot cannot reach a host faster than its bucket allows. Different
+    hosts proceed in parallel, so a run takes roughly as long as its
+    slowest host rather than the sum of all hosts.
+
+    Usage:
+        async with AsyncFetcher() as fetcher:
+            results = await asyncio.gather(*(fetcher.fetch(u) for u in urls))
     """
-    Fetch multiple URLs with rate limiting between requests.
 
-    Respects SCRAPE_DELAY_SECONDS from config to avoid IP bans.
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENT_FETCHES,
+        cache: HttpCache | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.cache = cache
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._transport = transport  # e.g. httpx.MockTransport in tests
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> AsyncFetcher:
+        self._client = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            transport=self._transport,
+        )
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, url: str) -> ScraperResult:
+        """Fetch one URL and return its visible text (see fetch_page for caching)."""
+
+        async def read(response: httpx.Response, cached: CacheEntry | None) -> ScraperResult:
+            title, text = await self._read_text(response)
+            cached_hash = cached.text_hash if cached else None
+            use_cache = self.cache is not None
+            return _page_result(url, title, text, cached_hash, use_cache, response.headers)
+
+        return await self._get(url, read)
+
+    async def fetch_raw(self, url: str) -> RawPage | ScraperResult:
+        """
+        Fetch one URL without extracting its text.
+
+        Returns:
+            The RawPage to pass to parse_raw_page, or a ScraperResult when
+            there is nothing to parse (an error, or 304 Not Modified).
+        """
+
+        async def read(response: httpx.Response, cached: CacheEntry | None) -> RawPage:
+            body = await response.aread()
+            return RawPage(
+                url=url,
+                body=body,
+                encoding=response.encoding,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                use_cache=self.cache is not None,
+                cached_hash=cached.text_hash if cached else None,
+            )
+
+        return await self._get(url, read)
+
+    async def _get(
+        self,
+        url: str,
+        read: Callable[[httpx.Response, CacheEntry | None], Awaitable[RawPage | ScraperResult]],
+    ) -> RawPage | ScraperResult:
+        """GET url (conditionally, if cached) and hand a 2xx response to read."""
+        if self._client is None:
+            raise RuntimeError("AsyncFetcher must be used as an async context manager")
+
+        cached = self.cache.get(url) if self.cache else None
+        headers = cached.conditional_headers() if cached else {}
+
+        async with self._semaphore:
+            # Waiting for the host inside the slot: a token taken before
+            # queueing for a slot would be spent by the time the request
+            # went out, and queued requests to one host would fire together
+            await host_limiter(url).acquire_async()
+            try:
+                async with self._client.stream("GET", url, headers=headers) as response:
+                    if cached and response.status_code == 304:
+                        return _not_modified_result(url, cached)
+                    response.raise_for_status()
+                    return await read(response, cached)
+            except httpx.TimeoutException:
+                return ScraperResult(url=url, text="", title="", success=False, error="Request timed out")
+            except httpx.ConnectError:
+                return ScraperResult(url=url, text="", title="", success=False, error="Connection failed")
+            except httpx.HTTPStatusError as e:
+                return ScraperResult(
+                    url=url, text="", title="", success=False, error=f"HTTP {e.response.status_code}"
+                )
+            except httpx.HTTPError as e:
+                return ScraperResult(url=url, text="", title="", success=False, error=str(e))
+
+    @staticmethod
+    async def _read_text(response: httpx.Response) -> tuple[str, str]:
+        """Extract (title, text) from a streamed response body."""
+        if HTML_EXTRACTOR != "lxml":
+            await response.aread()
+            return extract_text(response.text)
+
+        # Parse chunks as they arrive; the raw page is never held in full
+        extractor = StreamingTextExtractor()
+        lines: list[str] = []
+        async for chunk in response.aiter_text():
+            lines.extend(extractor.feed(chunk))
+        lines.extend(extractor.close())
+        return extractor.title, "\n".join(lines)
+
+
+async def fetch_page_async(url: str, cache: HttpCache | None = None) -> ScraperResult:
+    """
+    Async fetch_page for one-off fetches; use AsyncFetcher for many URLs.
 
     Args:
-        urls: List of career page URLs to scrape.
+        url: The careers page URL to fetch.
+        cache: Optional HttpCache for conditional GETs and change detection.
 
     Returns:
-        List of ScraperResult objects (one per URL).
+        ScraperResult with extracted text or error details.
     """
-    results = []
-    for i, url in enumerate(urls):
-        result = fetch_page(url)
-        results.append(result)
+    async with AsyncFetcher(max_concurrency=1, cache=cache) as fetcher:
+        return await fetcher.fetch(url)
 
-        # Rate limit: sleep between requests (skip after last one)
-        if i < len(urls) - 1:
-            time.sleep(SCRAPE_DELAY_SECONDS)
 
-    return results
+async def fetch_pages_async(
+    urls: list[str],
+    max_concurrency: int = MAX_CONCURRENT_FETCHES,
+) -> list[ScraperResult]:
+    """
+    Fetch multiple URLs concurrently with per-host rate limiting.
+
+    Args:
+        urls: List of career page URLs to scrape.
+        max_concurrency: Max requests in flight at once.
+
+    Returns:
+        List of ScraperResult objects, in the same order as urls.
+    """
+    async with AsyncFetcher(max_concurrency=max_concurrency) as fetcher:
+        return await asyncio.gather(*(fetcher.fetch(url) for url in urls))
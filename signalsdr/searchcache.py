@@ -0,0 +1,178 @@
+"""
+SignalSDR Search Cache.
+
+Brave Search results cached by (query, freshness, count), shared by the
+prospector and the nanobot web_search tool. A result set filtered to
+"past week" is still good hours later, so each freshness window gets
+its own TTL (SEARCH_CACHE_TTLS). Identical queries that are already in
+flight are coalesced: concurrent callers wait for the one request
+instead of spending quota on duplicates.
+
+Results live in a small SQLite table so reruns benefit too. Failed
+searches are never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from pathlib import Path
+
+from signalsdr.config import SEARCH_CACHE_PATH, SEARCH_CACHE_TTLS
+
+
+def search_key(query: str, freshness: str | None, count: int) -> str:
+    """Cache key for one search."""
+    payload = json.dumps([query, freshness or "", count], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """SQLite-backed search result cache with freshness-aware TTLs."""
+
+    def __init__(self, path: str | Path = SEARCH_CACHE_PATH, ttls: dict[str, float] | None = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = dict(SEARCH_CACHE_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS searches ("
+            " key TEXT PRIMARY KEY, results TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def ttl(self, freshness: str | None) -> float:
+        """Seconds a result set for this freshness filter stays valid."""
+        return self.ttls.get(freshness or "", self.ttls.get("", 0))
+
+    def get(self, query: str, freshness: str | None, count: int) -> list[dict] | None:
+        """Cached results, or None if absent or expired."""
+        key = search_key(query, freshness, count)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, fetched_at FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl(freshness):
+            return None
+        return json.loads(row[0])
+
+    def put(self, query: str, freshness: str | None, count: int, results: list[dict]) -> None:
+        key = search_key(query, freshness, count)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                (key, json.dumps(results, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def _claim(self, key: str) -> tuple[Future, bool]:
+        """The in-flight future for key, and whether the caller owns the fetch."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _settle(self, key: str, future: Future, results=None, error: BaseException | None = None):
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(results)
+
+    def get_or_fetch(
+        self,
+        query: str,
+        freshness: str | None,
+        count: int,
+        fetch: Callable[[], list[dict]],
+    ) -> list[dict]:
+        """Cached results, else fetch() once even if several threads ask at the same time."""
+        cached = self.get(query, freshness, count)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        key = search_key(query, freshness, count)
+        future, owner = self._claim(key)
+        if not owner:
+            return future.result()
+
+        self.misses += 1
+        try:
+            results = fetch()
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self.put(query, freshness, count, results)
+        self._settle(key, future, results)
+        return results
+
+    async def get_or_fetch_async(
+        self,
+        query: str,
+        freshness: str | None,
+        count: int,
+        fetch: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """Async get_or_fetch; waiting on another caller's fetch does not block the loop."""
+        cached = self.get(query, freshness, count)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        key = search_key(query, freshness, count)
+        future, owner = self._claim(key)
+        if not owner:
+            return await asyncio.wrap_future(future)
+
+        self.misses += 1
+        try:
+            results = await fetch()
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self.put(query, freshness, count, results)
+        self._settle(key, future, results)
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_UNSET = object()
+_shared: SearchCache | None | object = _UNSET
+_shared_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache | None:
+    """The process-wide cache (opened at SEARCH_CACHE_PATH on first use)."""
+    global _shared
+    with _shared_lock:
+        if _shared is _UNSET:
+            _shared = SearchCache()
+        return _shared
+
+
+def configure_search_cache(cache: SearchCache | None) -> None:
+    """Replace the process-wide cache; None disables search caching."""
+    global _shared
+    with _shared_lock:
+        _shared = cache
@@ -0,0 +1,87 @@
+"""
+SignalSDR Sharding.
+
+``main.py --shard i/N`` runs the pipeline on the i-th of N slices of the
+targets, so N processes (or hosts) can split a large target list. A
+target's slice is a stable hash of its domain, so a company stays on
+the same shard from run to run and its state builds up in one place.
+
+Each shard writes its own output, markdown, state database and run
+journals (``drafts_output.shard2of4.csv``, ``data/state.shard2of4.sqlite3``,
+...), seeded from the main state database so cooldowns carry over.
+``main.py --merge-shards N`` folds them back into the main files.
+
+Shards share the API keys, so each gets 1/N of the Brave rate limit and
+of the per-provider draft concurrency. They also share the scraped
+hosts (companies on one ATS such as boards.greenhouse.io fall in every
+shard), so each gets 1/N of the per-host rate too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+from signalsdr.config import API_RATE_LIMITS, HOST_RATE_LIMIT, MAX_CONCURRENT_DRAFTS
+
+
+def shard_of(domain: str, count: int) -> int:
+    """Stable 1-based shard of a domain (unlike hash(), the same in every process)."""
+    key = domain.strip().lower().removeprefix("www.")
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+@dataclass(frozen=True)
+class Shard:
+    """The index-th of count slices of the targets (1-based)."""
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, spec: str) -> Shard:
+        """Parse "i/N", e.g. "2/4"."""
+        try:
+            index, count = (int(part) for part in spec.split("/"))
+        except ValueError:
+            raise ValueError(f"Shard must look like i/N, got {spec!r}") from None
+        if not 1 <= index <= count:
+            raise ValueError(f"Shard index must be between 1 and {count}, got {index}")
+        return cls(index, count)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+    @property
+    def suffix(self) -> str:
+        return f"shard{self.index}of{self.count}"
+
+    def contains(self, domain: str) -> bool:
+        return shard_of(domain, self.count) == self.index
+
+    def path(self, path: str | Path) -> Path:
+        """This shard's copy of a file: data/state.sqlite3 -> data/state.shard1of4.sqlite3."""
+        path = Path(path)
+        return path.with_name(f"{path.stem}.{self.suffix}{path.suffix}")
+
+    def api_limits(self) -> dict[str, tuple[float, int]]:
+        """API_RATE_LIMITS with each rate divided among the shards."""
+        return {
+            name: (rate / self.count, max(1, burst // self.count))
+            for name, (rate, burst) in API_RATE_LIMITS.items()
+        }
+
+    def host_limit(self) -> tuple[float, int]:
+        """HOST_RATE_LIMIT divided among the shards."""
+        rate, burst = HOST_RATE_LIMIT
+        return rate / self.count, max(1, burst // self.count)
+
+    def draft_limits(self) -> dict[str, int]:
+        """MAX_CONCURRENT_DRAFTS divided among the shards (at least 1 each)."""
+        return {
+            provider: max(1, math.ceil(limit / self.count))
+            for provider, limit in MAX_CONCURRENT_DRAFTS.items()
+        }
@@ -2,32 +2,666 @@
 SignalSDR State Management.
 
 Tracks which companies have been scanned and what signals
-were found, using a local db.json file. Prevents re-scanning
-the same company within a configurable cooldown window.
+were found. Prevents re-scanning the same company within a
+configurable cooldown window.
+
+Two interchangeable backends sit behind should_scan/record_scan,
+picked from the db_path suffix:
+  - JSON (``*.json``) — the original whole-file db.json format
+  - SQLite (``*.sqlite3``, ``*.sqlite``, ``*.db``) — indexed by domain,
+    WAL mode, one row update per scan instead of a full rewrite
 """
 
 import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Container, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
+from signalsdr.targets import normalize_domain
+
 
-DEFAULT_DB_PATH = Path("data/db.json")
+DEFAULT_DB_PATH = Path("data/state.sqlite3")
+LEGACY_DB_PATH = Path("data/db.json")
 RESCAN_COOLDOWN_HOURS = 24
 
+SQLITE_SUFFIXES = {".sqlite3", ".sqlite", ".db"}
+
+
+def _ts_key(scan_type: str) -> str:
+    return "last_scan" if scan_type == "hiring" else "last_prospect_scan"
+
+
+def _signal_records(signals: list[dict], scan_type: str, now: str) -> list[dict]:
+    """Convert pipeline signal dicts into stored signal records."""
+    if scan_type == "prospect":
+        return [
+            {
+                "date": now[:10],
+                "type": f"prospect_{s.get('category', 'unknown')}",
+                "details": s.get("headline", s.get("snippet", "unknown")),
+            }
+            for s in signals
+        ]
+    return [
+        {
+            "date": now[:10],
+            "type": "hiring",
+            "details": f"Found role: {s.get('matched_text', s.get('keyword', 'unknown'))}",
+        }
+        for s in signals
+    ]
+
+
+class StateStore(ABC):
+    """Storage backend for per-company scan history."""
+
+    @abstractmethod
+    def last_scan(self, domain: str, scan_type: str = "hiring") -> str | None:
+        """Return the ISO timestamp of the last scan of this type, if any."""
+
+    @abstractmethod
+    def last_scans(self, scan_type: str = "hiring") -> dict[str, str]:
+        """Return {domain: ISO timestamp} for every company scanned with this type."""
+
+    @abstractmethod
+    def record_scan(
+        self,
+        domain: str,
+        company_name: str,
+        signal_records: list[dict],
+        scan_type: str,
+        now: str,
+    ) -> None:
+        """Store a completed scan (timestamp, status, new signal records)."""
+
+    @abstractmethod
+    def line_fingerprints(self, domain: str, scan_type: str = "hiring") -> set[str]:
+        """Fingerprints of the signal lines seen on the last scan of this domain."""
+
+    @abstractmethod
+    def save_line_fingerprints(
+        self, domain: str, fingerprints: set[str], scan_type: str = "hiring"
+    ) -> None:
+        """Replace the stored signal-line fingerprints for this domain."""
+
+    @abstractmethod
+    def companies(self) -> list[dict]:
+        """Return every company entry in db.json form (including signals)."""
+
+    @abstractmethod
+    def import_companies(self, companies: list[dict]) -> int:
+        """Bulk-store db.json company entries (replacing same-domain entries)."""
+
+    @abstractmethod
+    def remove_companies(self, domains: Iterable[str]) -> None:
+        """Delete these companies with their signals and fingerprints."""
+
+    def domains(self) -> list[str]:
+        """Every stored company domain."""
+        return [c["domain"] for c in self.companies()]
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class JsonStateStore(StateStore):
+    """The original db.json backend: parse and rewrite the whole file per call."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {"companies": []}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save(self, db: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(db, f, indent=2, ensure_ascii=False)
+
+    def last_scan(self, domain: str, scan_type: str = "hiring") -> str | None:
+        for company in self._load()["companies"]:
+            if company.get("domain") == domain:
+                return company.get(_ts_key(scan_type))
+        return None
+
+    def last_scans(self, scan_type: str = "hiring") -> dict[str, str]:
+        ts_key = _ts_key(scan_type)
+        return {
+            c["domain"]: c[ts_key]
+            for c in self._load()["companies"]
+            if c.get("domain") and c.get(ts_key)
+        }
+
+    def record_scan(
+        self,
+        domain: str,
+        company_name: str,
+        signal_records: list[dict],
+        scan_type: str,
+        now: str,
+    ) -> None:
+        db = self._load()
+        ts_key = _ts_key(scan_type)
+
+        # Find existing entry or create new
+        existing = None
+        for company in db["companies"]:
+            if company.get("domain") == domain:
+                existing = company
+                break
+
+        if existing:
+            existing[ts_key] = now
+            existing["status"] = "signal_found" if signal_records else "no_signal"
+            if signal_records:
+                existing.setdefault("signals", []).extend(signal_records)
+        else:
+            db["companies"].append({
+                "id": f"c_{len(db['companies']) + 1:03d}",
+                "name": company_name,
+                "domain": domain,
+                ts_key: now,
+                "status": "signal_found" if signal_records else "no_signal",
+                "signals": signal_records,
+            })
+
+        self._save(db)
+
+    def line_fingerprints(self, domain: str, scan_type: str = "hiring") -> set[str]:
+        for company in self._load()["companies"]:
+            if company.get("domain") == domain:
+                return set(company.get("line_fingerprints", {}).get(scan_type, []))
+        return set()
+
+    def save_line_fingerprints(
+        self, domain: str, fingerprints: set[str], scan_type: str = "hiring"
+    ) -> None:
+        db = self._load()
+        for company in db["companies"]:
+            if company.get("domain") == domain:
+                company.setdefault("line_fingerprints", {})[scan_type] = sorted(fingerprints)
+                self._save(db)
+                return
+
+    def companies(self) -> list[dict]:
+        return self._load()["companies"]
+
+    def import_companies(self, companies: list[dict]) -> int:
+        db = self._load()
+        incoming = {c["domain"]: c for c in companies}
+        kept = [c for c in db["companies"] if c.get("domain") not in incoming]
+        db["companies"] = kept + list(incoming.values())
+        self._save(db)
+        return len(companies)
+
+    def remove_companies(self, domains: Iterable[str]) -> None:
+        db = self._load()
+        removed = set(domains)
+        db["companies"] = [c for c in db["companies"] if c.get("domain") not in removed]
+        self._save(db)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    domain             TEXT PRIMARY KEY,
+    id                 TEXT NOT NULL,
+    name               TEXT NOT NULL,
+    last_scan          TEXT,
+    last_prospect_scan TEXT,
+    status             TEXT
+);
+CREATE TABLE IF NOT EXISTS signals (
+    domain  TEXT NOT NULL,
+    date    TEXT,
+    type    TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_signals_domain ON signals (domain);
+CREATE TABLE IF NOT EXISTS line_fingerprints (
+    domain      TEXT NOT NULL,
+    scan_type   TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    PRIMARY KEY (domain, scan_type, fingerprint)
+) WITHOUT ROWID;
+"""
+
+
+class SqliteStateStore(StateStore):
+    """SQLite backend: companies keyed by domain, signals appended as rows."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def last_scan(self, domain: str, scan_type: str = "hiring") -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_ts_key(scan_type)} FROM companies WHERE domain = ?", (domain,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def last_scans(self, scan_type: str = "hiring") -> dict[str, str]:
+        ts_key = _ts_key(scan_type)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT domain, {ts_key} FROM companies WHERE {ts_key} IS NOT NULL"
+            ).fetchall()
+        return {domain: ts for domain, ts in rows}
+
+    def record_scan(
+        self,
+        domain: str,
+        company_name: str,
+        signal_records: list[dict],
+        scan_type: str,
+        now: str,
+    ) -> None:
+        ts_key = _ts_key(scan_type)
+        status = "signal_found" if signal_records else "no_signal"
+
+        with self._lock, self._conn:
+            updated = self._conn.execute(
+                f"UPDATE companies SET {ts_key} = ?, status = ? WHERE domain = ?",
+                (now, status, domain),
+            ).rowcount
+            if not updated:
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM companies").fetchone()
+                self._conn.execute(
+                    f"INSERT INTO companies (domain, id, name, {ts_key}, status) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (domain, f"c_{count + 1:03d}", company_name, now, status),
+                )
+            self._conn.executemany(
+                "INSERT INTO signals (domain, date, type, details) VALUES (?, ?, ?, ?)",
+                [(domain, r["date"], r["type"], r["details"]) for r in signal_records],
+            )
+
+    def line_fingerprints(self, domain: str, scan_type: str = "hiring") -> set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fingerprint FROM line_fingerprints WHERE domain = ? AND scan_type = ?",
+                (domain, scan_type),
+            ).fetchall()
+        return {fp for (fp,) in rows}
+
+    def save_line_fingerprints(
+        self, domain: str, fingerprints: set[str], scan_type: str = "hiring"
+    ) -> None:
+        with self._lock, self._conn:
+            self._replace_fingerprints(domain, scan_type, fingerprints)
+
+    def _replace_fingerprints(
+        self, domain: str, scan_type: str, fingerprints: Iterable[str]
+    ) -> None:
+        self._conn.execute(
+            "DELETE FROM line_fingerprints WHERE domain = ? AND scan_type = ?",
+            (domain, scan_type),
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO line_fingerprints (domain, scan_type, fingerprint) "
+            "VALUES (?, ?, ?)",
+            [(domain, scan_type, fp) for fp in fingerprints],
+        )
+
+    def import_companies(self, companies: list[dict]) -> int:
+        """Bulk-insert db.json company entries (replacing same-domain rows)."""
+        with self._lock, self._conn:
+            for c in companies:
+                domain = c["domain"]
+                self._conn.execute("DELETE FROM signals WHERE domain = ?", (domain,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO companies "
+                    "(domain, id, name, last_scan, last_prospect_scan, status) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        domain,
+                        c.get("id", ""),
+                        c.get("name", domain),
+                        c.get("last_scan"),
+                        c.get("last_prospect_scan"),
+                        c.get("status"),
+                    ),
+                )
+                self._conn.executemany(
+                    "INSERT INTO signals (domain, date, type, details) VALUES (?, ?, ?, ?)",
+                    [
+                        (domain, s.get("date"), s.get("type"), s.get("details"))
+                        for s in c.get("signals", [])
+                    ],
+                )
+                for scan_type, fps in c.get("line_fingerprints", {}).items():
+                    self._replace_fingerprints(domain, scan_type, fps)
+        return len(companies)
+
+    def remove_companies(self, domains: Iterable[str]) -> None:
+        rows = [(domain,) for domain in domains]
+        with self._lock, self._conn:
+            for table in ("companies", "signals", "line_fingerprints"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE domain = ?", rows)
+
+    def domains(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT domain FROM companies").fetchall()
+        return [domain for (domain,) in rows]
+
+    def companies(self) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM companies ORDER BY rowid").fetchall()
+            signal_rows = self._conn.execute(
+                "SELECT domain, date, type, details FROM signals ORDER BY rowid"
+            ).fetchall()
+            fingerprint_rows = self._conn.execute(
+                "SELECT domain, scan_type, fingerprint FROM line_fingerprints"
+            ).fetchall()
+
+        signals: dict[str, list[dict]] = {}
+        for s in signal_rows:
+            signals.setdefault(s["domain"], []).append(
+                {"date": s["date"], "type": s["type"], "details": s["details"]}
+            )
+
+        fingerprints: dict[str, dict[str, list[str]]] = {}
+        for f in fingerprint_rows:
+            fingerprints.setdefault(f["domain"], {}).setdefault(f["scan_type"], []).append(
+                f["fingerprint"]
+            )
+
+        result = []
+        for row in rows:
+            entry = {"id": row["id"], "name": row["name"], "domain": row["domain"]}
+            for key in ("last_scan", "last_prospect_scan"):
+                if row[key]:
+                    entry[key] = row[key]
+            entry["status"] = row["status"]
+            entry["signals"] = signals.get(row["domain"], [])
+            if row["domain"] in fingerprints:
+                entry["line_fingerprints"] = fingerprints[row["domain"]]
+            result.append(entry)
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: dict[Path, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def open_store(db_path: Path = DEFAULT_DB_PATH) -> StateStore:
+    """Return the (cached) backend for db_path, chosen by file suffix."""
+    key = Path(db_path).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if key.suffix in SQLITE_SUFFIXES:
+                store = SqliteStateStore(key)
+            else:
+                store = JsonStateStore(key)
+            _stores[key] = store
+        return store
+
+
+def migrate_json_to_sqlite(json_path: Path, sqlite_path: Path) -> int:
+    """
+    One-shot import of a db.json file into a SQLite state store.
+
+    Re-running is safe: entries for domains already present are replaced.
+
+    Returns:
+        Number of company entries imported.
+    """
+    companies = JsonStateStore(Path(json_path)).companies()
+    store = open_store(Path(sqlite_path))
+    if not isinstance(store, SqliteStateStore):
+        raise ValueError(f"Not a SQLite state path: {sqlite_path}")
+    return store.import_companies(companies)
+
+
+def merge_state(
+    sources: Iterable[Path],
+    dest: Path,
+    keep: Callable[[str], bool] | None = None,
+) -> int:
+    """
+    Fold the company entries of other state databases into dest.
+
+    Used to seed a shard's database from the main one and to merge
+    shards back (see signalsdr.shard). Per domain and scan type the
+    newest scan wins, and signal histories are combined, so merging is
+    safe to repeat and in either direction.
+
+    Args:
+        sources: State databases to read (db.json or SQLite).
+        dest: State database to update.
+        keep: Optional domain filter for the source entries.
+
+    Returns:
+        Number of company entries written to dest.
+    """
+    store = open_store(dest)
+    current = {c["domain"]: c for c in store.companies()}
+    changed: dict[str, dict] = {}
+    for source in sources:
+        if not Path(source).exists() or Path(source).resolve() == Path(dest).resolve():
+            continue
+        for entry in open_store(Path(source)).companies():
+            domain = entry["domain"]
+            if keep is not None and not keep(domain):
+                continue
+            base = changed.get(domain) or current.get(domain)
+            changed[domain] = _merge_company(base, entry) if base else entry
+    # Leave entries the sources added nothing to untouched
+    updates = [c for domain, c in changed.items() if c != current.get(domain)]
+    return store.import_companies(updates) if updates else 0
+
+
+def normalize_state_domains(db_path: Path = DEFAULT_DB_PATH) -> int:
+    """
+    Re-key companies stored under a domain that normalize_domain rewrites.
+
+    Targets used to be keyed by their domain column as written
+    ("www.Acme.com"); they are now normalized ("acme.com"), so older
+    entries would no longer be found and those companies would be
+    rescanned and redrafted. Each such entry is moved to its normalized
+    domain, merged (as merge_state does) with any entry already there.
+    Cheap when there is nothing to move, so it can run on every start.
+
+    Returns:
+        Number of entries re-keyed.
+    """
+    store = open_store(db_path)
+    stale = {}
+    for domain in store.domains():
+        normalized = normalize_domain(domain)
+        if normalized is not None and normalized != domain:
+            stale[domain] = normalized
+    if not stale:
+        return 0
+
+    current = {c["domain"]: c for c in store.companies()}
+    moved: dict[str, dict] = {}
+    for domain, normalized in stale.items():
+        entry = dict(current[domain], domain=normalized)
+        base = moved.get(normalized) or current.get(normalized)
+        moved[normalized] = _merge_company(base, entry) if base else entry
+    store.import_companies(list(moved.values()))
+    store.remove_companies(stale)
+    return len(stale)
+
+
+def _merge_company(a: dict, b: dict) -> dict:
+    """One db.json entry from two copies of the same company's history."""
+    merged = dict(a)
+    fingerprints = dict(a.get("line_fingerprints", {}))
+    for scan_type in ("hiring", "prospect"):
+        key = _ts_key(scan_type)
+        if (b.get(key) or "") > (a.get(key) or ""):
+            merged[key] = b[key]
+            if scan_type in b.get("line_fingerprints", {}):
+                fingerprints[scan_type] = b["line_fingerprints"][scan_type]
+    newest = max(a.get("last_scan") or "", a.get("last_prospect_scan") or "")
+    if max(b.get("last_scan") or "", b.get("last_prospect_scan") or "") > newest:
+        merged["status"] = b.get("status")
+    if fingerprints:
+        merged["line_fingerprints"] = fingerprints
+
+    seen = {(s.get("date"), s.get("type"), s.get("details")) for s in a.get("signals", [])}
+    merged["signals"] = list(a.get("signals", [])) + [
+        s for s in b.get("signals", [])
+        if (s.get("date"), s.get("type"), s.get("details")) not in seen
+    ]
+    return merged
+
 
-def _load_db(db_path: Path) -> dict:
-    """Load the state database from disk."""
-    if not db_path.exists():
-        return {"companies": []}
-    with open(db_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def _cooldown_elapsed(last_scan: str | None, now: datetime) -> bool:
+    """True if last_scan is missing or older than RESCAN_COOLDOWN_HOURS."""
+    if not last_scan:
+        return True
+    hours_since = (now - datetime.fromisoformat(last_scan)).total_seconds() / 3600
+    return hours_since >= RESCAN_COOLDOWN_HOURS
 
 
-def _save_db(db: dict, db_path: Path) -> None:
-    """Write the state database to disk."""
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(db_path, "w", encoding="utf-8") as f:
-        json.dump(db, f, indent=2, ensure_ascii=False)
+@dataclass
+class ScanPlan:
+    """Which targets are due for a scan type, and why the rest are skipped."""
+
+    scan_type: str
+    due: list[dict] = field(default_factory=list)
+    skipped: list[tuple[dict, str]] = field(default_factory=list)
+
+    def skip_counts(self) -> dict[str, int]:
+        """Number of skipped targets per reason."""
+        counts: dict[str, int] = {}
+        for _, reason in self.skipped:
+            counts[reason] = counts.get(reason, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        """One-line description, e.g. '12 due, 30 skipped (30 scanned within 24h)'."""
+        return _plan_summary(len(self.due), self.skip_counts())
+
+
+def plan_scans(
+    targets: Iterable[dict],
+    scan_type: str = "hiring",
+    db_path: Path = DEFAULT_DB_PATH,
+) -> ScanPlan:
+    """
+    Split targets into due and skipped in a single pass over the state.
+
+    Loads the last-scan timestamps once (instead of one should_scan
+    lookup per target). Hiring targets without a careers_url are
+    skipped as well, since there is nothing to fetch.
+
+    Args:
+        targets: Target dicts with at least "domain" (and "careers_url" for hiring).
+        scan_type: "hiring" or "prospect".
+        db_path: Path to the state database (db.json or SQLite).
+
+    Returns:
+        ScanPlan preserving the input order of targets.
+    """
+    skip_reason = _skip_rule(scan_type, db_path)
+    plan = ScanPlan(scan_type=scan_type)
+
+    for target in targets:
+        reason = skip_reason(target)
+        if reason:
+            plan.skipped.append((target, reason))
+        else:
+            plan.due.append(target)
+
+    return plan
+
+
+class ScanStream:
+    """
+    plan_scans for a stream of targets: iterating yields the due ones
+    as they are read and counts the rest, so nothing is held in memory.
+
+    Args:
+        targets: Target dicts, e.g. a signalsdr.targets.TargetSource.
+        scan_type: "hiring" or "prospect".
+        db_path: Path to the state database (db.json or SQLite).
+        exclude: Domains to leave out without counting (e.g. resumed ones).
+        required: Target field a scan cannot run without; targets lacking
+            it are skipped as "no <field>". Defaults to careers_url for
+            hiring and nothing for prospect.
+    """
+
+    def __init__(
+        self,
+        targets: Iterable[dict],
+        scan_type: str = "hiring",
+        db_path: Path = DEFAULT_DB_PATH,
+        exclude: Container[str] = frozenset(),
+        required: str | None = None,
+    ):
+        self.targets = targets
+        self.scan_type = scan_type
+        self.db_path = db_path
+        self.exclude = exclude
+        self.required = required
+        self.due = 0
+        self.skipped: dict[str, int] = {}
+
+    def __iter__(self) -> Iterator[dict]:
+        skip_reason = _skip_rule(self.scan_type, self.db_path, self.required)
+        for target in self.targets:
+            if target["domain"] in self.exclude:
+                continue
+            reason = skip_reason(target)
+            if reason:
+                self.skipped[reason] = self.skipped.get(reason, 0) + 1
+            else:
+                self.due += 1
+                yield target
+
+    def summary(self) -> str:
+        """One-line description, e.g. '12 due, 30 skipped (30 scanned within 24h)'."""
+        return _plan_summary(self.due, self.skipped)
+
+
+def _skip_rule(
+    scan_type: str, db_path: Path, required: str | None = None
+) -> Callable[[dict], str | None]:
+    """Why a target is not due for scan_type (None if it is), as of now."""
+    # The last-scan timestamps are loaded once, not looked up per target
+    last_scans = open_store(db_path).last_scans(scan_type)
+    now = datetime.now(timezone.utc)
+    cooldown_reason = f"scanned within {RESCAN_COOLDOWN_HOURS}h"
+    required = required or ("careers_url" if scan_type == "hiring" else None)
+
+    def skip_reason(target: dict) -> str | None:
+        if required and not target.get(required):
+            return f"no {required}"
+        if not _cooldown_elapsed(last_scans.get(target["domain"]), now):
+            return cooldown_reason
+        return None
+
+    return skip_reason
+
+
+def _plan_summary(due: int, skipped: dict[str, int]) -> str:
+    total = sum(skipped.values())
+    line = f"{due} due, {total} skipped"
+    if total:
+        line += f" ({', '.join(f'{n} {reason}' for reason, n in skipped.items())})"
+    return line
 
 
 def should_scan(
@@ -43,23 +677,11 @@ def should_scan(
 
     Args:
         domain: Company domain (unique key).
-        db_path: Path to db.json.
+        db_path: Path to the state database (db.json or SQLite).
         scan_type: "hiring" or "prospect" — tracked independently.
     """
-    db = _load_db(db_path)
-    ts_key = "last_scan" if scan_type == "hiring" else "last_prospect_scan"
-
-    for company in db["companies"]:
-        if company.get("domain") == domain:
-            last_scan = company.get(ts_key)
-            if not last_scan:
-                return True
-            last_dt = datetime.fromisoformat(last_scan)
-            now = datetime.now(timezone.utc)
-            hours_since = (now - last_dt).total_seconds() / 3600
-            return hours_since >= RESCAN_COOLDOWN_HOURS
-
-    return True
+    last_scan = open_store(db_path).last_scan(domain, scan_type)
+    return _cooldown_elapsed(last_scan, datetime.now(timezone.utc))
 
 
 def record_scan(
@@ -78,53 +700,33 @@ def record_scan(
         domain: Company domain (unique key).
         company_name: Human-readable company name.
         signals: List of signal dicts (keyword, matched_text).
-        db_path: Path to db.json.
+        db_path: Path to the state database (db.json or SQLite).
         scan_type: "hiring" or "prospect" — stored separately.
     """
-    db = _load_db(db_path)
     now = datetime.now(timezone.utc).isoformat()
-    ts_key = "last_scan" if scan_type == "hiring" else "last_prospect_scan"
+    records = _signal_records(signals, scan_type, now)
+    open_store(db_path).record_scan(domain, company_name, records, scan_type, now)
 
-    # Find existing entry or create new
-    existing = None
-    for company in db["companies"]:
-        if company.get("domain") == domain:
-            existing = company
-            break
 
-    if scan_type == "prospect":
-        signal_records = [
-            {
-                "date": now[:10],
-                "type": f"prospect_{s.get('category', 'unknown')}",
-                "details": s.get("headline", s.get("snippet", "unknown")),
-            }
-            for s in signals
-        ]
-    else:
-        signal_records = [
-            {
-                "date": now[:10],
-                "type": "hiring",
-                "details": f"Found role: {s.get('matched_text', s.get('keyword', 'unknown'))}",
-            }
-            for s in signals
-        ]
+def get_line_fingerprints(
+    domain: str,
+    db_path: Path = DEFAULT_DB_PATH,
+    scan_type: str = "hiring",
+) -> set[str]:
+    """
+    Fingerprints of the signal lines found on the last scan of a domain.
+
+    Used with analyze_text(seen_fingerprints=...) so only lines that
+    appeared since the previous scan produce signals (and drafts).
+    """
+    return open_store(db_path).line_fingerprints(domain, scan_type)
 
-    if existing:
-        existing[ts_key] = now
-        existing["status"] = "signal_found" if signals else "no_signal"
-        if signals:
-            existing.setdefault("signals", []).extend(signal_records)
-    else:
-        entry = {
-            "id": f"c_{len(db['companies']) + 1:03d}",
-            "name": company_name,
-            "domain": domain,
-            ts_key: now,
-            "status": "signal_found" if signals else "no_signal",
-            "signals": signal_records,
-        }
-        db["companies"].append(entry)
 
-    _save_db(db, db_path)
+def save_line_fingerprints(
+    domain: str,
+    fingerprints: set[str],
+    db_path: Path = DEFAULT_DB_PATH,
+    scan_type: str = "hiring",
+) -> None:
+    """Replace a domain's stored signal-line fingerprints (call after record_scan)."""
+    open_store(db_path).save_line_fingerprints(domain, fingerprints, scan_type)
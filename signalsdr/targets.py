@@ -0,0 +1,148 @@
+"""
+SignalSDR Target Loading.
+
+Target lists are read as a stream rather than loaded into a list, so a
+run over a million-row export starts fetching on the first row and its
+memory does not grow with the file. Supported formats, chosen by file
+extension:
+
+  - .jsonl / .ndjson  one {"company": ..., "domain": ..., ...} object per line
+  - anything else     CSV with company, domain, careers_url, news_url columns
+  - either + .gz      gzip-compressed
+
+Domains are normalized as they are read ("https://www.Acme.com/" ->
+"acme.com"); rows without a valid domain are skipped, as are repeats of
+a domain already read. Repeats are caught with a set of 64-bit domain
+hashes instead of the domains themselves.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import hashlib
+import io
+import json
+import re
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# A hostname with at least two labels and an alphabetic top-level label
+_DOMAIN_RE = re.compile(
+    r"^(?=.{4,253}$)([a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z][a-z0-9-]{0,62}$"
+)
+
+
+def normalize_domain(value: str) -> str | None:
+    """
+    The bare hostname of a domain or URL, or None if it isn't one.
+
+    Lower-cases, drops any scheme, path, port and leading "www.", and
+    converts internationalized names to their ASCII (punycode) form.
+    """
+    value = (value or "").strip().lower()
+    if "//" not in value:
+        value = "//" + value
+    try:
+        host = urlsplit(value).hostname or ""
+        host = host.rstrip(".").removeprefix("www.").encode("idna").decode("ascii")
+    except (ValueError, UnicodeError):
+        return None
+    return host if _DOMAIN_RE.match(host) else None
+
+
+def _domain_key(domain: str) -> int:
+    return int.from_bytes(hashlib.blake2b(domain.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class TargetSource:
+    """
+    Re-iterable stream of target dicts from a CSV or JSONL file.
+
+    Each iteration reads the file again, so concurrent pipelines can
+    each stream it at their own pace. Counters describe the last pass
+    to finish.
+
+    Args:
+        path: Target file (CSV, or .jsonl / .ndjson; optionally .gz).
+        keep: Optional filter on the normalized domain (e.g. a shard's).
+
+    Usage:
+        for target in TargetSource("targets.csv.gz"):
+            ...
+    """
+
+    def __init__(self, path: str | Path, keep: Callable[[str], bool] | None = None):
+        self.path = Path(path)
+        self.keep = keep
+        suffixes = [s.lower() for s in self.path.suffixes]
+        self.compressed = suffixes[-1:] == [".gz"]
+        ext = suffixes[-2:-1] if self.compressed else suffixes[-1:]
+        self.jsonl = ext in ([".jsonl"], [".ndjson"])  # anything else is read as CSV
+        self.rows = 0
+        self.invalid = 0
+        self.duplicates = 0
+
+    def __iter__(self) -> Iterator[dict]:
+        seen: set[int] = set()
+        rows = invalid = duplicates = 0
+        for row in self._rows():
+            rows += 1
+            target = _target(row)
+            if target is None:
+                invalid += 1
+                continue
+            key = _domain_key(target["domain"])
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            if self.keep is None or self.keep(target["domain"]):
+                yield target
+        self.rows, self.invalid, self.duplicates = rows, invalid, duplicates
+
+    def summary(self) -> str:
+        """One-line description of the last pass, e.g. '1000 rows, 3 invalid, 12 duplicates'."""
+        return f"{self.rows} rows, {self.invalid} invalid, {self.duplicates} duplicates"
+
+    def _open(self) -> io.TextIOBase:
+        if self.compressed:
+            return gzip.open(self.path, "rt", encoding="utf-8", newline="")
+        return open(self.path, encoding="utf-8", newline="")
+
+    def _rows(self) -> Iterator[dict | None]:
+        with self._open() as f:
+            if not self.jsonl:
+                yield from csv.DictReader(f)
+                return
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    row = None
+                yield row if isinstance(row, dict) else None
+
+
+def _field(row: dict, key: str) -> str:
+    value = row.get(key)
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _target(row: dict | None) -> dict | None:
+    """A pipeline target from one input row, or None if it has no valid domain."""
+    domain = normalize_domain(_field(row, "domain")) if row else None
+    if domain is None:
+        return None
+    target = {
+        "company": _field(row, "company") or domain,
+        "domain": domain,
+        "careers_url": _field(row, "careers_url"),
+    }
+    # Optional news/blog URL for direct scraping
+    news_url = _field(row, "news_url")
+    if news_url:
+        target["news_url"] = news_url
+    return target
@@ -0,0 +1,60 @@
+from signalsdr.dedup import canonical_url, dedup_signals, source_authority
+from signalsdr.prospector import ProspectSignal
+
+SNIPPET = ("Ford Motor Co. said Tuesday it will recall about 90,000 F-150 pickups "
+           "because of a faulty rear axle bolt that could detach.")
+
+
+def test_canonical_url_and_authority() -> None:
+    assert canonical_url("http://WWW.Example.com/a/b/amp/?utm_source=x&b=2&a=1#top") == \
+        "https://example.com/a/b?a=1&b=2"
+    assert canonical_url("https://m.example.com/a/") == canonical_url("https://example.com/a")
+    assert source_authority("https://news.yahoo.com/x") < source_authority("https://www.reuters.com/x")
+    assert source_authority("https://media.ford.com/x", "ford.com") > \
+        source_authority("https://www.reuters.com/x", "ford.com")
+
+
+def test_syndicated_story_keeps_most_authoritative_source() -> None:
+    signals = [
+        ProspectSignal("service_challenge", "Ford recalls 90,000 F-150 pickups over axle bolt | Yahoo Finance",
+                       SNIPPET, "https://finance.yahoo.com/news/ford-recall"),
+        ProspectSignal("ev_transition", "Ford expands battery plant in Kentucky",
+                       "Ford will invest $2B in a battery plant to support EV production.",
+                       "https://apnews.com/a"),
+        ProspectSignal("regulatory", "Ford recalls 90,000 F-150 pickups over axle bolt - Reuters",
+                       SNIPPET, "https://www.reuters.com/business/ford-recall?utm_source=feed"),
+        # Different lines of one news page share a URL but are distinct stories
+        ProspectSignal("new_model", "Ford unveils all-new Ranger",
+                       "The all-new Ranger debuts with a hybrid option.", "https://ford.com/news"),
+        ProspectSignal("ev_transition", "Ford expands EV charging network",
+                       "Ford charging network", "https://ford.com/news"),
+    ]
+
+    kept = dedup_signals(signals, "ford.com")
+
+    assert [s.source_url for s in kept] == [
+        "https://www.reuters.com/business/ford-recall?utm_source=feed",
+        "https://apnews.com/a",
+        "https://ford.com/news",
+        "https://ford.com/news",
+    ]
+
+
+def test_distinct_headlines_from_one_news_page_all_survive() -> None:
+    page = "https://media.ford.com/content/fordmedia/fna/us/en/news.html"
+    headlines = [
+        ("new_model", "Ford unveils all-new Ranger", "The Ranger debuts with a hybrid option."),
+        ("ev_transition", "Ford expands EV charging network",
+         "Owners get access to 100,000 more chargers."),
+        ("regulatory", "Ford recalls Explorer SUVs", "A seat belt anchor may not be secured."),
+        ("leadership", "Ford names new head of service", "Jane Doe joins from Stellantis."),
+        ("service_challenge", "Ford dealers face technician shortage",
+         "Repair wait times have doubled this year."),
+        ("ev_transition", "Ford to build batteries in Michigan",
+         "The Marshall plant will make LFP cells."),
+    ]
+    signals = [ProspectSignal(c, h, s, page) for c, h, s in headlines]
+
+    kept = dedup_signals(signals, "ford.com")
+
+    assert [s.headline for s in kept] == [h for _, h, _ in headlines]
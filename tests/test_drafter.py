@@ -0,0 +1,244 @@
+import asyncio
+
+import signalsdr.drafter as drafter
+from signalsdr.drafter import DraftPool, EmailDraft
+
+
+def _fake_generate_draft(limit_hits: int, peak: list[int]):
+    in_flight = 0
+    calls = 0
+
+    async def fake(company: str, role: str, model: str = "openai/gpt-4o", **kwargs) -> EmailDraft:
+        nonlocal in_flight, calls
+        calls += 1
+        rate_limited = calls <= limit_hits
+        in_flight += 1
+        peak[0] = max(peak[0], in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return EmailDraft(company, role, None if rate_limited else "S", None if rate_limited else "B",
+                          model, success=not rate_limited, rate_limited=rate_limited)
+
+    return fake
+
+
+async def test_pool_bounds_concurrency_and_keeps_order(monkeypatch) -> None:
+    peak = [0]
+    monkeypatch.setattr(drafter, "generate_draft", _fake_generate_draft(0, peak))
+    pool = DraftPool(limits={"default": 3})
+
+    tasks = [pool.submit(company="A", role=f"r{i}", model="openai/gpt-4o") for i in range(10)]
+    drafts = [await t for t in tasks]
+
+    assert [d.role for d in drafts] == [f"r{i}" for i in range(10)]
+    assert peak[0] == 3
+
+
+async def test_pool_backs_off_and_retries_on_429(monkeypatch) -> None:
+    peak = [0]
+    monkeypatch.setattr(drafter, "generate_draft", _fake_generate_draft(2, peak))
+    pool = DraftPool(limits={"openai": 4}, backoff=0.001)
+
+    drafts = await asyncio.gather(*(pool.draft(company="A", role=f"r{i}") for i in range(4)))
+
+    assert all(d.is_valid for d in drafts)
+    assert pool.retries == 2
+    assert pool._limit_for("openai/gpt-4o").limit < 4
+
+
+async def test_generate_draft_is_served_from_cache(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    from signalsdr.draftcache import DraftCache
+
+    calls = 0
+
+    async def fake_acompletion(**kwargs):
+        nonlocal calls
+        calls += 1
+        content = '{"subject_line": "Hi", "body": "Body"}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(drafter, "acompletion", fake_acompletion)
+    cache = DraftCache(tmp_path / "drafts.sqlite3", max_entries=1)
+
+    first = await drafter.generate_draft("A", "VP Sales", cache=cache)
+    second = await drafter.generate_draft("A", "VP Sales", cache=cache)
+    assert calls == 1
+    assert (second.subject_line, second.body, second.cached) == ("Hi", "Body", True)
+    assert not first.cached
+
+    # A different temperature is a different prompt; the LRU bound keeps one entry
+    await drafter.generate_draft("A", "VP Sales", temperature=0.2, cache=cache)
+    assert calls == 2
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_malformed_reply_is_an_error_and_not_cached(monkeypatch, tmp_path) -> None:
+    from types import SimpleNamespace
+
+    from signalsdr.draftcache import DraftCache
+
+    replies = iter(['{"subject_line": "Hi"}', '{"subject_line": "Hi", "body": "Body"}'])
+
+    async def fake_acompletion(**kwargs):
+        content = next(replies)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(drafter, "acompletion", fake_acompletion)
+    cache = DraftCache(tmp_path / "drafts.sqlite3")
+
+    partial = await drafter.generate_draft("A", "VP Sales", cache=cache)
+    assert not partial.success and "body" in partial.error
+    assert len(cache) == 0
+
+    # The next run asks again instead of replaying a rejection
+    retried = await drafter.generate_draft("A", "VP Sales", cache=cache)
+    assert retried.is_valid and not retried.cached and len(cache) == 1
+
+
+async def test_triage_keeps_listed_ids_and_fails_open(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from signalsdr.drafter import TriageItem, triage_signals
+
+    replies = iter(['```json\n{"keep": [0, 2]}\n```', "not json"])
+
+    async def fake_acompletion(**kwargs):
+        content = next(replies)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(drafter, "acompletion", fake_acompletion)
+    items = [TriageItem("A", text) for text in ("VP Sales", "Board of Directors", "CISO", "Director")]
+
+    assert await triage_signals(items, batch_size=3) == [True, False, True, True]
+
+
+async def test_drafts_batch_validates_items_and_falls_back(monkeypatch) -> None:
+    import json
+    from types import SimpleNamespace
+
+    from signalsdr.drafter import BATCH_SYSTEM_PROMPT, DraftRequest, generate_drafts_batch
+
+    requests_seen = []
+
+    async def fake_acompletion(**kwargs):
+        system = kwargs["messages"][0]["content"]
+        requests_seen.append(system)
+        if system == BATCH_SYSTEM_PROMPT:
+            # Item 1 comes back malformed; item 2 is a rejected signal
+            content = json.dumps([
+                {"id": 0, "subject_line": "S0", "body": "B0"},
+                {"id": 1, "subject_line": 7},
+                {"id": 2, "subject_line": None, "body": None},
+            ])
+        else:
+            content = '{"subject_line": "single", "body": "B"}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(drafter, "acompletion", fake_acompletion)
+    reqs = [DraftRequest(role=r) for r in ("VP Sales", "CISO", "Board of Directors")]
+
+    drafts = await generate_drafts_batch("A", reqs)
+
+    assert [d.subject_line for d in drafts] == ["S0", "single", None]
+    assert [d.role for d in drafts] == ["VP Sales", "CISO", "Board of Directors"]
+    assert drafts[2].success and not drafts[2].is_valid
+    assert len(requests_seen) == 2  # one batch request + one single fallback
+
+
+async def test_batch_fallbacks_stay_within_the_pool_limit(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from signalsdr.drafter import BATCH_SYSTEM_PROMPT, DraftRequest
+
+    in_flight = peak = singles = 0
+
+    async def fake_acompletion(**kwargs):
+        nonlocal in_flight, peak, singles
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if kwargs["messages"][0]["content"] == BATCH_SYSTEM_PROMPT:
+            content = "[]"  # every item missing, so all of them fall back
+        else:
+            singles += 1
+            content = '{"subject_line": "single", "body": "B"}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(drafter, "acompletion", fake_acompletion)
+    pool = DraftPool(limits={"default": 2})
+    reqs = [DraftRequest(role=f"r{i}") for i in range(6)]
+
+    drafts = await pool.draft_batch("A", reqs)
+
+    assert [d.subject_line for d in drafts] == ["single"] * 6
+    assert singles == 6
+    assert peak == 2
+
+
+async def test_batch_and_fallback_retries_do_not_multiply(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from signalsdr.drafter import BATCH_SYSTEM_PROMPT, DraftRequest
+
+    class Throttled(Exception):
+        status_code = 429
+
+    calls = 0
+
+    async def fake_acompletion(**kwargs):
+        nonlocal calls
+        calls += 1
+        if kwargs["messages"][0]["content"] == BATCH_SYSTEM_PROMPT:
+            content = "[]"  # every item falls back to a single draft...
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+        raise Throttled()
+
+    monkeypatch.setattr(drafter, "acompletion", fake_acompletion)
+    pool = DraftPool(limits={"default": 4}, max_retries=2, backoff=0.001)
+    reqs = [DraftRequest(role=f"r{i}") for i in range(3)]
+
+    drafts = await pool.draft_batch("A", reqs)
+
+    # ...which is rate-limited: one batch request plus one try per item, per attempt
+    assert all(d.rate_limited for d in drafts)
+    assert calls == (pool.max_retries + 1) * (1 + len(reqs))
+    assert pool.retries == pool.max_retries
+
+
+async def test_system_prefix_is_marked_cacheable_only_above_the_minimum(monkeypatch) -> None:
+    from types import SimpleNamespace
+
+    from signalsdr.config import PROMPT_CACHE_MIN_TOKENS
+    from signalsdr.drafter import TokenUsage, generate_draft
+
+    seen = []
+
+    async def fake_acompletion(**kwargs):
+        seen.append(kwargs["messages"])
+        usage = SimpleNamespace(prompt_tokens=900, completion_tokens=80,
+                                prompt_tokens_details=SimpleNamespace(cached_tokens=800))
+        content = '{"subject_line": "Hi", "body": "Body"}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+                               usage=usage)
+
+    monkeypatch.setattr(drafter, "acompletion", fake_acompletion)
+    usage = TokenUsage()
+
+    await generate_draft("A", "VP Sales", model="anthropic/claude-sonnet-4-5", usage=usage)
+    await generate_draft("B", "CISO", model="openai/gpt-4o", usage=usage)
+    long_prompt = "Rules. " * PROMPT_CACHE_MIN_TOKENS
+    await generate_draft("C", "CTO", model="anthropic/claude-sonnet-4-5",
+                         system_prompt=long_prompt, usage=usage)
+
+    anthropic_system, openai_system = seen[0][0]["content"], seen[1][0]["content"]
+    # The built-in prompts are below the cache minimum, so nothing is marked
+    assert anthropic_system == openai_system
+    assert seen[2][0]["content"] == [
+        {"type": "text", "text": long_prompt, "cache_control": {"type": "ephemeral"}}
+    ]
+    assert "A is hiring for VP Sales" in seen[0][1]["content"]
+    assert (usage.requests, usage.prompt_tokens, usage.cached_tokens) == (3, 2700, 2400)
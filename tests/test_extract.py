@@ -0,0 +1,57 @@
+from signalsdr.analyzer import analyze_lines, analyze_text
+from signalsdr.extract import extract_text, iter_text_lines
+
+CAREERS_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>  Careers at Acme Motors  </title>
+  <style>.job { color: red; }</style>
+  <script type="application/ld+json">{"@type": "JobPosting", "title": "VP of Fake"}</script>
+</head>
+<body>
+  <header><a href="/">Acme</a> <nav><a href="/jobs">Director of Navigation</a></nav></header>
+  <!-- Open roles rendered server-side -->
+  <main>
+    <h1>Open Positions</h1>
+    <p>Join our team &amp; build the future of mobility.&nbsp;</p>
+    <ul class="jobs">
+      <li><a href="/j/1">VP of Service Information</a> <span>Dearborn, MI</span></li>
+      <li><a href="/j/2">Head of <b>AI</b> Platform</a><br>Remote</li>
+      <li><a href="/j/3">Junior Technical Writer</a></li>
+      <li>Chief Information Security Officer (CISO)
+          &mdash; Detroit</li>
+    </ul>
+    <noscript><p>Enable JavaScript to see Director roles</p></noscript>
+    <iframe src="/widget">Security widget</iframe>
+    <table><tr><td>Machine Learning Engineer</td><td>Full-time</td></tr></table>
+  </main>
+  <footer>Director of Footer Links &copy; 2026</footer>
+  <script>window.jobs = ["Director"];</script>
+</body>
+</html>
+"""
+
+
+def test_lxml_backend_matches_bs4_output() -> None:
+    bs4_title, bs4_text = extract_text(CAREERS_PAGE, backend="bs4")
+    lxml_title, lxml_text = extract_text(CAREERS_PAGE, backend="lxml")
+
+    assert lxml_title == bs4_title == "Careers at Acme Motors"
+    assert lxml_text == bs4_text
+    assert "Director of Navigation" not in lxml_text
+    assert "VP of Fake" not in lxml_text
+
+
+def test_streamed_lines_feed_analyzer_incrementally() -> None:
+    _, text = extract_text(CAREERS_PAGE, backend="bs4")
+    chunks = [CAREERS_PAGE[i:i + 7] for i in range(0, len(CAREERS_PAGE), 7)]
+
+    assert list(iter_text_lines(chunks)) == text.splitlines()
+
+    streamed = analyze_lines(iter_text_lines(chunks), "u", "Acme")
+    expected = analyze_text(text, "u", "Acme")
+    assert streamed.signals == expected.signals
+    assert {s.keyword for s in streamed.signals} == {
+        "VP", "Head of", "AI", "Chief", "CISO", "Security", "Machine Learning",
+    }
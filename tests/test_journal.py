@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from signalsdr.journal import RunJournal
+
+
+def test_only_the_newest_unfinished_run_resumes_and_torn_lines_are_skipped(tmp_path: Path) -> None:
+    first = RunJournal.start(tmp_path)
+    first.finish()
+    first.close()
+    assert RunJournal.latest_unfinished(tmp_path) is None
+
+    second = RunJournal.start(tmp_path)
+    second.record("analyzed", kind="prospect", domain="a.com", payload={"company": "A"})
+    second.close()
+    # Killed halfway through writing a record
+    with open(second.path, "a", encoding="utf-8") as f:
+        f.write('{"event": "drafted", "kind": "pros')
+
+    resumed = RunJournal.latest_unfinished(tmp_path)
+    assert resumed.path == second.path
+    entry = resumed.resumable("prospect")["a.com"]
+    assert entry.payload == {"company": "A"} and entry.drafts is None
+    resumed.record("written", kind="prospect", domain="a.com")
+    resumed.close()
+
+    assert RunJournal(second.path).resumable("prospect")["a.com"].written
@@ -0,0 +1,21 @@
+from signalsdr.analyzer import analyze_text
+from signalsdr.matcher import KeywordClassifier, KeywordMatcher
+
+
+def test_matches_reports_overlapping_keywords_in_list_order() -> None:
+    matcher = KeywordMatcher(["Head of", "Security", "Head of Security"])
+    assert matcher.matches("Head of Security, EMEA") == ["Head of", "Security", "Head of Security"]
+    assert matcher.matches("Securityguard") == []
+
+
+def test_analyze_text_respects_word_boundaries_and_exclusions() -> None:
+    text = "VP of Sales\nSocial Security benefits\nAIrline ops\nHead of AI\nJunior Director"
+    signals = [(s.keyword, s.line_number) for s in analyze_text(text, "u", "c").signals]
+    assert signals == [("VP", 1), ("Head of", 4), ("AI", 4)]
+
+
+def test_classifier_picks_first_table_keyword_per_line() -> None:
+    classifier = KeywordClassifier({"generative AI": "ai", "AI platform": "platform", "recall": "service"})
+    lines = ["Our new AI Platform ships", "nothing here", "Generative AI platform and a RECALL"]
+    assert classifier.matcher.hit_lines(lines) == [0, 2]
+    assert classifier.classify_lines(lines) == [(0, "platform"), (2, "ai")]
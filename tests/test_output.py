@@ -0,0 +1,82 @@
+import csv
+from pathlib import Path
+
+from signalsdr.drafter import EmailDraft
+from signalsdr.output import OutputSink, merge_draft_files
+
+
+def _draft(company: str, role: str) -> EmailDraft:
+    return EmailDraft(company, role, f"About {role}", "Body", "openai/gpt-4o", success=True)
+
+
+async def test_sink_buffers_and_defers_until_written(tmp_path: Path) -> None:
+    csv_path, md_path = tmp_path / "drafts.csv", tmp_path / "drafts.md"
+    committed = []
+
+    async with OutputSink(csv_path, md_path, flush_every=3) as sink:
+        await sink.add(_draft("A", "VP Sales"), "https://a.com/jobs")
+        await sink.add(_draft("A", "CISO"), "https://a.com/jobs")
+        sink.defer(committed.append, "a.com")
+        assert not csv_path.exists() and committed == []
+
+        await sink.add(_draft("B", "CTO"), "https://b.com/jobs")  # third draft triggers a flush
+        assert committed == ["a.com"]
+        await sink.add(_draft("C", "CIO"), "https://c.com/jobs")
+        sink.defer(committed.append, "c.com")
+
+    assert committed == ["a.com", "c.com"]
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["role_detected"] for r in rows] == ["VP Sales", "CISO", "CTO", "CIO"]
+    md = md_path.read_text(encoding="utf-8")
+    assert md.startswith("# SignalSDR Drafts") and md.count("## ") == 4
+
+
+async def test_later_runs_append_to_existing_files(tmp_path: Path) -> None:
+    csv_path, md_path = tmp_path / "drafts.csv", tmp_path / "drafts.md"
+    for company in ("A", "B"):
+        async with OutputSink(csv_path, md_path, flush_every=1) as sink:
+            await sink.add(_draft(company, "CTO"), "u")
+            await sink.add(_draft(company, "CIO"), "u")
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["company"], r["role_detected"]) for r in rows] == [
+        ("A", "CTO"), ("A", "CIO"), ("B", "CTO"), ("B", "CIO")
+    ]
+    md = md_path.read_text(encoding="utf-8")
+    assert md.count("# SignalSDR Drafts") == 1 and md.count("## ") == 4
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+async def test_sink_groups_slack_messages_per_company(tmp_path: Path) -> None:
+    sink = OutputSink(tmp_path / "d.csv", tmp_path / "d.md",
+                      webhook_url="https://hooks.example/x", slack_batch_size=2)
+    for company, role in [("A", "VP"), ("A", "CISO"), ("A", "CTO"), ("B", "CIO")]:
+        await sink.add(_draft(company, role), "u")
+    sink._queue_slack()
+
+    messages = [sink._slack_queue.get_nowait() for _ in range(sink._slack_queue.qsize())]
+    assert len(messages) == 3
+    assert messages[0].startswith("Signals Detected: A — 2 drafts")
+    assert messages[1].startswith("Signal Detected: A is hiring a CTO")
+    assert messages[2].startswith("Signal Detected: B is hiring a CIO")
+
+
+async def test_merge_draft_files_appends_shard_outputs(tmp_path: Path) -> None:
+    parts = []
+    for i, company in enumerate(["A", "B"]):
+        part = (tmp_path / f"d{i}.csv", tmp_path / f"d{i}.md")
+        async with OutputSink(*part) as sink:
+            await sink.add(_draft(company, "CTO"), "u")
+        parts.append(part)
+    csv_path, md_path = tmp_path / "drafts.csv", tmp_path / "drafts.md"
+
+    counts = merge_draft_files([c for c, _ in parts] + [tmp_path / "missing.csv"],
+                               [m for _, m in parts], csv_path, md_path)
+
+    assert counts == {"hiring": 2}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        assert [r["company"] for r in csv.DictReader(f)] == ["A", "B"]
+    md = md_path.read_text(encoding="utf-8")
+    assert md.count("# SignalSDR Drafts") == 1 and md.count("## ") == 2
@@ -0,0 +1,34 @@
+from signalsdr.parsepool import ParsePool, parse_careers_page, parse_news_page
+from signalsdr.scraper import RawPage, parse_raw_page
+
+_CAREERS = """<html><head><title>Careers</title><script>var x = "VP of Sales";</script></head>
+<body><nav>Home</nav><ul><li>VP of Sales, Détroit</li><li>Junior Analyst</li>
+<li>Director, Service Information</li></ul></body></html>"""
+
+_NEWS = """<html><body><h2>Acme unveils its first all-electric pickup for fleet customers</h2>
+<p>Contact us</p></body></html>"""
+
+
+async def test_workers_return_what_inline_parsing_does() -> None:
+    page = RawPage("https://acme.com/careers", _CAREERS.encode("latin-1"), "latin-1", use_cache=True)
+    news = RawPage("https://acme.com/news", _NEWS.encode(), None)
+
+    with ParsePool(0) as inline, ParsePool(1) as pooled:
+        expected, expected_analysis = await inline.run(parse_careers_page, page, "Acme", None)
+        result, analysis = await pooled.run(parse_careers_page, page, "Acme", None)
+        news_result = await pooled.run(parse_news_page, news, "Acme", "acme.com")
+
+    assert result.title == "Careers" and "Détroit" in result.text
+    assert result.text == expected.text and analysis == expected_analysis
+    assert result.cache_entry.text_hash == expected.cache_entry.text_hash
+    assert [s.keyword for s in analysis.signals] == ["VP", "Director"]
+    assert [s.category for s in news_result.signals] == ["new_model"]
+
+
+async def test_unchanged_page_is_not_analyzed() -> None:
+    page = RawPage("https://acme.com/careers", _CAREERS.encode(), "utf-8", use_cache=True)
+    page.cached_hash = parse_raw_page(page).cache_entry.text_hash
+
+    result, analysis = await ParsePool(0).run(parse_careers_page, page, "Acme", None)
+
+    assert result.unchanged and analysis is None
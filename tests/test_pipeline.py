@@ -0,0 +1,260 @@
+import asyncio
+import time
+from pathlib import Path
+
+import signalsdr.pipeline as pipeline
+from signalsdr.drafter import DraftRequest, EmailDraft, TriageItem
+from signalsdr.output import OutputSink
+from signalsdr.pipeline import Candidate, prefetch, run_stages
+
+
+class _FakePool:
+    usage = None
+
+    def submit_batch(self, company: str, requests: list[DraftRequest], model: str) -> asyncio.Task:
+        async def run() -> list[EmailDraft]:
+            await asyncio.sleep(0.01)
+            return [EmailDraft(company, r.role, f"Re: {r.role}", "B", model, True)
+                    for r in requests]
+        return asyncio.create_task(run())
+
+
+def _source(kind: str, companies: list[str], committed: list[str]):
+    async def source(outbox: asyncio.Queue) -> dict:
+        stats = {"drafts": 0, "filtered": 0, "errors": 0}
+        await asyncio.sleep(0.2)  # fetch + analyze
+        for company in companies:
+            roles = [f"{company} keep", f"{company} drop"]
+            candidate = Candidate(
+                kind=kind,
+                company=company,
+                domain=f"{company}.example",
+                items=[TriageItem(company, role) for role in roles],
+                requests=[DraftRequest(role=role) for role in roles],
+                urls=[f"https://{company}.example"] * 2,
+                labels=roles,
+                rejected="irrelevant",
+                stats=stats,
+            )
+            candidate.commit(committed.append, company)
+            await outbox.put(candidate)
+        return stats
+    return source
+
+
+async def test_sources_run_concurrently_into_shared_stages(monkeypatch, tmp_path: Path) -> None:
+    triaged = []
+
+    async def fake_triage(items, model, kind, batch_size, usage):
+        triaged.append((kind, len(items)))
+        return ["drop" not in item.text for item in items]
+
+    monkeypatch.setattr(pipeline, "triage_signals", fake_triage)
+    committed: list[str] = []
+    start = time.monotonic()
+    async with OutputSink(tmp_path / "out.csv", tmp_path / "out.md") as sink:
+        hiring, prospect = await run_stages(
+            [_source("hiring", ["a", "b"], committed), _source("prospect", ["c"], committed)],
+            _FakePool(), sink, model="openai/gpt-4o",
+        )
+        assert committed == []  # deferred until the drafts are written
+
+    # The sources overlapped instead of running back to back
+    assert time.monotonic() - start < 0.35 + pipeline.TRIAGE_LINGER_SECONDS
+    # One triage request per kind for everything that had arrived
+    assert sorted(triaged) == [("hiring", 4), ("prospect", 2)]
+    assert hiring == {"drafts": 2, "filtered": 2, "errors": 0}
+    assert prospect == {"drafts": 1, "filtered": 1, "errors": 0}
+    assert sorted(committed) == ["a", "b", "c"]
+    assert sink.written == 3
+
+
+async def test_failed_drafts_leave_the_page_unmarked(monkeypatch, tmp_path: Path) -> None:
+    class FailingPool:
+        usage = None
+
+        def submit_batch(self, company, requests, model):
+            async def run() -> list[EmailDraft]:
+                return [EmailDraft(company, r.role, None, None, model, False, error="no key")
+                        for r in requests]
+            return asyncio.create_task(run())
+
+    async def keep_all(items, model, kind, batch_size, usage):
+        return [True] * len(items)
+
+    monkeypatch.setattr(pipeline, "triage_signals", keep_all)
+    scanned: list[str] = []
+    cached: list[str] = []
+
+    async def source(outbox: asyncio.Queue) -> dict:
+        stats = {"drafts": 0, "filtered": 0, "errors": 0}
+        candidate = Candidate("hiring", "a", "a.example", [TriageItem("a", "VP Sales")],
+                              [DraftRequest(role="VP Sales")], ["u"], ["VP"], "irrelevant", stats)
+        candidate.commit(scanned.append, "a")
+        candidate.commit_if_drafted(cached.append, "a")
+        await outbox.put(candidate)
+        return stats
+
+    async with OutputSink(tmp_path / "out.csv", tmp_path / "out.md") as sink:
+        (stats,) = await run_stages([source], FailingPool(), sink, model="m")
+
+    assert stats["errors"] == 1
+    assert scanned == ["a"]
+    assert cached == []  # the next run fetches and analyzes the page again
+
+
+async def test_signals_of_a_failed_draft_come_back_on_the_next_scan(monkeypatch, tmp_path: Path) -> None:
+    from main import hiring_candidate
+    from signalsdr.analyzer import analyze_text
+    from signalsdr.state import get_line_fingerprints
+
+    class FailingPool:
+        usage = None
+
+        def submit_batch(self, company, requests, model):
+            async def run() -> list[EmailDraft]:
+                return [EmailDraft(company, r.role, None, None, model, False,
+                                   error="AuthenticationError: no key") for r in requests]
+            return asyncio.create_task(run())
+
+    async def keep_all(items, model, kind, batch_size, usage):
+        return [True] * len(items)
+
+    monkeypatch.setattr(pipeline, "triage_signals", keep_all)
+    db = tmp_path / "state.sqlite3"
+    page = "Open roles\nVP of Sales, North America\nWarehouse Associate"
+
+    def scan() -> list:
+        seen = get_line_fingerprints("acme.com", db)
+        return analyze_text(page, "https://acme.com/careers", "Acme", seen_fingerprints=seen).signals
+
+    signals = scan()
+    assert signals
+    payload = {
+        "company": "Acme", "domain": "acme.com", "url": "https://acme.com/careers",
+        "signals": [{"keyword": s.keyword, "matched_text": s.matched_text} for s in signals],
+        "fingerprints": sorted(s.fingerprint for s in signals),
+        "cache_entry": None,
+    }
+    stats = {"scanned": 0, "signals": 0, "drafts": 0, "filtered": 0, "errors": 0}
+
+    async def source(outbox: asyncio.Queue) -> dict:
+        await outbox.put(hiring_candidate(payload, stats, db, None))
+        return stats
+
+    async with OutputSink(tmp_path / "out.csv", tmp_path / "out.md") as sink:
+        await run_stages([source], FailingPool(), sink, model="m")
+
+    assert stats["errors"] == len(signals)
+    assert [s.matched_text for s in scan()] == [s.matched_text for s in signals]
+
+
+async def test_prefetch_bounds_work_ahead_and_keeps_order() -> None:
+    started = []
+
+    async def start(i: int) -> int:
+        started.append(i)
+        await asyncio.sleep(0.01 * (5 - i))
+        return i * i
+
+    seen = []
+    async for item, result in prefetch(range(5), start, window=2):
+        seen.append((item, result))
+        assert len(started) <= item + 2
+
+    assert seen == [(i, i * i) for i in range(5)]
+
+
+async def test_replay_resumes_each_company_at_its_last_stage(monkeypatch, tmp_path: Path) -> None:
+    from signalsdr.journal import RunJournal
+    from signalsdr.pipeline import replay
+
+    async def fake_triage(items, model, kind, batch_size, usage):
+        assert all(item.company == "a" for item in items)  # b was drafted before
+        return ["drop" not in item.text for item in items]
+
+    monkeypatch.setattr(pipeline, "triage_signals", fake_triage)
+    journal = RunJournal(tmp_path / "run.jsonl")
+    for domain in ("a", "b", "c"):
+        journal.record("analyzed", kind="hiring", domain=domain, payload={"company": domain})
+    draft = EmailDraft("b", "b keep", "Re: b", "B", "m", True)
+    journal.record("drafted", kind="hiring", domain="b", kept=[True, False],
+                   drafts=[vars(draft)])
+    journal.record("analyzed", kind="hiring", domain="c", payload={"company": "c"})
+    journal.record("written", kind="hiring", domain="c")
+    journal.close()
+
+    committed: list[str] = []
+    resumed = RunJournal(tmp_path / "run.jsonl")
+    stats = {"scanned": 0, "signals": 0, "drafts": 0, "filtered": 0, "errors": 0}
+
+    def build(payload: dict) -> Candidate:
+        company = payload["company"]
+        roles = [f"{company} keep", f"{company} drop"]
+        candidate = Candidate("hiring", company, company, [TriageItem(company, r) for r in roles],
+                              [DraftRequest(role=r) for r in roles], ["u", "u"], roles, "irrelevant", stats)
+        candidate.commit(committed.append, company)
+        return candidate
+
+    async def source(outbox: asyncio.Queue) -> dict:
+        assert await replay(resumed, "hiring", build, outbox) == {"a", "b", "c"}
+        return stats
+
+    async with OutputSink(tmp_path / "out.csv", tmp_path / "out.md") as sink:
+        await run_stages([source], _FakePool(), sink, model="m", journal=resumed)
+    resumed.close()
+
+    # c was already written, state updates included: nothing is rerun
+    assert committed == ["a", "b"]
+    # a is triaged and drafted again; b reuses its journaled verdicts and draft
+    assert stats == {"scanned": 3, "signals": 6, "drafts": 2, "filtered": 2, "errors": 0}
+    assert set(RunJournal(tmp_path / "run.jsonl").resumable("hiring")) == {"a", "b", "c"}
+    assert all(e.written for e in RunJournal(tmp_path / "run.jsonl").resumable("hiring").values())
+
+
+async def test_resuming_a_written_company_keeps_its_signal_history(monkeypatch, tmp_path: Path) -> None:
+    from main import hiring_candidate
+    from signalsdr.journal import RunJournal
+    from signalsdr.pipeline import replay
+    from signalsdr.state import open_store
+
+    async def keep_all(items, model, kind, batch_size, usage):
+        return [True] * len(items)
+
+    monkeypatch.setattr(pipeline, "triage_signals", keep_all)
+    db = tmp_path / "state.sqlite3"
+    payload = {
+        "company": "Acme", "domain": "acme.com", "url": "https://acme.com/careers",
+        "signals": [{"keyword": "VP", "matched_text": "VP of Sales"}],
+        "fingerprints": ["f1"], "cache_entry": None,
+    }
+    stats = {"scanned": 0, "signals": 0, "drafts": 0, "filtered": 0, "errors": 0}
+    journal = RunJournal(tmp_path / "run.jsonl")
+
+    async def source(outbox: asyncio.Queue) -> dict:
+        journal.record("analyzed", kind="hiring", domain="acme.com", payload=payload)
+        await outbox.put(hiring_candidate(payload, stats, db, None))
+        return stats
+
+    async with OutputSink(tmp_path / "out.csv", tmp_path / "out.md") as sink:
+        await run_stages([source], _FakePool(), sink, model="m", journal=journal)
+    journal.close()
+
+    def signal_count() -> int:
+        return sum(len(c["signals"]) for c in open_store(db).companies())
+
+    assert signal_count() == 1
+
+    # The run is interrupted after the write and resumed
+    resumed = RunJournal(tmp_path / "run.jsonl")
+
+    async def resume(outbox: asyncio.Queue) -> dict:
+        assert await replay(resumed, "hiring",
+                            lambda p: hiring_candidate(p, stats, db, None), outbox) == {"acme.com"}
+        return stats
+
+    async with OutputSink(tmp_path / "out.csv", tmp_path / "out.md") as sink:
+        await run_stages([resume], _FakePool(), sink, model="m", journal=resumed)
+    resumed.close()
+
+    assert signal_count() == 1
@@ -0,0 +1,143 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from signalsdr import ratelimit
+from signalsdr.config import API_RATE_LIMITS
+from signalsdr.prospector import prospect_company_async, search_brave_async
+from signalsdr.searchcache import SearchCache, configure_search_cache, get_search_cache
+
+
+@pytest.fixture(autouse=True)
+def search_cache(tmp_path: Path):
+    cache = SearchCache(tmp_path / "search.sqlite3")
+    configure_search_cache(cache)
+    yield cache
+    configure_search_cache(None)
+    cache.close()
+
+
+async def test_prospect_company_async_uses_shared_client() -> None:
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.url.params["q"])
+        assert request.headers["X-Subscription-Token"] == "key"
+        return httpx.Response(200, json={"web": {"results": [
+            {"title": "Acme recalls 10k units", "description": "Recall news", "url": "https://news.example/a"},
+            {"title": "Acme blog", "description": "Own site", "url": "https://acme.com/blog"},
+        ]}})
+
+    ratelimit.configure("api:brave", 1000.0, 10)
+    try:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            result = await prospect_company_async(
+                "Acme", "acme.com", categories=["service_challenge", "regulatory"],
+                api_key="key", client=client,
+            )
+    finally:
+        ratelimit.configure("api:brave", *API_RATE_LIMITS["brave"])
+
+    assert result.success
+    assert list(result.timings) == ["service_challenge", "regulatory"]
+    assert len(queries) == 2 and all(q.startswith('"Acme"') for q in queries)
+    # Results from the company's own domain are dropped
+    assert [(s.category, s.source_url) for s in result.signals] == [
+        ("service_challenge", "https://news.example/a"),
+        ("regulatory", "https://news.example/a"),
+    ]
+
+
+def test_prospect_company_queries_categories_concurrently(monkeypatch) -> None:
+    import threading
+    import time
+
+    import signalsdr.prospector as prospector
+
+    active = peak = 0
+    lock = threading.Lock()
+
+    def fake_search(query: str, api_key: str, count: int = 5) -> list[dict]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return [{"title": query, "description": "", "url": "https://news.example/x"}]
+
+    monkeypatch.setattr(prospector, "search_brave", fake_search)
+    result = prospector.prospect_company("Acme", "acme.com", api_key="key")
+
+    assert peak > 1
+    # Merged in category order regardless of completion order
+    assert [s.category for s in result.signals] == list(prospector.PROSPECT_CATEGORIES)
+    assert set(result.timings) == set(prospector.PROSPECT_CATEGORIES)
+
+
+async def test_combined_query_mode_reclassifies_locally() -> None:
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append((request.url.params["q"], request.url.params["count"]))
+        return httpx.Response(200, json={"web": {"results": [
+            {"title": "Acme unveils all-new truck", "description": "", "url": "https://news.example/a"},
+            {"title": "Acme to adopt machine learning", "description": "", "url": "https://news.example/b"},
+            {"title": "Acme expands battery plant", "description": "", "url": "https://news.example/c"},
+            {"title": "Acme quarterly results", "description": "", "url": "https://news.example/d"},
+        ]}})
+
+    ratelimit.configure("api:brave", 1000.0, 10)
+    try:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            result = await prospect_company_async(
+                "Acme", "acme.com", api_key="key", client=client, mode="combined",
+            )
+    finally:
+        ratelimit.configure("api:brave", *API_RATE_LIMITS["brave"])
+
+    # Two grouped queries instead of one per category
+    assert len(queries) == 2
+    assert queries[0][0].startswith('"Acme" new model OR ') and "generative AI" in queries[0][0]
+    assert queries[0][1] == "15"
+    assert list(result.timings) == ["new_model+ev_transition+ai_adoption", "service_challenge+regulatory"]
+    assert [s.category for s in result.signals[:4]] == [
+        "new_model", "ai_adoption", "ev_transition", "new_model",
+    ]
+
+
+async def test_search_cache_coalesces_and_respects_freshness_ttl(search_cache: SearchCache) -> None:
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"web": {"results": [
+            {"title": "T", "description": "D", "url": "https://news.example/t"},
+        ]}})
+
+    ratelimit.configure("api:brave", 1000.0, 10)
+    try:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            # Five identical concurrent searches make one request
+            results = await asyncio.gather(*(
+                search_brave_async("acme recall", "key", client=client) for _ in range(5)
+            ))
+            assert calls == 1 and search_cache.coalesced == 4
+            assert all(r == results[0] for r in results)
+
+            # A rerun is a hit; a different count or freshness is a new search
+            await search_brave_async("acme recall", "key", client=client)
+            await search_brave_async("acme recall", "key", count=3, client=client)
+            assert calls == 2
+
+            search_cache.ttls["pw"] = 0
+            await search_brave_async("acme recall", "key", client=client)
+            assert calls == 3
+    finally:
+        ratelimit.configure("api:brave", *API_RATE_LIMITS["brave"])
+    assert get_search_cache() is search_cache
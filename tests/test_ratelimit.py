@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import signalsdr.ratelimit as ratelimit
+from signalsdr.ratelimit import TokenBucket, host_limiter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+def test_bucket_allows_burst_then_paces_at_rate(monkeypatch) -> None:
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    for _ in range(5):
+        bucket.acquire()
+    assert clock.sleeps == [0.5, 0.5]  # 3 banked, then one per 1/rate
+
+    clock.now += 10  # idle time refills only up to burst
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.sleeps == [0.5, 0.5, 0.5]
+
+
+async def test_async_waiters_queue_in_arrival_order(monkeypatch) -> None:
+    clock = _Clock()
+    waits: list[float] = []
+
+    async def record(seconds: float) -> None:
+        waits.append(seconds)  # the clock stands still: all arrive at once
+
+    monkeypatch.setattr(ratelimit, "asyncio", SimpleNamespace(sleep=record))
+    bucket = TokenBucket(rate=1, burst=1, clock=clock)
+
+    # Each waiter reserves its token on arrival and waits out its share
+    for _ in range(3):
+        await bucket.acquire_async()
+    assert waits == [1.0, 2.0]
+
+    monkeypatch.setattr(ratelimit, "asyncio", SimpleNamespace(sleep=clock.async_sleep))
+    clock.now += 3  # the deficit is paid off, the bucket refilled to burst
+    await bucket.acquire_async()
+    await bucket.acquire_async()
+    assert clock.sleeps == [1.0]
+
+
+def test_host_limiter_shares_one_bucket_per_host(monkeypatch) -> None:
+    monkeypatch.setattr(ratelimit, "_buckets", {})
+    assert host_limiter("https://Jobs.Acme.com/a") is host_limiter("https://jobs.acme.com/b")
+    assert host_limiter("jobs.acme.com") is host_limiter("https://jobs.acme.com/")
+    assert host_limiter("https://acme.com/") is not host_limiter("https://jobs.acme.com/")
+    assert host_limiter("https://acme.com/").rate == ratelimit.HOST_RATE_LIMIT[0]
+
+
+def test_configure_hosts_sets_the_rate_of_every_host(monkeypatch) -> None:
+    from signalsdr.shard import Shard
+
+    monkeypatch.setattr(ratelimit, "_buckets", {"api:brave": TokenBucket(1)})
+    monkeypatch.setattr(ratelimit, "_host_limit", ratelimit.HOST_RATE_LIMIT)
+    seen = host_limiter("https://boards.greenhouse.io/acme")
+
+    ratelimit.configure_hosts(*Shard(2, 4).host_limit())
+
+    rate = ratelimit.HOST_RATE_LIMIT[0] / 4
+    assert host_limiter("https://boards.greenhouse.io/acme") is not seen
+    assert host_limiter("https://boards.greenhouse.io/acme").rate == rate
+    assert host_limiter("https://jobs.lever.co/acme").rate == rate
+    assert "api:brave" in ratelimit._buckets
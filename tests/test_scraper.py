@@ -0,0 +1,136 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+
+import signalsdr.parsepool as parsepool
+import signalsdr.ratelimit as ratelimit
+import signalsdr.scraper as scraper
+from signalsdr.httpcache import HttpCache
+from signalsdr.parsepool import ParsePool
+from signalsdr.scraper import AsyncFetcher, fetch_page
+
+
+async def test_fetcher_caps_requests_in_flight(monkeypatch) -> None:
+    monkeypatch.setattr(ratelimit, "_buckets", {})
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, text="<p>ok</p>")
+
+    async with AsyncFetcher(max_concurrency=2, transport=httpx.MockTransport(handler)) as fetcher:
+        results = await asyncio.gather(*(fetcher.fetch(f"https://h{i}.test/") for i in range(6)))
+
+    assert all(r.success for r in results)
+    assert peak == 2
+
+
+async def test_requests_queued_for_a_slot_keep_their_host_spacing(monkeypatch) -> None:
+    monkeypatch.setattr(ratelimit, "_buckets", {})
+    ratelimit.configure("host:same.test", rate=20, burst=1)  # one request per 50 ms
+    sent: list[float] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "slow.test":
+            await asyncio.sleep(0.3)
+        else:
+            sent.append(time.monotonic())
+        return httpx.Response(200, text="<p>ok</p>")
+
+    async with AsyncFetcher(max_concurrency=1, transport=httpx.MockTransport(handler)) as fetcher:
+        slow = asyncio.create_task(fetcher.fetch("https://slow.test/"))
+        await asyncio.sleep(0.01)
+        # These wait behind the slow page; they must not all fire when it ends
+        await asyncio.gather(*(fetcher.fetch(f"https://same.test/{i}") for i in range(3)))
+        await slow
+
+    gaps = [b - a for a, b in zip(sent, sent[1:])]
+    assert len(sent) == 3 and min(gaps) >= 0.045
+
+
+def _fast_host(monkeypatch) -> None:
+    monkeypatch.setattr(ratelimit, "_buckets", {})
+    ratelimit.configure("host:acme.test", rate=1000, burst=10)
+
+
+_PAGE = "<html><head><title>Jobs</title></head><body><p>VP of Sales</p></body></html>"
+_VALIDATORS = {"ETag": '"v1"', "Last-Modified": "Wed, 14 Oct 2026 08:00:00 GMT"}
+
+
+async def test_async_conditional_get_stores_validators_and_serves_304(monkeypatch, tmp_path) -> None:
+    _fast_host(monkeypatch)
+    cache = HttpCache(tmp_path)
+    sent: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=_PAGE, headers=_VALIDATORS)
+
+    async with AsyncFetcher(cache=cache, transport=httpx.MockTransport(handler)) as fetcher:
+        first = await fetcher.fetch("https://acme.test/jobs")
+        assert (first.cache_entry.etag, first.cache_entry.last_modified) == tuple(_VALIDATORS.values())
+        assert not first.unchanged
+        cache.put(first.cache_entry)
+
+        second = await fetcher.fetch("https://acme.test/jobs")
+
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert sent[1]["If-Modified-Since"] == _VALIDATORS["Last-Modified"]
+    assert second.not_modified and second.unchanged
+    assert (second.title, second.text) == (first.title, first.text)
+
+
+def test_sync_conditional_get_stores_validators_and_serves_304(monkeypatch, tmp_path) -> None:
+    _fast_host(monkeypatch)
+    cache = HttpCache(tmp_path)
+    sent: list[dict] = []
+
+    def fake_get(url: str, headers: dict, timeout: float) -> SimpleNamespace:
+        sent.append(headers)
+        status = 304 if headers.get("If-Modified-Since") else 200
+        return SimpleNamespace(status_code=status, text=_PAGE, headers=_VALIDATORS,
+                               raise_for_status=lambda: None)
+
+    monkeypatch.setattr(scraper.requests, "get", fake_get)
+    first = fetch_page("https://acme.test/jobs", cache=cache)
+    cache.put(first.cache_entry)
+    second = fetch_page("https://acme.test/jobs", cache=cache)
+
+    assert first.cache_entry.etag == '"v1"' and "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert sent[1]["If-Modified-Since"] == _VALIDATORS["Last-Modified"]
+    assert second.not_modified and second.text == first.text
+
+
+async def test_unchanged_text_hash_skips_the_analyzer(monkeypatch, tmp_path) -> None:
+    _fast_host(monkeypatch)
+    cache = HttpCache(tmp_path)
+    # A server that ignores validators: same body, new ETag every time
+    etags = iter(['"a"', '"b"'])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=_PAGE, headers={"ETag": next(etags)})
+
+    async with AsyncFetcher(cache=cache, transport=httpx.MockTransport(handler)) as fetcher:
+        parser = ParsePool(0)
+        first, analysis = await parser.careers(fetcher, "https://acme.test/jobs", "Acme")
+        assert analysis.has_signals
+        cache.put(first.cache_entry)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged page was analyzed")
+
+        monkeypatch.setattr(parsepool, "analyze_text", fail)
+        second, analysis = await parser.careers(fetcher, "https://acme.test/jobs", "Acme")
+
+    assert second.unchanged and not second.not_modified and analysis is None
+    assert second.cache_entry.etag == '"b"'
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from signalsdr.shard import Shard
+from signalsdr.state import merge_state, open_store, record_scan, should_scan
+
+
+def test_shards_partition_targets_stably() -> None:
+    targets = [{"company": f"C{i}", "domain": f"c{i}.com"} for i in range(200)]
+    shards = [Shard.parse(f"{i}/4") for i in range(1, 5)]
+    slices = [[t for t in targets if s.contains(t["domain"])] for s in shards]
+
+    assert sorted(t["domain"] for part in slices for t in part) == sorted(t["domain"] for t in targets)
+    assert all(slices)
+    assert shards[0].contains("www.C0.com") == shards[0].contains("c0.com")
+    assert shards[1].path("data/state.sqlite3") == Path("data/state.shard2of4.sqlite3")
+
+
+def test_merge_state_seeds_shards_and_merges_them_back(tmp_path: Path) -> None:
+    shard = Shard(1, 2)
+    domains = [f"c{i}.com" for i in range(20)]
+    mine = next(d for d in domains if shard.contains(d))
+    other = next(d for d in domains if not shard.contains(d))
+    main_db = tmp_path / "state.sqlite3"
+    record_scan(mine, "Mine", [{"keyword": "VP", "matched_text": "VP Sales"}], main_db)
+    record_scan(other, "Other", [], main_db)
+
+    # Seeding brings over only the shard's own companies, cooldowns included
+    shard_db = shard.path(main_db)
+    merge_state([main_db], shard_db, keep=shard.contains)
+    assert [c["domain"] for c in open_store(shard_db).companies()] == [mine]
+    assert not should_scan(mine, shard_db)
+
+    record_scan(mine, "Mine", [{"category": "ev_transition", "headline": "H"}], shard_db,
+                scan_type="prospect")
+    assert merge_state([shard_db], main_db) == 1
+    assert merge_state([shard_db], main_db) == 0  # nothing new the second time
+
+    merged = {c["domain"]: c for c in open_store(main_db).companies()}
+    assert set(merged) == {mine, other}
+    assert len(merged[mine]["signals"]) == 2
+    assert not should_scan(mine, main_db, scan_type="prospect")
@@ -0,0 +1,112 @@
+from pathlib import Path
+
+from signalsdr.state import (
+    ScanStream,
+    get_line_fingerprints,
+    migrate_json_to_sqlite,
+    normalize_state_domains,
+    open_store,
+    plan_scans,
+    record_scan,
+    save_line_fingerprints,
+    should_scan,
+)
+
+
+def test_sqlite_and_json_backends_agree(tmp_path: Path) -> None:
+    json_db = tmp_path / "db.json"
+    sqlite_db = tmp_path / "state.sqlite3"
+
+    for db in (json_db, sqlite_db):
+        record_scan("a.com", "A", [{"keyword": "VP", "matched_text": "VP Sales"}], db)
+        record_scan("a.com", "A", [{"category": "ev_transition", "headline": "H"}], db,
+                    scan_type="prospect")
+        record_scan("b.com", "B", [], db)
+
+    json_rows = open_store(json_db).companies()
+    sqlite_rows = open_store(sqlite_db).companies()
+    for row in json_rows + sqlite_rows:
+        row.pop("last_scan", None)
+        row.pop("last_prospect_scan", None)
+    assert json_rows == sqlite_rows
+
+    assert not should_scan("a.com", sqlite_db)
+    assert not should_scan("a.com", sqlite_db, scan_type="prospect")
+    assert should_scan("b.com", sqlite_db, scan_type="prospect")
+    assert should_scan("c.com", sqlite_db)
+
+
+def test_migrate_json_to_sqlite(tmp_path: Path) -> None:
+    json_db = tmp_path / "db.json"
+    sqlite_db = tmp_path / "migrated.sqlite3"
+    record_scan("a.com", "A", [{"keyword": "CISO", "matched_text": "CISO"}], json_db)
+    record_scan("b.com", "B", [], json_db, scan_type="prospect")
+
+    assert migrate_json_to_sqlite(json_db, sqlite_db) == 2
+    # Re-running replaces rather than duplicates
+    assert migrate_json_to_sqlite(json_db, sqlite_db) == 2
+    assert open_store(sqlite_db).companies() == open_store(json_db).companies()
+
+
+def test_plan_scans_splits_due_and_skipped(tmp_path: Path) -> None:
+    db = tmp_path / "state.sqlite3"
+    record_scan("a.com", "A", [], db)
+    targets = [
+        {"company": "A", "domain": "a.com", "careers_url": "https://a.com/jobs"},
+        {"company": "B", "domain": "b.com", "careers_url": ""},
+        {"company": "C", "domain": "c.com", "careers_url": "https://c.com/jobs"},
+    ]
+
+    hiring = plan_scans(targets, scan_type="hiring", db_path=db)
+    assert [t["domain"] for t in hiring.due] == ["c.com"]
+    assert hiring.skip_counts() == {"scanned within 24h": 1, "no careers_url": 1}
+
+    prospect = plan_scans(targets, scan_type="prospect", db_path=db)
+    assert [t["domain"] for t in prospect.due] == ["a.com", "b.com", "c.com"]
+
+    # The streaming plan yields the same targets lazily and only counts the rest
+    stream = ScanStream(iter(targets), scan_type="hiring", db_path=db, exclude={"b.com"})
+    assert [t["domain"] for t in stream] == ["c.com"]
+    assert stream.summary() == "1 due, 1 skipped (1 scanned within 24h)"
+
+    # Prospecting without Brave needs a news_url; the rest are skipped, not due
+    news = [dict(t, news_url="https://c.com/news") if t["domain"] == "c.com" else t
+            for t in targets]
+    stream = ScanStream(news, scan_type="prospect", db_path=db, required="news_url")
+    assert [t["domain"] for t in stream] == ["c.com"]
+    assert stream.summary() == "1 due, 2 skipped (2 no news_url)"
+
+
+def test_line_fingerprints_suppress_repeated_job_lines(tmp_path: Path) -> None:
+    from signalsdr.analyzer import analyze_text
+
+    db = tmp_path / "state.sqlite3"
+    first = analyze_text("VP of Sales\nDirector, Service", "u", "A",
+                         seen_fingerprints=get_line_fingerprints("a.com", db))
+    assert [s.keyword for s in first.signals] == ["VP", "Director"]
+    record_scan("a.com", "A", [], db)
+    save_line_fingerprints("a.com", first.fingerprints, db)
+
+    second = analyze_text("vp of  sales\nHead of AI\nDirector, Service", "u", "A",
+                          seen_fingerprints=get_line_fingerprints("a.com", db))
+    assert [s.keyword for s in second.signals] == ["Head of", "AI"]
+    assert second.repeated == 2
+
+
+def test_old_domain_keys_are_normalized_and_merged(tmp_path: Path) -> None:
+    for db in (tmp_path / "db.json", tmp_path / "state.sqlite3"):
+        record_scan("www.Acme.com", "Acme", [{"keyword": "VP", "matched_text": "VP Sales"}], db)
+        save_line_fingerprints("www.Acme.com", {"f1"}, db)
+        record_scan("acme.com", "Acme", [{"category": "ev_transition", "headline": "H"}], db,
+                    scan_type="prospect")
+        record_scan("b.com", "B", [], db)
+
+        assert normalize_state_domains(db) == 1
+        assert normalize_state_domains(db) == 0
+
+        companies = {c["domain"]: c for c in open_store(db).companies()}
+        assert set(companies) == {"acme.com", "b.com"}
+        assert len(companies["acme.com"]["signals"]) == 2
+        assert not should_scan("acme.com", db)
+        assert not should_scan("acme.com", db, scan_type="prospect")
+        assert get_line_fingerprints("acme.com", db) == {"f1"}
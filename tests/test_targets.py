@@ -0,0 +1,42 @@
+import gzip
+import json
+from pathlib import Path
+
+from signalsdr.targets import TargetSource, normalize_domain
+
+
+def test_normalize_domain() -> None:
+    assert normalize_domain("https://www.Acme.com/careers?x=1") == "acme.com"
+    assert normalize_domain("acme.com:8080") == "acme.com"
+    assert normalize_domain("münchen.de") == "xn--mnchen-3ya.de"
+    assert [normalize_domain(v) for v in ("", "localhost", "not a domain", "1.2.3.4")] == [None] * 4
+
+
+def test_csv_gz_and_jsonl_stream_normalized_unique_targets(tmp_path: Path) -> None:
+    csv_path = tmp_path / "targets.csv.gz"
+    with gzip.open(csv_path, "wt", encoding="utf-8", newline="") as f:
+        f.write("company,domain,careers_url,news_url\n"
+                "Acme,https://www.acme.com/,https://acme.com/jobs,\n"
+                "Acme Dup,ACME.com,https://acme.com/other,\n"
+                "Broken,not a domain,,\n"
+                ",beta.io,,https://beta.io/news\n")
+    jsonl_path = tmp_path / "targets.jsonl"
+    jsonl_path.write_text("\n".join([
+        json.dumps({"company": "Acme", "domain": "acme.com", "careers_url": "https://acme.com/jobs"}),
+        "{torn",
+        json.dumps({"company": "Beta", "domain": "beta.io", "news_url": "https://beta.io/news"}),
+        json.dumps({"company": "Beta again", "domain": "www.beta.io"}),
+    ]), encoding="utf-8")
+
+    source = TargetSource(csv_path)
+    targets = list(source)
+    assert targets == [
+        {"company": "Acme", "domain": "acme.com", "careers_url": "https://acme.com/jobs"},
+        {"company": "beta.io", "domain": "beta.io", "careers_url": "", "news_url": "https://beta.io/news"},
+    ]
+    assert (source.rows, source.invalid, source.duplicates) == (4, 1, 1)
+    assert list(source) == targets  # every pass reads the file again
+
+    jsonl = TargetSource(jsonl_path, keep=lambda domain: domain != "acme.com")
+    assert [t["company"] for t in jsonl] == ["Beta"]
+    assert jsonl.summary() == "4 rows, 1 invalid, 1 duplicates"